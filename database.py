@@ -17,8 +17,10 @@ DB_FILE = str(get_db_path())
 def db_connect() -> sqlite3.Connection:
     db_path = get_db_path()
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path))
+    conn = sqlite3.connect(str(db_path), cached_statements=256)
     conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
     return conn
 
 
@@ -47,6 +49,7 @@ def _deduplicate_model_specs(cur: sqlite3.Cursor, conn: sqlite3.Connection) -> N
 def init_db() -> None:
     conn = db_connect()
     cur = conn.cursor()
+    cur.execute("PRAGMA journal_mode = WAL")
     cur.execute(
         """
         CREATE TABLE IF NOT EXISTS categories(
@@ -192,6 +195,20 @@ def rename_category(cat_id: int, new_name: str):
         conn.close()
 
 
+def _delete_ids(table: str, ids: Iterable[int]) -> None:
+    unique_ids = list(dict.fromkeys(int(value) for value in ids))
+    if not unique_ids:
+        return
+    conn = db_connect()
+    cur = conn.cursor()
+    for start in range(0, len(unique_ids), 500):
+        chunk = unique_ids[start : start + 500]
+        placeholders = ",".join(["?"] * len(chunk))
+        cur.execute(f"DELETE FROM {table} WHERE id IN ({placeholders})", tuple(chunk))
+    conn.commit()
+    conn.close()
+
+
 def delete_category(cat_id: int) -> None:
     conn = db_connect()
     cur = conn.cursor()
@@ -200,6 +217,12 @@ def delete_category(cat_id: int) -> None:
     conn.close()
 
 
+def delete_categories(ids: Iterable[int]) -> None:
+    """Delete several categories (and their cascaded children) in one transaction."""
+
+    _delete_ids("categories", ids)
+
+
 @overload
 def get_brands(category_id: int, include_created: Literal[False] = False) -> List[Tuple[int, str]]:
     ...
@@ -242,6 +265,22 @@ def add_brand(category_id: int, name: str) -> None:
     conn.close()
 
 
+def add_brands(category_id: int, names: Iterable[str]) -> None:
+    """Insert several brands for a category within a single transaction."""
+
+    payload = [(category_id, name.strip()) for name in names if name and name.strip()]
+    if not payload:
+        return
+    conn = db_connect()
+    cur = conn.cursor()
+    cur.executemany(
+        "INSERT OR IGNORE INTO brands(category_id, name) VALUES(?,?)",
+        payload,
+    )
+    conn.commit()
+    conn.close()
+
+
 def rename_brand(brand_id: int, new_name: str):
     new_name = new_name.strip()
     if not new_name:
@@ -267,6 +306,12 @@ def delete_brand(brand_id: int) -> None:
     conn.close()
 
 
+def delete_brands(ids: Iterable[int]) -> None:
+    """Delete several brands (and their cascaded children) in one transaction."""
+
+    _delete_ids("brands", ids)
+
+
 @overload
 def get_models(brand_id: int, include_created: Literal[False] = False) -> List[Tuple[int, str]]:
     ...
@@ -295,6 +340,29 @@ def get_models(brand_id: int, include_created: bool = False):
     return _trimmed_rows(rows)
 
 
+def get_catalog_tree() -> List[Tuple[object, ...]]:
+    """Return categories, brands and models with ``created_at`` as joined rows in one query.
+
+    Each row is ``(cat_id, cat_name, cat_created, brand_id, brand_name, brand_created,
+    model_id, model_name, model_created)``; rows are ordered by name at every level so
+    consecutive rows share their category/brand. Missing brands or models are ``None``.
+    """
+    conn = db_connect()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT c.id, c.name, c.created_at, b.id, b.name, b.created_at, m.id, m.name, m.created_at
+        FROM categories c
+        LEFT JOIN brands b ON b.category_id = c.id
+        LEFT JOIN models m ON m.brand_id = b.id
+        ORDER BY c.name, c.id, b.name, b.id, m.name, m.id
+        """
+    )
+    rows = cur.fetchall()
+    conn.close()
+    return rows
+
+
 def add_model(brand_id: int, name: str) -> None:
     name = name.strip()
     if not name:
@@ -309,6 +377,22 @@ def add_model(brand_id: int, name: str) -> None:
     conn.close()
 
 
+def add_models(brand_id: int, names: Iterable[str]) -> None:
+    """Insert several models for a brand within a single transaction."""
+
+    payload = [(brand_id, name.strip()) for name in names if name and name.strip()]
+    if not payload:
+        return
+    conn = db_connect()
+    cur = conn.cursor()
+    cur.executemany(
+        "INSERT OR IGNORE INTO models(brand_id, name) VALUES(?,?)",
+        payload,
+    )
+    conn.commit()
+    conn.close()
+
+
 def rename_model(model_id: int, new_name: str):
     new_name = new_name.strip()
     if not new_name:
@@ -334,6 +418,12 @@ def delete_model(model_id: int) -> None:
     conn.close()
 
 
+def delete_models(ids: Iterable[int]) -> None:
+    """Delete several models (and their cascaded children) in one transaction."""
+
+    _delete_ids("models", ids)
+
+
 # ---- Specs (key-value) -------------------------------------------------------------
 
 def get_specs(model_id: int) -> List[Tuple[int, str, Optional[str]]]:
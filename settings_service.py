@@ -13,25 +13,21 @@ from app_paths import get_config_path, get_default_export_dir
 
 logger = logging.getLogger(__name__)
 
+# Runs on every keystroke in the settings color entries.
+_HEX_COLOR_RE = re.compile(r"#?([0-9a-fA-F]{6}|[0-9a-fA-F]{3})")
+
+
 def normalize_hex_color(value: Any) -> str | None:
     if not isinstance(value, str):
         return None
 
-    raw = value.strip()
-    if not raw:
+    match = _HEX_COLOR_RE.fullmatch(value.strip())
+    if match is None:
         return None
 
-    if raw.startswith("#"):
-        raw = raw[1:]
-
+    raw = match.group(1)
     if len(raw) == 3:
         raw = "".join(ch * 2 for ch in raw)
-    elif len(raw) != 6:
-        return None
-
-    if not re.fullmatch(r"[0-9a-fA-F]{6}", raw):
-        return None
-
     return f"#{raw.upper()}"
 
 
@@ -6,6 +6,7 @@ import json
 import logging
 import os
 import re
+import tempfile
 from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
@@ -168,8 +169,20 @@ def _config_path(filename: str) -> Path:
 
 def _write_json_config(path: Path, data) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Write beside the target and swap it in, so an interrupted save never leaves a truncated config.
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
 
 
 def _backup_corrupt_config(path: Path) -> Optional[Path]:
@@ -1022,6 +1035,7 @@ def generate_export_rows(
     model_ids=None,
     languages=None,
     progress_callback=None,
+    limit=None,
 ):
     film_types = list(film_types)
     pairs = collect_models(category_ids=category_ids, brand_ids=brand_ids, model_ids=model_ids)
@@ -1375,6 +1389,8 @@ def generate_export_rows(
             progress_count += 1
             if progress_callback is not None:
                 progress_callback(progress_count, total_steps)
+            if limit is not None and len(rows) >= limit:
+                return rows, column_order
 
     return rows, column_order
 
@@ -1392,6 +1408,16 @@ def _row_to_values(record, columns):
     return ["" for _ in columns]
 
 
+def _iter_row_values(records, columns):
+    """Yield ``_row_to_values`` per record, passing full-width list rows through without a copy."""
+    width = len(columns)
+    for record in records:
+        if type(record) is list and len(record) == width:
+            yield record
+        else:
+            yield _row_to_values(record, columns)
+
+
 def _make_unique_column_keys(columns):
     counts = {}
     unique_keys = []
@@ -1438,8 +1464,7 @@ def export_products(records: list, columns: list, fmt: str, folder: str):
             sheet.append(columns)
             column_widths = [max(10, min(60, len(str(col) if col is not None else ""))) for col in columns]
 
-        for record in records:
-            row = _row_to_values(record, columns)
+        for row in _iter_row_values(records, columns):
             if column_widths:
                 for idx, value in enumerate(row):
                     length = len(str(value) if value is not None else "")
@@ -1539,9 +1564,7 @@ def export_products(records: list, columns: list, fmt: str, folder: str):
                 writer = csv.writer(f)
                 if columns:
                     writer.writerow(columns)
-                for record in records:
-                    row = _row_to_values(record, columns)
-                    writer.writerow(row)
+                writer.writerows(_iter_row_values(records, columns))
         except PermissionError as exc:
             message = (
                 "Не вдалося зберегти CSV-файл: доступ заборонено. Закрийте файл, якщо він відкритий, та спробуйте знову."
@@ -1554,9 +1577,8 @@ def export_products(records: list, columns: list, fmt: str, folder: str):
         out_products = base + ".json"
         json_records = []
         json_columns = _make_unique_column_keys(columns)
-        for record in records:
-            values = _row_to_values(record, columns)
-            json_records.append({key: value for key, value in zip(json_columns, values)})
+        for values in _iter_row_values(records, columns):
+            json_records.append(dict(zip(json_columns, values)))
         try:
             with open(out_products, "w", encoding="utf-8") as f:
                 json.dump(json_records, f, ensure_ascii=False, indent=2)
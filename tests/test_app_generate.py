@@ -213,6 +213,28 @@ def test_save_title_tags_records_defaults(monkeypatch, prepared_app):
     assert prepared_app._saved_templates[-1]["tags_template"] == "Custom tags"
 
 
+def test_save_title_tags_language_does_not_leak_into_shared_blocks(monkeypatch, prepared_app):
+    shared_title = {"default": "Base title", "languages": {}}
+    shared_tags = {"default": "Base tags", "languages": {}}
+    prepared_app.title_tags_templates = {
+        "default": {"title_template": shared_title, "tags_template": shared_tags},
+        "by_film": {"TypeA": {"title_template": shared_title, "tags_template": shared_tags}},
+        "by_category": {},
+    }
+    prepared_app._current_film_type_key = "TypeA"
+    prepared_app._current_template_language = "en"
+    prepared_app.title_box.text = "English title"
+    prepared_app.tags_box.text = "English tags"
+    monkeypatch.setattr(app_module, "show_info", lambda message: None)
+
+    prepared_app._save_title_tags()
+
+    saved = prepared_app._saved_title_tags[-1]
+    assert saved["by_film"]["TypeA"]["title_template"]["languages"] == {"en": "English title"}
+    assert saved["by_film"]["TypeA"]["tags_template"]["default"] == "Base tags"
+    assert saved["default"]["title_template"]["languages"] == {}
+
+
 def test_save_desc_template_saves_language_entry(monkeypatch, prepared_app):
     prepared_app._current_template_category = "Категорія"
     prepared_app._current_template_language = "en"
@@ -228,3 +250,294 @@ def test_save_desc_template_saves_language_entry(monkeypatch, prepared_app):
     descriptions = prepared_app._saved_templates[-1]["descriptions"]
     assert descriptions["Категорія"]["default"]["languages"]["en"] == "English description"
     assert messages == ["Шаблон опису збережено."]
+
+
+def test_save_desc_template_debounces_repeated_saves(monkeypatch, prepared_app):
+    scheduled = []
+    cancelled = []
+    prepared_app.after = lambda delay, callback: scheduled.append(callback) or f"job{len(scheduled)}"
+    prepared_app.after_cancel = cancelled.append
+    prepared_app._current_template_category = "Категорія"
+    prepared_app._current_template_language = "en"
+    prepared_app._current_film_type_key = "default"
+    messages = []
+    monkeypatch.setattr(app_module, "show_info", lambda message: messages.append(message))
+
+    prepared_app.desc_box.text = "First"
+    prepared_app._save_desc_template()
+    prepared_app.desc_box.text = "Second"
+    prepared_app._save_desc_template()
+
+    assert cancelled == ["job1"]
+    assert not messages
+    scheduled[-1]()
+    prepared_app._flush_config_saves()
+    prepared_app._process_ui_queue()
+
+    assert len(prepared_app._saved_templates) == 1
+    descriptions = prepared_app._saved_templates[-1]["descriptions"]
+    assert descriptions["Категорія"]["default"]["languages"]["en"] == "Second"
+    assert messages == ["Шаблон опису збережено."]
+
+
+def test_update_language_code_references_skips_unused_codes(prepared_app):
+    prepared_app.templates["descriptions"] = {
+        "Категорія": {"default": {"default": "", "languages": {"en": "English"}}}
+    }
+    prepared_app.title_tags_templates = {
+        "default": {"title_template": {"default": "", "languages": {"en": "Title"}}}
+    }
+
+    prepared_app._update_language_code_references("de", "fr")
+    assert not prepared_app._saved_templates
+    assert not prepared_app._saved_title_tags
+
+    prepared_app._update_language_code_references("en", "gb")
+    descriptions = prepared_app._saved_templates[-1]["descriptions"]
+    assert descriptions["Категорія"]["default"]["languages"] == {"gb": "English"}
+    assert prepared_app._saved_title_tags[-1]["default"]["title_template"]["languages"] == {"gb": "Title"}
+    assert "en" not in prepared_app._collect_referenced_language_codes()
+
+
+def test_export_template_validation_is_debounced(prepared_app):
+    class ModifiedTextBox(DummyTextBox):
+        def edit_modified(self, value=None):
+            return True if value is None else None
+
+    scheduled = []
+    cancelled = []
+    statuses = []
+    prepared_app.after = lambda delay, callback: scheduled.append(callback) or f"job{len(scheduled)}"
+    prepared_app.after_cancel = cancelled.append
+    prepared_app.export_field_template = ModifiedTextBox("{{ name }}")
+    prepared_app.export_template_status = types.SimpleNamespace(
+        configure=lambda **kwargs: statuses.append(kwargs["text"])
+    )
+
+    prepared_app._on_export_template_modified(None)
+    prepared_app._on_export_template_modified(None)
+
+    assert cancelled == ["job1"]
+    assert not statuses
+    scheduled[-1]()
+    assert len(statuses) == 1
+
+
+def test_queue_config_save_writes_latest_snapshot_in_background(prepared_app):
+    prepared_app.after = lambda *args, **kwargs: None
+
+    prepared_app.templates["title_template"] = "First"
+    prepared_app._queue_config_save("templates")
+    prepared_app.templates["title_template"] = "Second"
+    prepared_app._queue_config_save("templates", "title_tags")
+    prepared_app._flush_config_saves()
+
+    assert prepared_app._saved_templates[-1]["title_template"] == "Second"
+    assert prepared_app._saved_title_tags
+    assert prepared_app._config_save_thread is None
+
+
+def test_batched_config_saves_write_each_file_once(prepared_app):
+    with prepared_app._batched_config_saves():
+        prepared_app._queue_config_save("templates")
+        prepared_app._queue_config_save("templates", "title_tags")
+        prepared_app._queue_config_save("templates")
+        assert prepared_app._saved_templates == []
+
+    assert len(prepared_app._saved_templates) == 1
+    assert len(prepared_app._saved_title_tags) == 1
+
+
+def test_desc_editor_host_notifies_completion_callback():
+    host = app_module.DescriptionEditorHost({"uk": {"html": ""}}, "uk")
+    received = []
+    host.set_completion_callback(received.append)
+
+    assert host._accept_result({"docs": {"uk": {"html": "<p>Hi</p>"}}, "activeLang": "uk"})
+    assert received == [{"uk": {"html": "<p>Hi</p>"}}]
+
+
+def test_files_export_all_writes_config_snapshot(monkeypatch, prepared_app):
+    written = []
+    messages = []
+    statuses = []
+    prepared_app._save_title_tags = lambda show_message=True: None
+    prepared_app._files_set_status = statuses.append
+    monkeypatch.setattr(app_module.filedialog, "asksaveasfilename", lambda **kwargs: "backup.xlsx")
+    monkeypatch.setattr(app_module, "show_info", messages.append)
+
+    def fake_export(path, templates, title_tags, export_fields):
+        written.append((path, templates))
+
+    monkeypatch.setattr(app_module, "export_all_data_to_excel", fake_export)
+
+    prepared_app._files_export_all()
+
+    assert written and written[0][0] == "backup.xlsx"
+    assert written[0][1] == prepared_app.templates
+    assert written[0][1] is not prepared_app.templates
+    assert statuses[-1] == "Дані збережено у файл: backup.xlsx"
+    assert messages == ["Резервну копію успішно створено."]
+    assert prepared_app._files_export_running is False
+
+
+class FakeTreeview:
+    def __init__(self):
+        self.children = {"": []}
+        self.options = {}
+
+    def insert(self, parent, index, iid, text="", **kwargs):
+        self.children[parent].append(iid)
+        self.children[iid] = []
+        self.options[iid] = {"text": text, "open": False, "parent": parent}
+        return iid
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.delete(*self.children.pop(iid))
+            self.children[self.options.pop(iid)["parent"]].remove(iid)
+
+    def exists(self, iid):
+        return iid in self.options
+
+    def get_children(self, iid=""):
+        return tuple(self.children[iid])
+
+    def item(self, iid, option=None, **kwargs):
+        if option is not None:
+            return self.options[iid][option]
+        self.options[iid].update(kwargs)
+
+    def cget(self, option):
+        return ""
+
+    def configure(self, **kwargs):
+        return None
+
+
+def test_gen_tree_inserts_children_lazily_and_tracks_parent_states(monkeypatch, prepared_app):
+    monkeypatch.setattr(
+        app_module,
+        "get_catalog_tree",
+        lambda: [
+            (1, "Cat", None, 10, "Brand", None, 100, "M1", None),
+            (1, "Cat", None, 10, "Brand", None, 101, "M2", None),
+        ],
+    )
+    tree = FakeTreeview()
+    prepared_app._gen_tree = tree
+    prepared_app._gen_tree_states = {}
+    prepared_app._gen_tree_model_ids = {}
+    prepared_app._gen_tree_labels = {}
+    prepared_app._gen_tree_children = {}
+    prepared_app._gen_tree_parents = {}
+    prepared_app._gen_tree_child_counts = {}
+    prepared_app._gen_tree_rendered = set()
+    prepared_app._catalog_cache = {"cats": None, "brands": {}, "models": {}, "tree": None}
+    prepared_app._gen_tree_stubbed = set()
+    prepared_app._checked_model_ids = set()
+    prepared_app._gen_tree_open = set()
+
+    prepared_app._reload_gen_tree()
+
+    assert tree.get_children("cat_1") == ("brand_10",)
+    assert tree.get_children("brand_10") == ("brand_10:stub",)
+
+    prepared_app._set_gen_tree_state("model_100", 2)
+    prepared_app._update_parent_states("model_100")
+    assert prepared_app._gen_tree_states["brand_10"] == 1
+    assert prepared_app._gen_tree_states["cat_1"] == 1
+
+    prepared_app._set_gen_tree_state("model_101", 2)
+    prepared_app._update_parent_states("model_101")
+    assert prepared_app._gen_tree_states["cat_1"] == 2
+    assert tree.item("cat_1", "text").startswith("☑")
+
+    assert app_module.App._collect_checked_model_ids(prepared_app) == {100, 101}
+
+    prepared_app._expand_all_gen_tree()
+    assert tree.get_children("brand_10") == ("model_100", "model_101")
+    assert tree.item("model_101", "text").startswith("☑")
+
+
+def test_config_save_failure_reports_error_and_keeps_snapshot(monkeypatch, prepared_app):
+    prepared_app.after = lambda *args, **kwargs: None
+    errors = []
+    messages = []
+    monkeypatch.setattr(app_module, "show_error", errors.append)
+    monkeypatch.setattr(app_module, "show_info", messages.append)
+
+    def failing_save(data):
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr(app_module, "save_title_tags_templates", failing_save)
+
+    prepared_app._save_title_tags()
+    thread = prepared_app._config_save_thread
+    if thread is not None:
+        thread.join(5)
+    prepared_app._process_ui_queue()
+
+    assert not messages
+    assert errors and "read-only" in errors[0]
+    assert "title_tags" in prepared_app._pending_config_saves
+
+    saved = []
+    monkeypatch.setattr(app_module, "save_title_tags_templates", saved.append)
+    prepared_app._flush_config_saves()
+
+    assert saved
+    assert not prepared_app._pending_config_saves
+
+
+def test_desc_template_save_reports_failure_instead_of_success(monkeypatch, prepared_app):
+    prepared_app._current_template_category = "Категорія"
+    prepared_app._current_template_language = "en"
+    prepared_app._current_film_type_key = "default"
+    messages = []
+    errors = []
+    monkeypatch.setattr(app_module, "show_info", messages.append)
+    monkeypatch.setattr(app_module, "show_error", errors.append)
+
+    def failing_save(data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(app_module, "save_templates", failing_save)
+
+    prepared_app.desc_box.text = "Text"
+    prepared_app._save_desc_template()
+
+    assert not messages
+    assert errors and "disk full" in errors[0]
+
+
+def test_files_export_all_refuses_before_file_dialog_while_running(monkeypatch, prepared_app):
+    messages = []
+    prepared_app._files_export_running = True
+    monkeypatch.setattr(app_module, "show_info", messages.append)
+
+    def unexpected_dialog(**kwargs):
+        raise AssertionError("file dialog should not open")
+
+    monkeypatch.setattr(app_module.filedialog, "asksaveasfilename", unexpected_dialog)
+
+    prepared_app._files_export_all()
+
+    assert messages == ["Резервна копія ще зберігається. Дочекайтеся завершення."]
+
+
+def test_load_desc_template_reselecting_scope_discards_unsaved_edits(prepared_app):
+    class EditableTextBox(DummyTextBox):
+        def insert(self, index, text):
+            self.text = text
+
+    prepared_app.desc_box = EditableTextBox("")
+    prepared_app._current_desc_category = "Категорія"
+    prepared_app._resolve_desc_template_html = lambda category, film, language: "<p>Saved</p>"
+
+    prepared_app._load_desc_template()
+    assert prepared_app.desc_box.text == "<p>Saved</p>"
+
+    prepared_app.desc_box.text = "<p>Unsaved edit</p>"
+    prepared_app._load_desc_template()
+    assert prepared_app.desc_box.text == "<p>Saved</p>"
@@ -209,3 +209,61 @@ def test_load_specs_map_chunks_large_id_list():
 
     for idx, mid in enumerate(model_ids):
         assert specs_map[mid][f"Key-{idx}"] == f"Value-{idx}"
+
+
+def test_add_brands_and_models_bulk_insert_skips_duplicates():
+    database.init_db()
+    database.add_category("BulkCat")
+    cat_id = next(cid for cid, name in database.get_categories() if name == "BulkCat")
+
+    database.add_brands(cat_id, ["Alpha", "  Beta  ", "", "Alpha"])
+    brands = database.get_brands(cat_id)
+    assert [name for _bid, name in brands] == ["Alpha", "Beta"]
+
+    brand_id = brands[0][0]
+    database.add_models(brand_id, ["M1", "M2"])
+    database.add_models(brand_id, ["M2", "M3"])
+    assert [name for _mid, name in database.get_models(brand_id)] == ["M1", "M2", "M3"]
+
+
+def test_delete_models_and_brands_bulk_cascades():
+    database.init_db()
+    database.add_category("DelCat")
+    cat_id = next(cid for cid, name in database.get_categories() if name == "DelCat")
+    database.add_brands(cat_id, ["B1", "B2", "B3"])
+    brand_ids = [bid for bid, _name in database.get_brands(cat_id)]
+    database.add_models(brand_ids[0], ["M1", "M2", "M3"])
+    model_ids = [mid for mid, _name in database.get_models(brand_ids[0])]
+    database.insert_spec(model_ids[0], "Key", "Value")
+
+    database.delete_models(model_ids[:2])
+    assert [name for _mid, name in database.get_models(brand_ids[0])] == ["M3"]
+    assert database.get_specs(model_ids[0]) == []
+
+    database.delete_brands(brand_ids[:2])
+    assert [name for _bid, name in database.get_brands(cat_id)] == ["B3"]
+    assert database.get_models(brand_ids[0]) == []
+
+    database.delete_categories([cat_id])
+    assert all(name != "DelCat" for _cid, name in database.get_categories())
+
+
+def test_get_catalog_tree_joins_all_levels():
+    database.init_db()
+    database.add_category("TreeCat")
+    database.add_category("EmptyCat")
+    cat_id = next(cid for cid, name in database.get_categories() if name == "TreeCat")
+    database.add_brands(cat_id, ["B2", "B1"])
+    b1, b2 = (bid for bid, _name in database.get_brands(cat_id))
+    database.add_models(b1, ["M2", "M1"])
+
+    rows = [row for row in database.get_catalog_tree() if row[1] in ("TreeCat", "EmptyCat")]
+
+    assert [(row[1], row[4], row[7]) for row in rows] == [
+        ("EmptyCat", None, None),
+        ("TreeCat", "B1", "M1"),
+        ("TreeCat", "B1", "M2"),
+        ("TreeCat", "B2", None),
+    ]
+    assert rows[1][3] == b1 and rows[3][3] == b2
+    assert all(row[2] and (row[3] is None or row[5]) for row in rows)
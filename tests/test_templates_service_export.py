@@ -206,3 +206,15 @@ def test_callable_datetime_callable_result_supports_relativedelta():
 
     expected = base.replace(day=1) + ts._relativedelta_helper(months=1, days=-1)
     assert result == expected
+
+
+def test_write_json_config_replaces_file_without_leftovers(tmp_path):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    path = config_dir / "templates.json"
+    path.write_text('{"old": true}', encoding="utf-8")
+
+    ts._write_json_config(path, {"назва": 1})
+
+    assert path.read_text(encoding="utf-8") == '{\n  "назва": 1\n}'
+    assert [p.name for p in config_dir.iterdir()] == ["templates.json"]
@@ -10,15 +10,20 @@ import sys
 import time
 import queue
 import re
+import sqlite3
 import threading
 import uuid
 import webbrowser
+from contextlib import contextmanager
 from copy import deepcopy
-from functools import partial
+from functools import lru_cache, partial
+from itertools import groupby
+from operator import itemgetter
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Sequence, Tuple, cast
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple, cast
 from http import HTTPStatus
 
 import tkinter as tk
@@ -56,22 +61,24 @@ from templates_service import (
     _normalize_template_language_entry,
     _get_language_template_value,
     _set_language_template_value,
+    _rename_language_in_entry,
     _looks_like_formula,
     _copy_default_export_fields,
-    _row_to_values,
+    _iter_row_values,
     Template,
     TemplateError,
 )
 
 from database import (
-    add_brand,
+    add_brands,
     add_category,
-    add_model,
-    delete_brand,
-    delete_category,
-    delete_model,
+    add_models,
+    delete_brands,
+    delete_categories,
+    delete_models,
     delete_spec,
     get_brands,
+    get_catalog_tree,
     get_categories,
     get_models,
     get_specs,
@@ -105,7 +112,11 @@ except ModuleNotFoundError as exc:
         "Бібліотека CustomTkinter не знайдена. Встановіть її командою 'pip install customtkinter'."
     ) from exc
 
+_EMPTY_MAPPING: Mapping[str, object] = MappingProxyType({})
 _INPUT_SPLIT_RE = re.compile(r"[\n\r,;\u201a\u201e\uFF0C\u3001]+")
+# Generation tree check marks indexed by node state: unchecked, partial, checked.
+_STATE_SYMBOLS = ("☐", "◪", "☑")
+_GEN_FILTER_DATETIME_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4}) (\d{1,2})[:.](\d{1,2})")
 def split_catalog_input(raw: str):
     if not raw:
         return []
@@ -118,6 +129,123 @@ def split_catalog_input(raw: str):
             seen.add(part)
     return unique
 
+
+@lru_cache(maxsize=512)
+def _describe_formula_cached(text: str):
+    """``FormulaEngine.describe`` memoized by formula text; errors propagate and are not cached."""
+    return FormulaEngine.describe(text)
+
+
+@lru_cache(maxsize=256)
+def _compile_jinja_cached(text: str):
+    return Template(text)
+
+
+@lru_cache(maxsize=256)
+def _analyze_template_source(trimmed: str) -> Tuple[str, str]:
+    """Return the export template status message and colour; cached because parsing is costly."""
+    if not trimmed:
+        return (
+            "Введіть формулу (=IF(...)) або шаблон Jinja2. Аргументи формули розділяйте ';'.",
+            "#888888",
+        )
+    if _looks_like_formula(trimmed):
+        try:
+            info = _describe_formula_cached(trimmed)
+        except FormulaError as exc:
+            return (f"❌ Помилка формули: {exc}", "#c94a4a")
+        variables = sorted(info.get("variables", []))
+        if variables:
+            vars_text = ", ".join(variables)
+            hint = f"Змінні: {vars_text}"
+        else:
+            hint = "Змінні не використовуються."
+        return (f"✅ Формула валідна. {hint}", "#4c9a2a")
+    try:
+        _compile_jinja_cached(trimmed)
+    except TemplateError as exc:
+        return (f"❌ Помилка шаблону Jinja2: {exc}", "#c94a4a")
+    return (
+        "ℹ️ Використовується шаблон Jinja2. Доступні змінні: {{ brand }}, {{ model }}, {{ category }}, {{ film_type }}, {{ title }}, {{ description }}, {{ tags }}, {{ row_number }}, {{ now }}.",
+        "#888888",
+    )
+
+
+def _parse_language_codes(value) -> List[str]:
+    """Return the stripped, de-duplicated language codes of an export field ``languages`` value."""
+    if isinstance(value, str):
+        code = value.strip()
+        return [code] if code else []
+    codes: List[str] = []
+    if isinstance(value, (list, tuple, set)):
+        seen = set()
+        remember = seen.add
+        for lang in value:
+            if not isinstance(lang, str):
+                continue
+            code = lang.strip()
+            if code and code not in seen:
+                remember(code)
+                codes.append(code)
+    return codes
+
+
+@lru_cache(maxsize=8192)
+def _parse_db_timestamp_cached(text: str) -> Optional[datetime]:
+    """Parse a stripped SQLite timestamp; catalog rows share few distinct values, so keep them."""
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _clone_json(obj):
+    """Copy a JSON-shaped config tree without deepcopy's memo bookkeeping; other types fall back to it."""
+    kind = type(obj)
+    if kind is dict:
+        return {key: _clone_json(value) for key, value in obj.items()}
+    if kind is list:
+        return [_clone_json(value) for value in obj]
+    if kind in _JSON_SCALARS:
+        return obj
+    return deepcopy(obj)
+
+
+def _resolve_output_folder(raw: str) -> str:
+    """Return ``raw`` expanded when it names an existing directory, else the default export folder."""
+    if raw:
+        candidate = Path(raw).expanduser()
+        if candidate.is_dir():
+            return str(candidate)
+    return str(get_default_export_dir())
+
+
+def _catalog_node(rid, name, created) -> Tuple[object, str, Optional[str]]:
+    """Normalize an ``(id, name, created_at)`` catalog triple into ``(id, label, created_at)``."""
+    if isinstance(name, str):
+        label = name.strip()
+    elif name is None:
+        label = ""
+    else:
+        label = str(name)
+    if isinstance(created, str):
+        created = created.strip()
+    return rid, label, created
+
+
+def _iid_id(iid: str) -> int:
+    """Return the numeric id from a ``kind_<id>`` tree iid."""
+    return int(iid.partition("_")[2])
+
   
 def create_inline_entry(parent, text: str, theme_colors: Optional[Dict[str, str]] = None):
     entry = tk.Entry(parent)
@@ -163,6 +291,20 @@ def create_inline_entry(parent, text: str, theme_colors: Optional[Dict[str, str]
     entry.focus_set()
     return entry
 
+def _resolve_native_opener() -> Callable[[Path], object]:
+    if sys.platform.startswith("win"):
+        return os.startfile  # type: ignore[attr-defined]
+    command = "open" if sys.platform == "darwin" else "xdg-open"
+    return lambda path: subprocess.run([command, str(path)], check=False)
+
+# Config kinds as named in save error messages.
+_CONFIG_SAVE_LABELS = {
+    "templates": "шаблони",
+    "title_tags": "шаблони заголовку та тегів",
+    "export_fields": "налаштування експорту",
+}
+
+
 def show_error(msg: str):
     messagebox.showerror("Помилка", msg)
 
@@ -184,6 +326,7 @@ class DescriptionEditorHost:
         self._thread: Optional[threading.Thread] = None
         self._session_id = uuid.uuid4().hex
         self._result_event = threading.Event()
+        self._completion_callback: Optional[Callable[[Dict[str, Dict[str, object]]], None]] = None
         self.result: Optional[Dict[str, Dict[str, object]]] = None
 
     # ------------------------- HTTP server helpers -------------------------
@@ -217,8 +360,18 @@ class DescriptionEditorHost:
             self._active_lang = active_lang
         self.result = docs  # type: ignore[assignment]
         self._result_event.set()
+        self._notify_completion()
         return True
 
+    def _notify_completion(self) -> None:
+        callback = self._completion_callback
+        if callback is None or self.result is None:
+            return
+        try:
+            callback(cast(Dict[str, Dict[str, object]], self.result))
+        except Exception:
+            logger.exception("Не вдалося передати результат редактора опису")
+
     def _create_handler(self):
         host = self
 
@@ -312,6 +465,12 @@ class DescriptionEditorHost:
         if not opened:
             logger.warning("Не вдалося автоматично відкрити браузер для редактора опису")
 
+    def set_completion_callback(self, callback: Callable[[Dict[str, Dict[str, object]]], None]) -> None:
+        """Register ``callback`` to be invoked (from the server thread) once a result arrives."""
+        self._completion_callback = callback
+        if self._result_event.is_set():
+            self._notify_completion()
+
     def poll_result(self) -> Optional[Dict[str, Dict[str, object]]]:
         if self._result_event.is_set():
             return cast(Optional[Dict[str, Dict[str, object]]], self.result)
@@ -399,6 +558,51 @@ class SpecsBulkEditor(ctk.CTkToplevel):
         self.destroy()
 
 
+class SessionConfirmDialog(ctk.CTkToplevel):
+    """Yes/no confirmation that can be silenced until the application restarts."""
+
+    def __init__(self, master, title: str, message: str) -> None:
+        super().__init__(master)
+        self.result = False
+        self.skip_for_session = False
+        self.title(title)
+        self.resizable(False, False)
+        self.transient(master)
+        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel)
+        self.bind("<Escape>", lambda _e: self._on_cancel())
+
+        ctk.CTkLabel(self, text=message, wraplength=360, justify="left").pack(
+            fill="x", padx=16, pady=(16, 8)
+        )
+        self._skip_var = tk.BooleanVar(value=False)
+        ctk.CTkCheckBox(self, text="Не питати до закриття програми", variable=self._skip_var).pack(
+            anchor="w", padx=16, pady=(0, 12)
+        )
+
+        btn_frame = ctk.CTkFrame(self)
+        btn_frame.pack(fill="x", padx=16, pady=(0, 16))
+        ctk.CTkButton(
+            btn_frame,
+            text="Ні",
+            width=90,
+            fg_color="#444444",
+            hover_color="#333333",
+            command=self._on_cancel,
+        ).pack(side="right")
+        yes_button = ctk.CTkButton(btn_frame, text="Так", width=90, command=self._on_confirm)
+        yes_button.pack(side="right", padx=(0, 8))
+        yes_button.focus_set()
+
+    def _on_confirm(self) -> None:
+        self.result = True
+        self.skip_for_session = bool(self._skip_var.get())
+        self.destroy()
+
+    def _on_cancel(self) -> None:
+        self.destroy()
+
+
 # ============================ GUI: ВІКНО ХАРАКТЕРИСТИК ============================
 
 class SpecsWindow(ctk.CTkToplevel):
@@ -712,7 +916,7 @@ class SpecsWindow(ctk.CTkToplevel):
             show_error("Назва параметра не може бути порожньою.")
             self._restore_selection(iid)
             return
-        sid = int(iid.split("_")[1])
+        sid = _iid_id(iid)
         values = self.tree.item(iid, "values")
         if not values or len(values) < 2:
             self._restore_selection(iid)
@@ -763,7 +967,7 @@ class SpecsWindow(ctk.CTkToplevel):
         if not sel:
             show_error("Оберіть рядок у таблиці.")
             return
-        sid = int(sel[0].split("_")[1])
+        sid = _iid_id(sel[0])
         k = self.key_entry.get().strip()
         v = self.val_entry.get().strip()
         if not k:
@@ -791,7 +995,7 @@ class SpecsWindow(ctk.CTkToplevel):
         )
         if not messagebox.askyesno("Підтвердження", prompt):
             return
-        ids = [int(iid.split("_")[1]) for iid in selection]
+        ids = [_iid_id(iid) for iid in selection]
         for sid in ids:
             delete_spec(sid)
         self._refresh()
@@ -1178,12 +1382,21 @@ class App(ctk.CTk):
 
         self._generation_task_running = False
         self._active_generation_thread: Optional[threading.Thread] = None
-        self._progress_lock = threading.Lock()
-        self._last_progress_update = 0.0
+        # Latest (current, total, stage) from the worker; applied by the UI queue poll.
+        self._pending_progress: Optional[Tuple[int, int, str]] = None
+        self._applied_progress: Optional[Tuple[int, int, str]] = None
         self._ui_event_queue: "queue.Queue[Callable[[], None]]" = queue.Queue()
         self._ui_queue_job: Optional[str] = None
+        self._config_save_lock = threading.Lock()
+        self._pending_config_saves: Dict[str, object] = {}
+        # Success notices waiting on the pending snapshot of each config kind.
+        self._pending_config_notices: Dict[str, List[Dict[str, object]]] = {}
+        self._config_save_thread: Optional[threading.Thread] = None
+        self._config_save_batch: Optional[set] = None
+        self._config_save_batch_callbacks: List[Callable[[], None]] = []
 
         self.templates = load_templates()
+        self._sanitize_desc_templates()
         self.title_tags_templates = load_title_tags_templates(self.templates)
         self.export_fields = load_export_fields()
         self.current_category_id = None
@@ -1201,8 +1414,19 @@ class App(ctk.CTk):
         self._current_language_index = None
         self._gen_tree = None
         self._gen_tree_states = {}
-        self._gen_tree_meta = {}
+        # Database id of each model leaf; categories and brands are only identified by iid.
+        self._gen_tree_model_ids: Dict[str, int] = {}
         self._gen_tree_labels = {}
+        # Full category/brand/model hierarchy; Tk only holds the expanded part of it.
+        self._gen_tree_children: Dict[str, List[str]] = {}
+        self._gen_tree_parents: Dict[str, str] = {}
+        # Per-parent tallies of child states: {"total", "checked", "partial"}.
+        self._gen_tree_child_counts: Dict[str, Dict[str, int]] = {}
+        # Nodes inserted into Tk, and those still holding a placeholder instead of children.
+        self._gen_tree_rendered: Set[str] = set()
+        self._gen_tree_stubbed: Set[str] = set()
+        self._checked_model_ids: Set[int] = set()
+        self._gen_tree_open: Set[str] = set()
         self.gen_filter_header = None
         self.gen_filter_panel = None
         self.gen_filter_toggle = None
@@ -1218,23 +1442,54 @@ class App(ctk.CTk):
         self.gen_filter_apply = None
         self._gen_filter_range: Tuple[Optional[datetime], Optional[datetime]] = (None, None)
         self._gen_filter_visible = False
-        self._rename_clicks = {
-            "cat": (None, 0.0),
-            "brand": (None, 0.0),
-            "model": (None, 0.0),
+        self._pending_rename: Dict[str, str] = {}
+        self._trees_by_kind: Dict[str, ttk.Treeview] = {}
+        self._indexed_tree_rows: Dict[str, List[Tuple[str, str]]] = {}
+        self._indexed_tree_iids: Dict[str, Dict[str, int]] = {}
+        # load_templates() already normalizes template_languages; add/apply keep that shape.
+        self._languages_normalized = True
+        self._language_codes_lc = {
+            str(item.get("code", "")).strip().lower() for item in self.templates.get("template_languages", [])
         }
+        self._filmtype_name_index = self._build_filmtype_name_index(
+            (item.get("name") or "").strip() for item in self.templates.get("film_types", [])
+        )
+        self._catalog_tree_rows: Dict[str, List[Tuple[int, str]]] = {"cat": [], "brand": [], "model": []}
         self._rename_entry = None
         self._rename_entry_meta = None
         self._rename_delay_min = 0.35
-        self._rename_delay_max = 4.0
+        self._catalog_cache = {"cats": None, "brands": {}, "models": {}, "tree": None}
         self._export_selected_index = None
         self._export_tree_updating = False
         self._export_unknown_language_codes = []
         self.export_language_vars = []
+        # Export tab widgets; _build_tab_export replaces these placeholders.
+        self.export_fields_tree = None
+        self.export_field_name_var = None
+        self.export_field_enabled_var = None
+        self.export_field_name_entry = None
+        self.export_field_enabled_check = None
+        self.export_field_language_checks_frame = None
+        self.export_field_language_checks: List[ctk.CTkCheckBox] = []
+        self.export_field_language_vars: Dict[str, tk.BooleanVar] = {}
+        self.export_language_hint_label = None
+        self._export_language_hint_default = ""
+        self.export_field_template = None
+        self.export_template_status = None
+        self.export_apply_button = None
+        self._export_lang_widgets: Dict[str, Tuple[ctk.CTkCheckBox, tk.BooleanVar]] = {}
+        self._export_lang_items = None
+        self._export_row_cache: Optional[Dict[tuple, Tuple[str, str]]] = None
         self.progress_bar = None
         self.progress_label = None
-        self._preview_window = None
+        self._preview_widgets: Optional[Dict[str, object]] = None
+        self._open_native = _resolve_native_opener()
         self._active_desc_host = None
+        self._last_desc_html: Optional[str] = None
+        self._desc_template_cache: Dict[Tuple[Optional[str], str, Optional[str]], str] = {}
+        self._lang_items_cache: Optional[List[Tuple[str, Optional[str]]]] = None
+        self._lang_label_cache: Optional[Dict[str, str]] = None
+        self._last_desc_scope: Optional[Tuple[str, str, Optional[str]]] = None
         self._desc_editor_prepare_thread = None
         self._desc_editor_ready = DESC_EDITOR_ENTRY.exists()
         self._desc_editor_retry_visible = False
@@ -1251,7 +1506,19 @@ class App(ctk.CTk):
         self._film_type_order: List[str] = []
         self._film_types_cols = None
         self._film_types_scroll = None
+        self._film_types_width: Optional[int] = None
         self._film_layout_job = None
+        self._gen_reload_job = None
+        self._gen_tree_stale = False
+        self._pending_desc_save_job = None
+        self._template_validate_job = None
+        self._export_template_last_text: Optional[str] = None
+        self._export_detail_dirty = False
+        self._files_export_running = False
+        self._session_confirmed: Set[str] = set()
+        self._pending_refreshes: Set[str] = set()
+        self._refresh_idle_job = None
+        self._referenced_language_codes: Optional[Set[str]] = None
         # Compatibility: some flows expect the filmtype name variable to exist during tab
         # construction even if the dedicated film type tab is hidden. Older widgets access
         # the variable through the low-level Tk interpreter (self.tk), so expose it there
@@ -1431,8 +1698,6 @@ class App(ctk.CTk):
         )
 
     def _ensure_background_primitives(self) -> None:
-        if not hasattr(self, "_progress_lock") or self._progress_lock is None:
-            self._progress_lock = threading.Lock()
         if not hasattr(self, "_ui_event_queue") or self._ui_event_queue is None:
             self._ui_event_queue = queue.Queue()
         if not hasattr(self, "_ui_queue_job"):
@@ -1441,13 +1706,24 @@ class App(ctk.CTk):
             self._generation_task_running = False
         if not hasattr(self, "_active_generation_thread"):
             self._active_generation_thread = None
-        if not hasattr(self, "_last_progress_update"):
-            self._last_progress_update = 0.0
+        if not hasattr(self, "_pending_progress"):
+            self._pending_progress = None
+            self._applied_progress = None
+        if getattr(self, "_config_save_lock", None) is None:
+            self._config_save_lock = threading.Lock()
+        if not hasattr(self, "_pending_config_saves"):
+            self._pending_config_saves = {}
+        if not hasattr(self, "_pending_config_notices"):
+            self._pending_config_notices = {}
+        if not hasattr(self, "_config_save_thread"):
+            self._config_save_thread = None
 
     def _process_ui_queue(self) -> None:
         self._ensure_background_primitives()
         if not hasattr(self, "_ui_event_queue"):
             return
+        # Apply progress before queued callbacks so a stale value never follows the final state.
+        self._apply_pending_progress()
         try:
             while True:
                 callback = self._ui_event_queue.get_nowait()
@@ -1502,6 +1778,212 @@ class App(ctk.CTk):
         thread.start()
         return thread
 
+    def _queue_config_save(self, *kinds: str, on_saved: Optional[Callable[[], None]] = None) -> None:
+        """Persist config blocks on a single writer thread, keeping only the latest snapshot.
+
+        ``on_saved`` runs on the UI thread once every block in ``kinds`` is on disk;
+        a failed write shows an error instead.
+        """
+        self._referenced_language_codes = None
+        if "templates" in kinds:
+            self._invalidate_template_caches()
+        batch = getattr(self, "_config_save_batch", None)
+        if batch is not None:
+            batch.update(kinds)
+            if on_saved is not None:
+                self._config_save_batch_callbacks.append(on_saved)
+            return
+        payloads = {kind: _clone_json(self._config_payload(kind)) for kind in kinds}
+        notice = {"kinds": set(payloads), "on_saved": on_saved, "failed": False}
+        after_fn = getattr(self, "after", None)
+        if after_fn is None or not callable(after_fn):
+            errors = self._write_config_payloads(payloads)
+            self._finish_config_writes({kind: [notice] for kind in payloads}, errors)
+            return
+        self._ensure_background_primitives()
+        with self._config_save_lock:
+            self._pending_config_saves.update(payloads)
+            if on_saved is not None:
+                for kind in payloads:
+                    self._pending_config_notices.setdefault(kind, []).append(notice)
+            worker = self._config_save_thread
+            if worker is None or not worker.is_alive():
+                worker = threading.Thread(target=self._config_save_worker, name="config-save", daemon=True)
+                self._config_save_thread = worker
+                worker.start()
+
+    def _queue_changed_config_saves(
+        self,
+        templates: bool = False,
+        title_tags: bool = False,
+        export_fields: bool = False,
+        on_saved: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Queue one save covering every config file flagged as changed."""
+        kinds = [
+            kind
+            for kind, changed in (
+                ("templates", templates),
+                ("title_tags", title_tags),
+                ("export_fields", export_fields),
+            )
+            if changed
+        ]
+        if kinds:
+            self._queue_config_save(*kinds, on_saved=on_saved)
+
+    def _invalidate_template_caches(self) -> None:
+        # Every template edit ends in a templates save, so this is the single
+        # place where caches derived from self.templates can go stale.
+        self._desc_template_cache = {}
+        self._referenced_language_codes = None
+        self._invalidate_language_caches()
+
+    def _schedule_desc_template_save(self) -> None:
+        """Coalesce repeated description saves into one templates write after a short pause."""
+        self._invalidate_template_caches()
+        after_fn = getattr(self, "after", None)
+        if after_fn is None or not callable(after_fn):
+            self._flush_desc_template_save()
+            return
+        job = getattr(self, "_pending_desc_save_job", None)
+        if job is not None:
+            try:
+                self.after_cancel(job)
+            except Exception:
+                pass
+        self._pending_desc_save_job = after_fn(300, self._flush_desc_template_save)
+
+    def _flush_desc_template_save(self, notify: bool = True) -> None:
+        self._pending_desc_save_job = None
+        on_saved = partial(show_info, "Шаблон опису збережено.") if notify else None
+        self._queue_config_save("templates", on_saved=on_saved)
+
+    @contextmanager
+    def _batched_config_saves(self):
+        """Defer ``_queue_config_save`` calls in the block to one save per file on exit."""
+        if getattr(self, "_config_save_batch", None) is not None:
+            yield
+            return
+        self._config_save_batch = set()
+        self._config_save_batch_callbacks = []
+        try:
+            yield
+        finally:
+            kinds = self._config_save_batch
+            callbacks = self._config_save_batch_callbacks
+            self._config_save_batch = None
+            self._config_save_batch_callbacks = []
+            if kinds:
+                on_saved = None
+                if callbacks:
+                    def on_saved() -> None:
+                        for callback in callbacks:
+                            callback()
+                self._queue_config_save(*sorted(kinds), on_saved=on_saved)
+
+    def _config_payload(self, kind: str):
+        if kind == "templates":
+            return self.templates
+        if kind == "title_tags":
+            return self.title_tags_templates
+        return self.export_fields
+
+    def _write_config_payloads(self, payloads: Dict[str, object]) -> Dict[str, Exception]:
+        """Write each payload and return the errors of the ones that failed, by kind."""
+        errors: Dict[str, Exception] = {}
+        for kind, payload in payloads.items():
+            try:
+                if kind == "templates":
+                    save_templates(payload)
+                elif kind == "title_tags":
+                    save_title_tags_templates(payload)
+                else:
+                    save_export_fields(payload)
+            except Exception as exc:
+                logger.exception("Не вдалося зберегти налаштування (%s)", kind)
+                errors[kind] = exc
+        return errors
+
+    def _take_config_saves(self, skip: Dict[str, object]) -> Tuple[Dict[str, object], Dict[str, list]]:
+        """Pop pending snapshots (except those identical to ``skip``) with their notices; hold the lock."""
+        payloads = {
+            kind: payload
+            for kind, payload in self._pending_config_saves.items()
+            if skip.get(kind) is not payload
+        }
+        notices = {}
+        for kind in payloads:
+            del self._pending_config_saves[kind]
+            notices[kind] = self._pending_config_notices.pop(kind, [])
+        return payloads, notices
+
+    def _requeue_failed_config_saves(self, payloads: Dict[str, object], errors: Dict[str, Exception]) -> None:
+        # A newer snapshot queued during the write supersedes the failed one.
+        with self._config_save_lock:
+            for kind in errors:
+                self._pending_config_saves.setdefault(kind, payloads[kind])
+
+    def _finish_config_writes(
+        self, notices: Dict[str, list], errors: Dict[str, Exception], in_ui_thread: bool = False
+    ) -> None:
+        dispatch = (lambda func, *args: func(*args)) if in_ui_thread else self._call_in_ui_thread
+        for kind, exc in errors.items():
+            label = _CONFIG_SAVE_LABELS.get(kind, kind)
+            dispatch(show_error, f"Не вдалося зберегти {label}: {exc}")
+        for kind, kind_notices in notices.items():
+            for notice in kind_notices:
+                if kind in errors:
+                    notice["failed"] = True
+                notice["kinds"].discard(kind)
+                if not notice["kinds"] and not notice["failed"] and notice["on_saved"] is not None:
+                    dispatch(notice["on_saved"])
+
+    def _config_save_worker(self) -> None:
+        # Snapshots that already failed in this run stay pending for the next save request
+        # or the exit flush instead of being retried in a tight loop.
+        failed: Dict[str, object] = {}
+        while True:
+            with self._config_save_lock:
+                payloads, notices = self._take_config_saves(failed)
+                if not payloads:
+                    self._config_save_thread = None
+                    return
+            errors = self._write_config_payloads(payloads)
+            if errors:
+                self._requeue_failed_config_saves(payloads, errors)
+                failed.update((kind, payloads[kind]) for kind in errors)
+            self._finish_config_writes(notices, errors)
+
+    def _flush_config_saves(self, timeout: float = 10.0) -> None:
+        job = getattr(self, "_pending_desc_save_job", None)
+        if job is not None:
+            try:
+                self.after_cancel(job)
+            except Exception:
+                pass
+            self._flush_desc_template_save(notify=False)
+        worker = getattr(self, "_config_save_thread", None)
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(timeout)
+            if worker.is_alive():
+                return
+        lock = getattr(self, "_config_save_lock", None)
+        if lock is None:
+            return
+        # Retry snapshots the worker could not write once more before exit.
+        with lock:
+            payloads, notices = self._take_config_saves({})
+        if payloads:
+            errors = self._write_config_payloads(payloads)
+            if errors:
+                self._requeue_failed_config_saves(payloads, errors)
+            self._finish_config_writes(notices, errors, in_ui_thread=True)
+
+    def destroy(self):
+        self._flush_config_saves()
+        super().destroy()
+
     def _install_clipboard_shortcuts(self) -> None:
         sequences = [
             ("<Control-c>", "<<Copy>>"),
@@ -1771,8 +2253,6 @@ class App(ctk.CTk):
             if name not in descriptions:
                 descriptions[name] = {}
                 changed_templates = True
-        if changed_templates:
-            save_templates(self.templates)
 
         changed_title_tags = False
         for name in categories:
@@ -1785,8 +2265,7 @@ class App(ctk.CTk):
                 if self._ensure_title_tags_film(fname):
                     changed_title_tags = True
 
-        if changed_title_tags:
-            save_title_tags_templates(self.title_tags_templates)
+        self._queue_changed_config_saves(templates=changed_templates, title_tags=changed_title_tags)
 
     def _ensure_title_tags_category(self, category_name: str) -> bool:
         if not category_name:
@@ -1849,30 +2328,26 @@ class App(ctk.CTk):
                 by_category[new_name] = old_cat_block
             changed_title_tags = True
 
-        if changed_templates:
-            save_templates(self.templates)
-        if changed_title_tags or self._ensure_title_tags_category(new_name):
-            save_title_tags_templates(self.title_tags_templates)
+        changed_title_tags = changed_title_tags or self._ensure_title_tags_category(new_name)
+        self._queue_changed_config_saves(templates=changed_templates, title_tags=changed_title_tags)
 
-    def _delete_category_templates(self, category_name: str):
-        if not category_name:
+    def _delete_category_templates(self, *category_names: str):
+        names = [name for name in category_names if name]
+        if not names:
             return
         descriptions = self.templates.get("descriptions", {})
-        changed_templates = False
-        if category_name in descriptions:
-            descriptions.pop(category_name, None)
-            changed_templates = True
-
         by_category = self.title_tags_templates.get("by_category", {})
+        if not isinstance(by_category, dict):
+            by_category = {}
+        changed_templates = False
         changed_title_tags = False
-        if isinstance(by_category, dict) and category_name in by_category:
-            by_category.pop(category_name, None)
-            changed_title_tags = True
+        for category_name in names:
+            if descriptions.pop(category_name, None) is not None:
+                changed_templates = True
+            if by_category.pop(category_name, None) is not None:
+                changed_title_tags = True
 
-        if changed_templates:
-            save_templates(self.templates)
-        if changed_title_tags:
-            save_title_tags_templates(self.title_tags_templates)
+        self._queue_changed_config_saves(templates=changed_templates, title_tags=changed_title_tags)
 
     def _rename_film_type(self, old_name: str, new_name: str):
         if not old_name or not new_name or old_name == new_name:
@@ -1904,10 +2379,7 @@ class App(ctk.CTk):
                     films_map.pop(old_name, None)
                 changed_title_tags = True
 
-        if changed_templates:
-            save_templates(self.templates)
-        if changed_title_tags:
-            save_title_tags_templates(self.title_tags_templates)
+        self._queue_changed_config_saves(templates=changed_templates, title_tags=changed_title_tags)
 
     def _remove_film_type_templates(self, film_name: str):
         if not film_name:
@@ -1932,10 +2404,7 @@ class App(ctk.CTk):
                 films_map.pop(film_name, None)
                 changed_title_tags = True
 
-        if changed_templates:
-            save_templates(self.templates)
-        if changed_title_tags:
-            save_title_tags_templates(self.title_tags_templates)
+        self._queue_changed_config_saves(templates=changed_templates, title_tags=changed_title_tags)
 
     # -------- верхній бар
     def _build_header(self):
@@ -2008,19 +2477,14 @@ class App(ctk.CTk):
 
     def _open_path(self, path: Path):
         try:
-            if sys.platform.startswith("win"):
-                os.startfile(path)  # type: ignore[attr-defined]
-            elif sys.platform == "darwin":
-                subprocess.run(["open", str(path)], check=False)
-            else:
-                subprocess.run(["xdg-open", str(path)], check=False)
+            self._open_native(path)
         except Exception:
             logger.exception("Не вдалося відкрити шлях %s", path)
             show_error("Не вдалося відкрити папку.")
 
     # -------- вкладки
     def _build_tabs(self):
-        tabs = ctk.CTkTabview(self, width=1040, height=600)
+        tabs = ctk.CTkTabview(self, width=1040, height=600, command=self._on_tab_changed)
         tabs.pack(fill="both", expand=True, padx=10, pady=10)
         self.tabs = tabs
         self.theme_manager.register(tabs, "tabview")
@@ -2039,6 +2503,65 @@ class App(ctk.CTk):
         self._build_tab_files()
         self._build_tab_generate()
 
+    def _on_tab_changed(self):
+        current = self.tabs.get()
+        if current == "Параметри":
+            self._ensure_parameters_tab()
+        elif current == "Генерація" and self._gen_tree_stale:
+            self._reload_gen_tree()
+
+    # Idle-time refresh steps, flushed in this order.
+    _REFRESH_ORDER = (
+        "categories",
+        "language_tree",
+        "filmtype_tree",
+        "filmtype_checkboxes",
+        "template_selectors",
+        "title_tags",
+        "description",
+        "export_fields",
+    )
+
+    def _schedule_refresh(self, *names: str) -> None:
+        """Coalesce widget refreshes into a single pass once the Tk loop is idle."""
+        pending = getattr(self, "_pending_refreshes", None)
+        if pending is None:
+            pending = self._pending_refreshes = set()
+        pending.update(names)
+        if getattr(self, "_refresh_idle_job", None) is not None:
+            return
+        after_idle = getattr(self, "after_idle", None)
+        if after_idle is None or not callable(after_idle):
+            self._flush_refreshes()
+            return
+        self._refresh_idle_job = after_idle(self._flush_refreshes)
+
+    def _flush_refreshes(self) -> None:
+        self._refresh_idle_job = None
+        pending = getattr(self, "_pending_refreshes", None) or set()
+        self._pending_refreshes = set()
+        for name in self._REFRESH_ORDER:
+            if name not in pending:
+                continue
+            if name == "categories":
+                self._refresh_categories()
+            elif name == "language_tree":
+                self._refresh_language_tree(select_index=0 if self.templates.get("template_languages") else None)
+            elif name == "filmtype_tree":
+                self._refresh_filmtype_tree(select_index=0 if self.templates.get("film_types") else None)
+            elif name == "filmtype_checkboxes":
+                self._refresh_filmtype_checkboxes()
+            elif name == "template_selectors":
+                self._refresh_template_selectors()
+            elif name == "title_tags":
+                self._load_title_tags_template()
+            elif name == "description":
+                self._load_desc_template()
+            elif name == "export_fields":
+                select_index = 0 if self.export_fields else None
+                self._refresh_export_fields_tree(select_index=select_index)
+                self._load_export_field_detail(select_index)
+
     def _show_dependency_warnings(self):
         for warning in DEPENDENCY_WARNINGS:
             messagebox.showwarning(APP_TITLE, warning)
@@ -2054,6 +2577,19 @@ class App(ctk.CTk):
         return items
 
     def _template_language_items(self):
+        cached = getattr(self, "_lang_items_cache", None)
+        if cached is None:
+            cached = self._lang_items_cache = self._build_template_language_items()
+            self._lang_label_cache = {code: label for label, code in cached if code}
+        return list(cached)
+
+    def _invalidate_language_caches(self) -> None:
+        self._lang_items_cache = None
+        self._lang_label_cache = None
+        # Export tree rows embed language labels.
+        self._export_row_cache = None
+
+    def _build_template_language_items(self):
         items = [(TEMPLATE_LANGUAGE_DEFAULT_LABEL, None)]
         languages = self.templates.get("template_languages", [])
         if isinstance(languages, list):
@@ -2075,14 +2611,14 @@ class App(ctk.CTk):
     def _template_language_codes(self):
         return [code for label, code in self._template_language_items() if code]
 
+    def _language_labels(self) -> Dict[str, str]:
+        """Return the cached ``code -> label`` map for template languages."""
+        if getattr(self, "_lang_label_cache", None) is None:
+            self._template_language_items()
+        return self._lang_label_cache
+
     def _language_label_for_code(self, code: str) -> str:
-        mapping = getattr(self, "_template_language_code_to_label", {})
-        if isinstance(mapping, dict) and code in mapping:
-            return mapping[code]
-        for label, value in self._template_language_items():
-            if value == code:
-                return label
-        return code
+        return self._language_labels().get(code, code)
 
     def _template_category_items(self):
         names = set()
@@ -2163,35 +2699,68 @@ class App(ctk.CTk):
         title_value: str,
         tags_value: str,
     ):
-        fallback_block = _title_tags_block(
-            self.templates.get("title_template", DEFAULT_TEMPLATES["title_template"]),
-            self.templates.get("tags_template", DEFAULT_TEMPLATES["tags_template"]),
-        )
+        fallback_cache: List[dict] = []
+
+        def _fallback_block() -> dict:
+            if not fallback_cache:
+                fallback_cache.append(
+                    _title_tags_block(
+                        self.templates.get("title_template", DEFAULT_TEMPLATES["title_template"]),
+                        self.templates.get("tags_template", DEFAULT_TEMPLATES["tags_template"]),
+                    )
+                )
+            return fallback_cache[0]
+
+        def _is_normalized(entry) -> bool:
+            return (
+                isinstance(entry, dict)
+                and isinstance(entry.get("default"), str)
+                and isinstance(entry.get("languages"), dict)
+            )
 
         def _update_block(container: dict, key: str) -> None:
             existing = container.get(key)
+            updates = (("title_template", title_value), ("tags_template", tags_value))
+            if isinstance(existing, dict) and all(_is_normalized(existing.get(field)) for field, _ in updates):
+                # Fast path: the block is already in canonical shape, so only the
+                # touched entries are rebuilt. Entries may be shared between blocks
+                # (see _build_title_tags_defaults), hence the shallow copies.
+                for field, value in updates:
+                    entry = existing[field]
+                    languages = dict(entry["languages"])
+                    default_value = entry["default"]
+                    if language_code:
+                        languages[language_code] = value
+                    else:
+                        default_value = value
+                    existing[field] = {"default": default_value, "languages": languages}
+                return
+            fallback_block = _fallback_block()
             normalized = _normalize_title_tags_block(existing, fallback_block)
-            normalized["title_template"] = _set_language_template_value(
-                normalized.get("title_template"), language_code, title_value, fallback_block["title_template"].get("default", "")
-            )
-            normalized["tags_template"] = _set_language_template_value(
-                normalized.get("tags_template"), language_code, tags_value, fallback_block["tags_template"].get("default", "")
-            )
+            for field, value in updates:
+                normalized[field] = _set_language_template_value(
+                    normalized.get(field), language_code, value, fallback_block[field].get("default", "")
+                )
             container[key] = normalized
 
         root_default = self.title_tags_templates.get("default")
         if not isinstance(root_default, dict):
-            self.title_tags_templates["default"] = deepcopy(fallback_block)
+            fallback_block = _fallback_block()
+            self.title_tags_templates["default"] = {
+                key: {
+                    "default": fallback_block[key].get("default", ""),
+                    "languages": dict(fallback_block[key].get("languages", {})),
+                }
+                for key in ("title_template", "tags_template")
+            }
 
         if category_key:
             self._ensure_title_tags_category(category_key)
-            by_category = self.title_tags_templates.setdefault("by_category", {})
-            cat_entry = by_category.setdefault(category_key, {"default": {}, "by_film": {}})
+            cat_entry = self.title_tags_templates["by_category"][category_key]
             if film_key == "default":
                 _update_block(cat_entry, "default")
             else:
-                films = cat_entry.setdefault("by_film", {})
-                _update_block(films, film_key)
+                _update_block(cat_entry["by_film"], film_key)
         else:
             if film_key == "default":
                 _update_block(self.title_tags_templates, "default")
@@ -2231,6 +2800,7 @@ class App(ctk.CTk):
         cat_scroll.pack(side="right", fill="y"); self.cat_tree.configure(yscrollcommand=cat_scroll.set)
         self.cat_tree.bind("<<TreeviewSelect>>", self._on_category_select)
         self.cat_tree.bind("<Button-1>", lambda e: self._handle_tree_click(e, "cat", self.cat_tree), add="+")
+        self.cat_tree.bind("<Double-1>", partial(self._cancel_pending_rename, "cat"), add="+")
         self.cat_tree.bind("<Delete>", lambda e: self._handle_tree_delete("cat"))
 
         cat_ctrl = ctk.CTkFrame(left)
@@ -2265,6 +2835,7 @@ class App(ctk.CTk):
         brand_scroll.pack(side="right", fill="y"); self.brand_tree.configure(yscrollcommand=brand_scroll.set)
         self.brand_tree.bind("<<TreeviewSelect>>", self._on_brand_select)
         self.brand_tree.bind("<Button-1>", lambda e: self._handle_tree_click(e, "brand", self.brand_tree), add="+")
+        self.brand_tree.bind("<Double-1>", partial(self._cancel_pending_rename, "brand"), add="+")
         self.brand_tree.bind("<Delete>", lambda e: self._handle_tree_delete("brand"))
 
         brand_ctrl = ctk.CTkFrame(left)
@@ -2324,8 +2895,10 @@ class App(ctk.CTk):
         self.model_specs_button = ctk.CTkButton(model_ctrl, text="Характеристики", command=self._open_specs, width=140)
         self.model_specs_button.pack(side="left", padx=6)
         self.theme_manager.register(self.model_specs_button, "accent_button")
+        self._trees_by_kind = {"cat": self.cat_tree, "brand": self.brand_tree, "model": self.model_tree}
 
     def _on_model_double_click(self, event):
+        self._cancel_pending_rename("model")
         row = self.model_tree.identify_row(event.y)
         if not row:
             return
@@ -2333,16 +2906,28 @@ class App(ctk.CTk):
         self._open_specs()
 
     def _handle_tree_click(self, event, kind, tree):
+        self._cancel_pending_rename(kind)
         row = tree.identify_row(event.y)
-        now = time.time()
-        if not row:
-            self._rename_clicks[kind] = (None, now)
+        # A click on the row that is already the sole selection starts an inline
+        # rename, unless a double-click arrives before the timer fires.
+        if not row or tuple(tree.selection()) != (row,):
             return
-        last_row, last_time = self._rename_clicks.get(kind, (None, 0.0))
-        self._rename_clicks[kind] = (row, now)
-        delay = now - last_time
-        if row == last_row and self._rename_delay_min <= delay <= self._rename_delay_max:
-            self.after(0, lambda: self._start_tree_rename(kind, tree, row))
+        self._pending_rename[kind] = self.after(
+            int(self._rename_delay_min * 1000),
+            lambda: self._fire_pending_rename(kind, tree, row),
+        )
+
+    def _cancel_pending_rename(self, kind, _event=None):
+        job = self._pending_rename.pop(kind, None)
+        if job is not None:
+            try:
+                self.after_cancel(job)
+            except Exception:
+                pass
+
+    def _fire_pending_rename(self, kind, tree, row):
+        self._pending_rename.pop(kind, None)
+        self._start_tree_rename(kind, tree, row)
 
     def _handle_tree_delete(self, kind):
         if kind == "cat":
@@ -2402,51 +2987,52 @@ class App(ctk.CTk):
         self._apply_tree_rename(kind, iid, new_value)
 
     def _apply_tree_rename(self, kind, iid, new_value):
+        tree = self._trees_by_kind[kind]
+        entity_id = _iid_id(iid)
         if kind == "cat":
-            cat_id = int(iid.split("_")[1])
-            result = rename_category(cat_id, new_value)
+            values = tree.item(iid, "values") if tree.exists(iid) else ()
+            old_name = (values[0] or "").strip() if values else ""
+            result = rename_category(entity_id, new_value)
+            self._invalidate_catalog_cache("cats")
             if result is not True:
                 if isinstance(result, sqlite3.IntegrityError):
                     show_error("Категорія з такою назвою вже існує.")
                 else:
                     show_error("Не вдалося перейменувати категорію.")
-            self._refresh_categories()
-            self.after(10, lambda: self._restore_tree_selection("cat", f"cat_{cat_id}"))
+            else:
+                if old_name:
+                    self._rename_category_templates(old_name, new_value)
+                if self._current_template_category == old_name:
+                    self._current_template_category = new_value
+                if self._current_desc_category == old_name:
+                    self._current_desc_category = new_value
+                self._refresh_template_selectors()
         elif kind == "brand":
-            brand_id = int(iid.split("_")[1])
-            result = rename_brand(brand_id, new_value)
+            result = rename_brand(entity_id, new_value)
+            self._invalidate_catalog_cache("brands", self.current_category_id)
             if result is not True:
                 if isinstance(result, sqlite3.IntegrityError):
                     show_error("Бренд з такою назвою вже існує.")
                 else:
                     show_error("Не вдалося перейменувати бренд.")
-            if self.current_category_id:
-                self._refresh_brands(self.current_category_id)
-            else:
-                self._refresh_brands(None)
-            self._reload_gen_tree()
-            self.after(10, lambda: self._restore_tree_selection("brand", f"brand_{brand_id}"))
         else:
-            model_id = int(iid.split("_")[1])
-            result = rename_model(model_id, new_value)
+            result = rename_model(entity_id, new_value)
+            self._invalidate_catalog_cache("models", self.current_brand_id)
             if result is not True:
                 if isinstance(result, sqlite3.IntegrityError):
                     show_error("Модель з такою назвою вже існує.")
                 else:
                     show_error("Не вдалося перейменувати модель.")
-            if self.current_brand_id:
-                self._refresh_models(self.current_brand_id)
-            else:
-                self._refresh_models(None)
-            self._reload_gen_tree()
-            self.after(10, lambda: self._restore_tree_selection("model", f"model_{model_id}"))
+        if result is True:
+            if tree.exists(iid):
+                tree.item(iid, values=(new_value,))
+            self._schedule_gen_reload()
+        if tree.exists(iid):
+            tree.selection_set(iid)
+            tree.focus(iid)
 
     def _restore_tree_selection(self, kind, iid):
-        tree = {
-            "cat": getattr(self, "cat_tree", None),
-            "brand": getattr(self, "brand_tree", None),
-            "model": getattr(self, "model_tree", None),
-        }.get(kind)
+        tree = self._trees_by_kind.get(kind)
         if tree is None:
             return
         def _select():
@@ -2462,29 +3048,88 @@ class App(ctk.CTk):
         self.after(10, _select)
 
     # ---- catalog actions
+    def _cached_catalog_rows(self, kind, parent_id=None):
+        cache = self._catalog_cache
+        if kind == "cats":
+            if cache["cats"] is None:
+                cache["cats"] = get_categories()
+            return cache["cats"]
+        if kind == "tree":
+            if cache["tree"] is None:
+                cache["tree"] = get_catalog_tree()
+            return cache["tree"]
+        bucket = cache[kind]
+        rows = bucket.get(parent_id)
+        if rows is None:
+            rows = get_brands(parent_id) if kind == "brands" else get_models(parent_id)
+            bucket[parent_id] = rows
+        return rows
+
+    def _invalidate_catalog_cache(self, kind=None, parent_id=None):
+        cache = self._catalog_cache
+        # The generation tree spans every level, so any catalog edit drops it.
+        cache["tree"] = None
+        if kind is None:
+            cache["cats"] = None
+            cache["brands"].clear()
+            cache["models"].clear()
+        elif kind == "cats":
+            cache["cats"] = None
+        else:
+            cache[kind].pop(parent_id, None)
+
+    def _sync_catalog_tree(self, tree, prefix, rows):
+        selected = tree.selection()
+        if selected:
+            # Match the previous delete-and-reinsert behaviour, which always
+            # dropped the selection on refresh.
+            tree.selection_remove(*selected)
+        previous = self._catalog_tree_rows[prefix]
+        if rows is previous or rows == previous:
+            return
+        self._catalog_tree_rows[prefix] = rows
+        wanted = [(f"{prefix}_{row_id}", name) for row_id, name in rows]
+        wanted_iids = {iid for iid, _name in wanted}
+        current = list(tree.get_children())
+        stale = [iid for iid in current if iid not in wanted_iids]
+        if stale:
+            tree.delete(*stale)
+            current = [iid for iid in current if iid in wanted_iids]
+        present = set(current)
+        for index, (iid, name) in enumerate(wanted):
+            if iid not in present:
+                tree.insert("", index, iid=iid, values=(name,))
+                current.insert(index, iid)
+                continue
+            values = tree.item(iid, "values")
+            if not values or str(values[0]) != name:
+                tree.item(iid, values=(name,))
+            if current[index] != iid:
+                tree.move(iid, "", index)
+                current.remove(iid)
+                current.insert(index, iid)
+
     def _refresh_categories(self):
-        self.cat_tree.delete(*self.cat_tree.get_children())
-        for cid, name in get_categories():
-            self.cat_tree.insert("", "end", iid=f"cat_{cid}", values=(name,))
+        self._sync_catalog_tree(self.cat_tree, "cat", self._cached_catalog_rows("cats"))
         self.current_category_id = None
         self._refresh_brands(None)
         self._refresh_models(None)
-        self._reload_gen_tree()
+        self._schedule_gen_reload()
         self._sync_templates_with_catalog()
         self._refresh_template_selectors()
 
     def _refresh_brands(self, category_id):
-        self.brand_tree.delete(*self.brand_tree.get_children())
-        if category_id:
-            for bid, name in get_brands(category_id):
-                self.brand_tree.insert("", "end", iid=f"brand_{bid}", values=(name,))
         self.current_brand_id = None
+        if not category_id and not self._catalog_tree_rows["brand"]:
+            return
+        rows = self._cached_catalog_rows("brands", category_id) if category_id else []
+        self._sync_catalog_tree(self.brand_tree, "brand", rows)
 
     def _refresh_models(self, brand_id):
-        self.model_tree.delete(*self.model_tree.get_children())
-        if brand_id:
-            for mid, name in get_models(brand_id):
-                self.model_tree.insert("", "end", iid=f"model_{mid}", values=(name,))
+        if not brand_id and not self._catalog_tree_rows["model"]:
+            return
+        rows = self._cached_catalog_rows("models", brand_id) if brand_id else []
+        self._sync_catalog_tree(self.model_tree, "model", rows)
 
     def _on_category_select(self, _evt=None):
         sel = self.cat_tree.selection()
@@ -2492,7 +3137,7 @@ class App(ctk.CTk):
             self.current_category_id = None
             self._refresh_brands(None); self._refresh_models(None)
             return
-        self.current_category_id = int(sel[0].split("_")[1])
+        self.current_category_id = _iid_id(sel[0])
         self._refresh_brands(self.current_category_id)
         self._refresh_models(None)
 
@@ -2502,13 +3147,15 @@ class App(ctk.CTk):
             self.current_brand_id = None
             self._refresh_models(None)
             return
-        self.current_brand_id = int(sel[0].split("_")[1])
+        self.current_brand_id = _iid_id(sel[0])
         self._refresh_models(self.current_brand_id)
 
     def _cat_add(self):
         name = self.cat_entry.get().strip()
         if not name: return show_error("Введіть назву категорії.")
-        add_category(name); self.cat_entry.delete(0, tk.END); self._refresh_categories()
+        add_category(name); self.cat_entry.delete(0, tk.END)
+        self._invalidate_catalog_cache("cats")
+        self._refresh_categories()
 
     def _cat_rename(self):
         if not self.current_category_id: return show_error("Виберіть категорію.")
@@ -2522,6 +3169,7 @@ class App(ctk.CTk):
                 old_name = (old_val[0] or "").strip()
         cat_id = self.current_category_id
         result = rename_category(cat_id, name)
+        self._invalidate_catalog_cache("cats")
         if result is not True:
             if isinstance(result, sqlite3.IntegrityError):
                 show_error("Категорія з такою назвою вже існує.")
@@ -2549,7 +3197,7 @@ class App(ctk.CTk):
         )
         if not messagebox.askyesno("Підтвердження", prompt):
             return
-        ids = [int(iid.split("_")[1]) for iid in selection]
+        ids = [_iid_id(iid) for iid in selection]
         id_to_name = {}
         for iid in selection:
             parts = iid.split("_")
@@ -2561,15 +3209,14 @@ class App(ctk.CTk):
                 values = self.cat_tree.item(iid, "values")
                 if values:
                     id_to_name[cid] = (values[0] or "").strip()
-        for cat_id in ids:
-            delete_category(cat_id)
-            cat_name = id_to_name.get(cat_id)
-            if cat_name:
-                self._delete_category_templates(cat_name)
-                if self._current_template_category == cat_name:
-                    self._current_template_category = None
-                if self._current_desc_category == cat_name:
-                    self._current_desc_category = None
+        delete_categories(ids)
+        self._invalidate_catalog_cache()
+        deleted_names = {id_to_name[cat_id] for cat_id in ids if id_to_name.get(cat_id)}
+        self._delete_category_templates(*deleted_names)
+        if self._current_template_category in deleted_names:
+            self._current_template_category = None
+        if self._current_desc_category in deleted_names:
+            self._current_desc_category = None
         self._refresh_categories()
 
     def _brand_add(self):
@@ -2577,11 +3224,11 @@ class App(ctk.CTk):
         raw = self.brand_entry.get()
         names = split_catalog_input(raw)
         if not names: return show_error("Введіть назву бренду (через кому для декількох).")
-        for name in names:
-            add_brand(self.current_category_id, name)
+        add_brands(self.current_category_id, names)
+        self._invalidate_catalog_cache("brands", self.current_category_id)
         self.brand_entry.delete(0, tk.END)
         self._refresh_brands(self.current_category_id)
-        self._reload_gen_tree()
+        self._schedule_gen_reload()
 
     def _brand_rename(self):
         if not self.current_brand_id: return show_error("Виберіть бренд.")
@@ -2589,6 +3236,7 @@ class App(ctk.CTk):
         if not name: return show_error("Введіть нову назву бренду.")
         brand_id = self.current_brand_id
         result = rename_brand(brand_id, name)
+        self._invalidate_catalog_cache("brands", self.current_category_id)
         if result is not True:
             if isinstance(result, sqlite3.IntegrityError):
                 show_error("Бренд з такою назвою вже існує.")
@@ -2597,7 +3245,7 @@ class App(ctk.CTk):
         self._refresh_brands(self.current_category_id)
         if brand_id:
             self.after(10, lambda: self._restore_tree_selection("brand", f"brand_{brand_id}"))
-        self._reload_gen_tree()
+        self._schedule_gen_reload()
 
     def _brand_delete(self):
         selection = list(self.brand_tree.selection())
@@ -2610,31 +3258,34 @@ class App(ctk.CTk):
         )
         if not messagebox.askyesno("Підтвердження", prompt):
             return
-        ids = [int(iid.split("_")[1]) for iid in selection]
+        ids = [_iid_id(iid) for iid in selection]
+        delete_brands(ids)
+        self._invalidate_catalog_cache("brands", self.current_category_id)
         for brand_id in ids:
-            delete_brand(brand_id)
+            self._invalidate_catalog_cache("models", brand_id)
         self._refresh_brands(self.current_category_id)
         self._refresh_models(None)
-        self._reload_gen_tree()
+        self._schedule_gen_reload()
 
     def _model_add(self):
         if not self.current_brand_id: return show_error("Спочатку виберіть бренд.")
         raw = self.model_entry.get()
         names = split_catalog_input(raw)
         if not names: return show_error("Введіть назву моделі (через кому для декількох).")
-        for name in names:
-            add_model(self.current_brand_id, name)
+        add_models(self.current_brand_id, names)
+        self._invalidate_catalog_cache("models", self.current_brand_id)
         self.model_entry.delete(0, tk.END)
         self._refresh_models(self.current_brand_id)
-        self._reload_gen_tree()
+        self._schedule_gen_reload()
 
     def _model_rename(self):
         sel = self.model_tree.selection()
         if not sel: return show_error("Виберіть модель.")
-        model_id = int(sel[0].split("_")[1])
+        model_id = _iid_id(sel[0])
         name = self.model_entry.get().strip()
         if not name: return show_error("Введіть нову назву моделі.")
         result = rename_model(model_id, name)
+        self._invalidate_catalog_cache("models", self.current_brand_id)
         if result is not True:
             if isinstance(result, sqlite3.IntegrityError):
                 show_error("Модель з такою назвою вже існує.")
@@ -2642,7 +3293,7 @@ class App(ctk.CTk):
                 show_error("Не вдалося перейменувати модель.")
         self._refresh_models(self.current_brand_id)
         self.after(10, lambda: self._restore_tree_selection("model", f"model_{model_id}"))
-        self._reload_gen_tree()
+        self._schedule_gen_reload()
 
     def _model_delete(self):
         selection = list(self.model_tree.selection())
@@ -2655,17 +3306,17 @@ class App(ctk.CTk):
         )
         if not messagebox.askyesno("Підтвердження", prompt):
             return
-        ids = [int(iid.split("_")[1]) for iid in selection]
+        ids = [_iid_id(iid) for iid in selection]
         brand_id = self.current_brand_id
-        for model_id in ids:
-            delete_model(model_id)
+        delete_models(ids)
+        self._invalidate_catalog_cache("models", brand_id)
         self._refresh_models(brand_id)
-        self._reload_gen_tree()
+        self._schedule_gen_reload()
 
     def _open_specs(self):
         sel = self.model_tree.selection()
         if not sel: return show_error("Виберіть модель.")
-        model_id = int(sel[0].split("_")[1])
+        model_id = _iid_id(sel[0])
         model_name = self.model_tree.item(sel[0], "values")[0]
         SpecsWindow(self, model_id, model_name)
 
@@ -2792,15 +3443,15 @@ class App(ctk.CTk):
         language_code = self._current_template_language
 
         self._set_title_tags_block(category_key, film, language_code, title_value, tags_value)
-        save_title_tags_templates(self.title_tags_templates)
-
-        if category_key is None and film == "default" and not language_code:
+        updates_globals = category_key is None and film == "default" and not language_code
+        if updates_globals:
             self.templates["title_template"] = title_value
             self.templates["tags_template"] = tags_value
-            save_templates(self.templates)
-
-        if show_message:
-            show_info("Шаблони заголовку та тегів збережено.")
+        self._queue_changed_config_saves(
+            templates=updates_globals,
+            title_tags=True,
+            on_saved=partial(show_info, "Шаблони заголовку та тегів збережено.") if show_message else None,
+        )
 
     def _load_title_tags_template(self):
         if not hasattr(self, "title_box") or not hasattr(self, "tags_box"):
@@ -2827,12 +3478,17 @@ class App(ctk.CTk):
                     return value
             return ""
 
-        title_template = _pick(title_map)
-        tags_template = _pick(tags_map)
-        self.title_box.delete("1.0", "end")
-        self.title_box.insert("1.0", title_template)
-        self.tags_box.delete("1.0", "end")
-        self.tags_box.insert("1.0", tags_template)
+        self._set_textbox_text(self.title_box, _pick(title_map))
+        self._set_textbox_text(self.tags_box, _pick(tags_map))
+
+    @staticmethod
+    def _set_textbox_text(box, text: str) -> None:
+        # Rewriting an identical value still resets the undo stack and scroll
+        # position, so only touch the widget when the content really differs.
+        if box.get("1.0", "end-1c") == text:
+            return
+        box.delete("1.0", "end")
+        box.insert("1.0", text)
 
     def _on_template_scope_change(self, _selected_label=None):
         if not hasattr(self, "template_category_var") or not hasattr(self, "template_film_var"):
@@ -2858,85 +3514,74 @@ class App(ctk.CTk):
         self._load_title_tags_template()
         self._load_desc_template()
 
-    def _resolve_desc_template_html(self, category: Optional[str], film: str, language_code: Optional[str]):
-        category_key = category or GLOBAL_DESCRIPTION_KEY
-        film_key = film if film and film != "default" else "default"
+    def _sanitize_desc_templates(self) -> None:
+        """Coerce ``templates["descriptions"]`` into the shape the resolver expects."""
         changed = False
-
-        descs_by_category = self.templates.get("descriptions", {})
+        descs_by_category = self.templates.get("descriptions")
         if not isinstance(descs_by_category, dict):
             descs_by_category = {}
             self.templates["descriptions"] = descs_by_category
             changed = True
-
-        descs = descs_by_category.get(category_key)
-        if not isinstance(descs, dict):
-            descs = {}
-            descs_by_category[category_key] = descs
+        if not isinstance(descs_by_category.get(GLOBAL_DESCRIPTION_KEY), dict):
+            descs_by_category[GLOBAL_DESCRIPTION_KEY] = {}
             changed = True
-
-        if category_key != GLOBAL_DESCRIPTION_KEY:
-            global_descs = descs_by_category.get(GLOBAL_DESCRIPTION_KEY)
-            if not isinstance(global_descs, dict):
-                global_descs = {}
-                descs_by_category[GLOBAL_DESCRIPTION_KEY] = global_descs
+        for category_key, descs in list(descs_by_category.items()):
+            if not isinstance(descs, dict):
+                descs_by_category[category_key] = {}
                 changed = True
-        else:
-            global_descs = descs
+                continue
+            for film_key, entry in list(descs.items()):
+                if entry is None or isinstance(entry, str):
+                    continue
+                normalized = _normalize_template_language_entry(entry)
+                if normalized != entry:
+                    descs[film_key] = normalized
+                    changed = True
+        if changed:
+            self._queue_config_save("templates")
+
+    def _resolve_desc_template_html(self, category: Optional[str], film: str, language_code: Optional[str]) -> str:
+        cache = getattr(self, "_desc_template_cache", None)
+        if cache is None:
+            cache = self._desc_template_cache = {}
+        key = (category, film, language_code)
+        html = cache.get(key)
+        if html is None:
+            html = cache[key] = self._lookup_desc_template_html(category, film, language_code)
+        return html
+
+    def _lookup_desc_template_html(self, category: Optional[str], film: str, language_code: Optional[str]) -> str:
+        category_key = category or GLOBAL_DESCRIPTION_KEY
+        film_key = film if film and film != "default" else "default"
 
-        sources = [descs]
+        descs_by_category = self.templates.get("descriptions", _EMPTY_MAPPING)
+        sources = [descs_by_category.get(category_key, _EMPTY_MAPPING)]
         if category_key != GLOBAL_DESCRIPTION_KEY:
-            sources.append(global_descs)
-
-        raw_entry = None
-        raw_store = None
-        for store in sources:
-            if isinstance(store, dict):
-                candidate = store.get(film_key)
-                if candidate is not None:
-                    raw_entry = candidate
-                    raw_store = store
-                    break
+            sources.append(descs_by_category.get(GLOBAL_DESCRIPTION_KEY, _EMPTY_MAPPING))
 
+        raw_entry = next((store[film_key] for store in sources if store.get(film_key) is not None), None)
         fallback_entry = None
-        fallback_store = None
         if film_key != "default":
-            for store in sources:
-                if isinstance(store, dict):
-                    candidate = store.get("default")
-                    if candidate is not None:
-                        fallback_entry = candidate
-                        fallback_store = store
-                        break
+            fallback_entry = next(
+                (store["default"] for store in sources if store.get("default") is not None), None
+            )
 
         normalized_language = language_code if language_code else None
 
-        def _resolve_entry(entry, key=None, store=None):
-            nonlocal changed
-            value = None
+        def _resolve_entry(entry):
             if isinstance(entry, dict):
-                normalized = _normalize_template_language_entry(entry)
-                if (
-                    key is not None
-                    and store is not None
-                    and isinstance(store, dict)
-                    and normalized is not entry
-                ):
-                    store[key] = normalized
-                    changed = True
-                value = _get_language_template_value(normalized, normalized_language, fallback_value=None)
+                value = _get_language_template_value(entry, normalized_language, fallback_value=None)
                 if value is None and normalized_language:
-                    value = _get_language_template_value(normalized, None, fallback_value=None)
-            elif isinstance(entry, str):
-                value = entry
-            return value
+                    value = _get_language_template_value(entry, None, fallback_value=None)
+                return value
+            if isinstance(entry, str):
+                return entry
+            return None
 
-        html = _resolve_entry(raw_entry, key=film_key, store=raw_store)
+        html = _resolve_entry(raw_entry)
         if html is None and fallback_entry is not None:
-            html = _resolve_entry(fallback_entry, key="default", store=fallback_store)
-        if html is None:
-            html = ""
-        return html, changed
+            html = _resolve_entry(fallback_entry)
+        return html if html is not None else ""
 
     def _load_desc_template(self):
         if not hasattr(self, "desc_box"):
@@ -2948,48 +3593,44 @@ class App(ctk.CTk):
         if hasattr(self, "desc_cat_var"):
             self.desc_cat_var.set(category)
         self._current_desc_category = category
-        html, changed = self._resolve_desc_template_html(category, film, self._current_template_language)
-        if changed:
-            save_templates(self.templates)
+        html = self._resolve_desc_template_html(category, film, self._current_template_language)
+        scope = (category, film, self._current_template_language)
+        # Like the title/tags boxes, compare against the live text too, so reselecting
+        # the same scope still discards unsaved edits.
+        if (
+            scope == getattr(self, "_last_desc_scope", None)
+            and html == getattr(self, "_last_desc_html", None)
+            and self.desc_box.get("1.0", "end-1c") == html
+        ):
+            return
         self.desc_box.configure(state="normal")
-        self.desc_box.delete("1.0", "end")
-        self.desc_box.insert("1.0", html)
+        self._set_textbox_text(self.desc_box, html)
         self._last_desc_html = html
+        self._last_desc_scope = scope
         if hasattr(self, "desc_editor_btn"):
-            can_use_web_editor = DESC_EDITOR_ENTRY.exists()
+            can_use_web_editor = getattr(self, "_desc_editor_ready", False)
             self.desc_editor_btn.configure(state="normal" if can_use_web_editor else "disabled")
 
     def _apply_desc_editor_result(self, category: str, film: str, docs: Dict[str, Dict[str, object]]):
-        descs_by_category = self.templates.setdefault("descriptions", {})
-        if not isinstance(descs_by_category, dict):
-            descs_by_category = {}
-            self.templates["descriptions"] = descs_by_category
-        film_map = descs_by_category.setdefault(category, {})
-        if not isinstance(film_map, dict):
-            film_map = {}
-            descs_by_category[category] = film_map
+        # _sanitize_desc_templates guarantees a dict of dicts here.
+        film_map = self.templates["descriptions"].setdefault(category, {})
         entry = film_map.get(film)
         changed = False
         for lang, doc in docs.items():
-            if not isinstance(doc, dict):
+            if not isinstance(doc, dict) or doc.get("html") is None:
                 continue
-            html_value = doc.get("html")
-            if html_value is None:
-                continue
-            html_text = str(html_value).strip()
             lang_code = lang if isinstance(lang, str) and lang else None
-            entry = _set_language_template_value(entry, lang_code, html_text, fallback_value="")
+            entry = _set_language_template_value(entry, lang_code, str(doc["html"]).strip(), fallback_value="")
             changed = True
         if changed:
             film_map[film] = entry
-            save_templates(self.templates)
+            self._queue_config_save("templates", on_saved=partial(show_info, "Шаблон опису збережено."))
             self._load_desc_template()
-            show_info("Шаблон опису збережено.")
 
     def _on_desc_editor_finished(self) -> None:
         self._active_desc_host = None
         if hasattr(self, "desc_editor_btn"):
-            can_use_web_editor = DESC_EDITOR_ENTRY.exists()
+            can_use_web_editor = getattr(self, "_desc_editor_ready", False)
             self.desc_editor_btn.configure(state="normal" if can_use_web_editor else "disabled")
 
     def _set_desc_editor_status(self, message: str) -> None:
@@ -3067,27 +3708,29 @@ class App(ctk.CTk):
                 f"Деталі: {error}"
             )
 
-    def _poll_desc_editor_result(
+    def _desc_editor_result_arrived(
         self,
         host: DescriptionEditorHost,
         category: str,
         film: str,
-        delay_ms: int = 600,
+        result: Dict[str, Dict[str, object]],
     ) -> None:
-        result = host.poll_result()
-        if result is None:
-            if host.is_running:
-                self.after(delay_ms, lambda: self._poll_desc_editor_result(host, category, film, delay_ms))
-                return
-            host.close()
-            self._on_desc_editor_finished()
+        if host is not getattr(self, "_active_desc_host", None):
             return
-
         host.close()
         self._on_desc_editor_finished()
         if isinstance(result, dict) and result:
             self._apply_desc_editor_result(category, film, result)
 
+    def _watch_desc_editor_host(self, host: DescriptionEditorHost, delay_ms: int = 30000) -> None:
+        if host is not getattr(self, "_active_desc_host", None):
+            return
+        if host.is_running:
+            self.after(delay_ms, lambda: self._watch_desc_editor_host(host, delay_ms))
+            return
+        host.close()
+        self._on_desc_editor_finished()
+
     def _open_desc_editor(self):
         thread = getattr(self, "_desc_editor_prepare_thread", None)
         if thread and thread.is_alive():
@@ -3111,7 +3754,7 @@ class App(ctk.CTk):
             self._on_desc_editor_finished()
         docs: Dict[str, Dict[str, object]] = {}
         for lang in language_codes:
-            html, _ = self._resolve_desc_template_html(category, film, lang)
+            html = self._resolve_desc_template_html(category, film, lang)
             docs[lang] = {
                 "lang": lang,
                 "html": html,
@@ -3120,6 +3763,9 @@ class App(ctk.CTk):
             }
         active_lang = self._current_template_language or language_codes[0]
         host = DescriptionEditorHost(docs, active_lang)
+        host.set_completion_callback(
+            lambda result: self._call_in_ui_thread(self._desc_editor_result_arrived, host, category, film, result)
+        )
         try:
             host.launch()
         except DescriptionEditorError as exc:
@@ -3130,7 +3776,7 @@ class App(ctk.CTk):
         show_info(
             "Редактор відкрито у браузері. Після завершення натисніть 'Зберегти в застосунок' у вкладці браузера."
         )
-        self._poll_desc_editor_result(host, category, film)
+        self._watch_desc_editor_host(host)
 
     def _save_desc_template(self):
         category = getattr(self, "_current_desc_category", None)
@@ -3156,11 +3802,26 @@ class App(ctk.CTk):
         entry = film_map.get(film)
         entry = _set_language_template_value(entry, language_code, txt, fallback_value="")
         film_map[film] = entry
-        save_templates(self.templates)
-        show_info("Шаблон опису збережено.")
+        self._schedule_desc_template_save()
 
     # -------- Параметри (мови + типи плівок)
     def _build_tab_parameters(self):
+        # Вміст вкладки будується при першому відкритті, щоб не гальмувати старт.
+        self._parameters_tab_built = False
+        self._parameters_placeholder = ctk.CTkLabel(self.tab_parameters, text="Завантаження…")
+        self._parameters_placeholder.pack(pady=20)
+
+    def _ensure_parameters_tab(self):
+        if getattr(self, "_parameters_tab_built", True):
+            return
+        self._parameters_tab_built = True
+        placeholder = getattr(self, "_parameters_placeholder", None)
+        if placeholder is not None:
+            placeholder.destroy()
+            self._parameters_placeholder = None
+        self._build_tab_parameters_content()
+
+    def _build_tab_parameters_content(self):
         wrap = ctk.CTkFrame(self.tab_parameters)
         wrap.pack(fill="both", expand=True, padx=10, pady=10)
         wrap.grid_columnconfigure(0, weight=1)
@@ -3180,6 +3841,7 @@ class App(ctk.CTk):
         lang_tree_wrap.grid_columnconfigure(0, weight=1)
         lang_tree_wrap.grid_rowconfigure(0, weight=1)
 
+        self._indexed_tree_rows.pop("lang", None)
         self.language_tree = ttk.Treeview(
             lang_tree_wrap,
             columns=("code", "label"),
@@ -3234,6 +3896,7 @@ class App(ctk.CTk):
         list_frame.grid_rowconfigure(0, weight=1)
         list_frame.grid_columnconfigure(0, weight=1)
 
+        self._indexed_tree_rows.pop("ft", None)
         self.filmtype_tree = ttk.Treeview(
             list_frame,
             columns=("name", "enabled"),
@@ -3278,22 +3941,51 @@ class App(ctk.CTk):
         self._refresh_language_tree(select_index=0 if self.templates.get("template_languages") else None)
         self._refresh_filmtype_tree(select_index=0 if self.templates.get("film_types") else None)
 
+    def _sync_indexed_tree(self, tree, prefix, rows):
+        """Bring a ``<prefix>_<index>`` Treeview in line with ``rows`` touching only changed rows."""
+        selected = tree.selection()
+        if selected:
+            tree.selection_remove(*selected)
+        previous = self._indexed_tree_rows.get(prefix, [])
+        if rows == previous:
+            return
+        # Detach the scrollbar during bulk inserts so it is not updated per row.
+        yscroll = None
+        if len(rows) - len(previous) > 50:
+            yscroll = tree.cget("yscrollcommand")
+            tree.configure(yscrollcommand="")
+        try:
+            for idx, values in enumerate(rows):
+                if idx >= len(previous):
+                    tree.insert("", "end", iid=f"{prefix}_{idx}", values=values)
+                elif previous[idx] != values:
+                    tree.item(f"{prefix}_{idx}", values=values)
+        finally:
+            if yscroll:
+                tree.configure(yscrollcommand=yscroll)
+        if len(previous) > len(rows):
+            tree.delete(*(f"{prefix}_{idx}" for idx in range(len(rows), len(previous))))
+        self._indexed_tree_rows[prefix] = list(rows)
+        self._indexed_tree_iids[prefix] = {f"{prefix}_{idx}": idx for idx in range(len(rows))}
+
     def _refresh_language_tree(self, select_index=None):
         tree = getattr(self, "language_tree", None)
         if tree is None:
             return
-        raw_languages = self.templates.get("template_languages")
-        if not isinstance(raw_languages, list):
-            raw_languages = []
-        normalized = _normalize_language_definitions(raw_languages)
-        if normalized != raw_languages:
-            self.templates["template_languages"] = normalized
-            save_templates(self.templates)
-        tree.delete(*tree.get_children())
-        for idx, item in enumerate(normalized):
-            code = (item.get("code") or "").strip()
-            label = (item.get("label") or "").strip()
-            tree.insert("", "end", iid=f"lang_{idx}", values=(code, label))
+        normalized = self.templates.get("template_languages")
+        if not self._languages_normalized or not isinstance(normalized, list):
+            raw_languages = normalized if isinstance(normalized, list) else []
+            normalized = _normalize_language_definitions(raw_languages)
+            if normalized != raw_languages:
+                self.templates["template_languages"] = normalized
+                self._queue_config_save("templates")
+            self._languages_normalized = True
+        rows = [
+            ((item.get("code") or "").strip(), (item.get("label") or "").strip())
+            for item in normalized
+        ]
+        self._language_codes_lc = {code.lower() for code, _label in rows}
+        self._sync_indexed_tree(tree, "lang", rows)
         if select_index is not None and 0 <= select_index < len(normalized):
             iid = f"lang_{select_index}"
             if tree.exists(iid):
@@ -3320,13 +4012,8 @@ class App(ctk.CTk):
             if hasattr(self, "language_label_var"):
                 self.language_label_var.set("")
             return
-        iid = sel[0]
-        parts = iid.split("_")
-        if len(parts) != 2:
-            return
-        try:
-            idx = int(parts[1])
-        except ValueError:
+        idx = self._indexed_tree_iids.get("lang", {}).get(sel[0])
+        if idx is None:
             return
         languages = self.templates.get("template_languages", [])
         if idx < 0 or idx >= len(languages):
@@ -3348,15 +4035,15 @@ class App(ctk.CTk):
         if not code:
             return show_error("Введіть код мови.")
         languages = self.templates.setdefault("template_languages", [])
-        existing_codes = {str(item.get("code", "")).strip().lower() for item in languages}
-        if code.lower() in existing_codes:
+        if code.lower() in self._language_codes_lc:
             return show_error("Мова з таким кодом вже існує.")
         label = simpledialog.askstring("Нова мова", "Введіть назву мови:", initialvalue=code, parent=self)
         if label is None:
             return
         label = label.strip() or code
         languages.append({"code": code, "label": label})
-        save_templates(self.templates)
+        self._language_codes_lc.add(code.lower())
+        self._queue_config_save("templates")
         self._current_template_language = code
         self._on_languages_changed()
         self._refresh_language_tree(select_index=len(languages) - 1)
@@ -3370,17 +4057,8 @@ class App(ctk.CTk):
             return show_error("Виберіть мову для видалення.")
         if not messagebox.askyesno("Підтвердження", "Видалити вибрану мову?"):
             return
-        indices = []
-        for iid in selection:
-            parts = iid.split("_")
-            if len(parts) != 2:
-                continue
-            try:
-                idx = int(parts[1])
-            except ValueError:
-                continue
-            indices.append(idx)
-        indices = sorted(set(indices), reverse=True)
+        iid_to_idx = self._indexed_tree_iids.get("lang", {})
+        indices = sorted({iid_to_idx[iid] for iid in selection if iid in iid_to_idx}, reverse=True)
         removed_codes = []
         languages = self.templates.get("template_languages", [])
         removed_current = False
@@ -3393,12 +4071,15 @@ class App(ctk.CTk):
                     if code == self._current_template_language:
                         removed_current = True
         if removed_codes:
-            save_templates(self.templates)
-            for code in removed_codes:
-                self._update_language_code_references(code, None)
-            if removed_current:
-                self._current_template_language = None
-            self._on_languages_changed()
+            # Removing the last language needs the defaults restored on refresh.
+            self._languages_normalized = False
+            with self._batched_config_saves():
+                self._queue_config_save("templates")
+                for code in removed_codes:
+                    self._update_language_code_references(code, None)
+                if removed_current:
+                    self._current_template_language = None
+                self._on_languages_changed()
         self._refresh_language_tree(select_index=None)
 
     def _language_apply(self):
@@ -3414,48 +4095,81 @@ class App(ctk.CTk):
             label = code
         old_entry = languages[idx]
         old_code = (old_entry.get("code") or "").strip()
-        if code.lower() != old_code.lower():
-            existing_codes = {str(item.get("code", "")).strip().lower() for i, item in enumerate(languages) if i != idx}
-            if code.lower() in existing_codes:
-                return show_error("Мова з таким кодом вже існує.")
-        languages[idx] = {"code": code, "label": label}
-        save_templates(self.templates)
-        if code != old_code:
-            self._update_language_code_references(old_code, code)
-        if old_code == self._current_template_language:
-            self._current_template_language = code
-        self._on_languages_changed()
+        if code.lower() != old_code.lower() and code.lower() in self._language_codes_lc:
+            return show_error("Мова з таким кодом вже існує.")
+        with self._batched_config_saves():
+            languages[idx] = {"code": code, "label": label}
+            self._queue_config_save("templates")
+            if code != old_code:
+                self._update_language_code_references(old_code, code)
+            if old_code == self._current_template_language:
+                self._current_template_language = code
+            self._on_languages_changed()
         self._refresh_language_tree(select_index=idx)
 
-    def _update_language_code_references(self, old_code: str, new_code: Optional[str]):
-        if not isinstance(old_code, str) or not old_code:
-            return
-        changed_title_tags = False
-
-        def adjust_title_block(block):
-            nonlocal changed_title_tags
-            if not isinstance(block, dict):
-                return
-            for key in ("title_template", "tags_template"):
-                entry = block.get(key)
-                if _rename_language_in_entry(entry, old_code, new_code):
-                    changed_title_tags = True
-
-        adjust_title_block(self.title_tags_templates.get("default"))
+    def _iter_title_tags_blocks(self):
+        yield self.title_tags_templates.get("default")
         by_film = self.title_tags_templates.get("by_film")
         if isinstance(by_film, dict):
-            for film_block in by_film.values():
-                adjust_title_block(film_block)
+            yield from by_film.values()
         by_category = self.title_tags_templates.get("by_category")
         if isinstance(by_category, dict):
             for cat_entry in by_category.values():
                 if not isinstance(cat_entry, dict):
                     continue
-                adjust_title_block(cat_entry.get("default"))
+                yield cat_entry.get("default")
                 films = cat_entry.get("by_film")
                 if isinstance(films, dict):
-                    for film_block in films.values():
-                        adjust_title_block(film_block)
+                    yield from films.values()
+
+    def _collect_referenced_language_codes(self) -> Set[str]:
+        """Return every language code used by title/tags, description and export field configs."""
+        cached = getattr(self, "_referenced_language_codes", None)
+        if cached is not None:
+            return cached
+        codes: Set[str] = set()
+
+        def add_entry(entry):
+            if not isinstance(entry, dict):
+                return
+            languages_block = entry.get("languages")
+            if isinstance(languages_block, dict):
+                codes.update(languages_block)
+            codes.update(key for key, value in entry.items() if isinstance(value, str))
+
+        for block in self._iter_title_tags_blocks():
+            if isinstance(block, dict):
+                add_entry(block.get("title_template"))
+                add_entry(block.get("tags_template"))
+        descriptions = self.templates.get("descriptions")
+        if isinstance(descriptions, dict):
+            for film_map in descriptions.values():
+                if not isinstance(film_map, dict):
+                    continue
+                for entry in film_map.values():
+                    if isinstance(entry, dict):
+                        add_entry(entry)
+                        add_entry(_normalize_template_language_entry(entry))
+        for field in self.export_fields:
+            if not isinstance(field, dict):
+                continue
+            codes.update(_parse_language_codes(field.get("languages")))
+        self._referenced_language_codes = codes
+        return codes
+
+    def _update_language_code_references(self, old_code: str, new_code: Optional[str]):
+        if not isinstance(old_code, str) or not old_code or old_code == new_code:
+            return
+        if old_code not in self._collect_referenced_language_codes():
+            return
+        changed_title_tags = False
+
+        for block in self._iter_title_tags_blocks():
+            if not isinstance(block, dict):
+                continue
+            for key in ("title_template", "tags_template"):
+                if _rename_language_in_entry(block.get(key), old_code, new_code):
+                    changed_title_tags = True
 
         changed_descriptions = False
         descriptions = self.templates.get("descriptions")
@@ -3466,7 +4180,7 @@ class App(ctk.CTk):
                 for film_key, entry in list(film_map.items()):
                     if isinstance(entry, dict):
                         normalized = _normalize_template_language_entry(entry)
-                        if normalized is not entry:
+                        if normalized != entry:
                             film_map[film_key] = normalized
                             entry = normalized
                             changed_descriptions = True
@@ -3502,85 +4216,125 @@ class App(ctk.CTk):
                     field["languages"] = updated_list
                     changed_export_fields = True
 
-        if changed_title_tags:
-            save_title_tags_templates(self.title_tags_templates)
-        if changed_descriptions:
-            save_templates(self.templates)
-        if changed_export_fields:
-            save_export_fields(self.export_fields)
+        self._queue_changed_config_saves(
+            templates=changed_descriptions,
+            title_tags=changed_title_tags,
+            export_fields=changed_export_fields,
+        )
 
     def _on_languages_changed(self):
+        # Callers refresh the language tree themselves with the row to select.
         self._refresh_template_selectors()
         self._refresh_export_language_controls()
         self._refresh_export_fields_tree()
-        self._refresh_language_tree()
 
     def _refresh_export_language_controls(self):
         self._build_export_field_language_checkboxes()
         self._build_generate_language_checkboxes()
-        selected_index = getattr(self, "_export_selected_index", None)
-        if selected_index is not None:
-            self._load_export_field_detail(selected_index)
+        if self._export_selected_index is not None:
+            self._load_export_field_detail(self._export_selected_index)
 
-    def _build_export_field_language_checkboxes(self):
-        frame = getattr(self, "export_field_language_checks_frame", None)
-        if frame is None:
-            return
-        for child in list(frame.winfo_children()):
+    def _sync_language_checkboxes(
+        self,
+        parent,
+        widgets: Dict[str, Tuple[ctk.CTkCheckBox, tk.BooleanVar]],
+        items: List[Tuple[str, str]],
+        default: bool,
+        padx: int,
+        on_change: Optional[Callable[..., None]] = None,
+    ) -> Dict[str, Tuple[ctk.CTkCheckBox, tk.BooleanVar]]:
+        """Reconcile ``widgets`` with ``(code, label)`` items, creating or destroying only the deltas."""
+        target_codes = [code for code, _label in items]
+        wanted = set(target_codes)
+        for code in [code for code in widgets if code not in wanted]:
+            checkbox, _var = widgets.pop(code)
             try:
-                child.destroy()
+                checkbox.destroy()
             except Exception:
                 pass
-        self.export_field_language_vars = {}
-        self.export_field_language_checks = []
-        language_items = self._template_language_items()
-        for label, code in language_items:
-            if not code:
-                continue
-            var = tk.BooleanVar(value=False)
-            checkbox = ctk.CTkCheckBox(frame, text=label, variable=var)
-            checkbox.pack(side="left", padx=4, pady=2)
-            self.export_field_language_vars[code] = var
-            self.export_field_language_checks.append(checkbox)
+        kept_order = [code for code in widgets]
+        in_place = target_codes[: len(kept_order)] == kept_order
+        if not in_place:
+            for checkbox, _var in widgets.values():
+                checkbox.pack_forget()
+        result: Dict[str, Tuple[ctk.CTkCheckBox, tk.BooleanVar]] = {}
+        for code, label in items:
+            entry = widgets.get(code)
+            if entry is None:
+                var = tk.BooleanVar(value=default)
+                if on_change is not None:
+                    var.trace_add("write", on_change)
+                checkbox = ctk.CTkCheckBox(parent, text=label, variable=var)
+                checkbox.pack(side="left", padx=padx, pady=2)
+                entry = (checkbox, var)
+            else:
+                checkbox = entry[0]
+                if checkbox.cget("text") != label:
+                    checkbox.configure(text=label)
+                if not in_place:
+                    checkbox.pack(side="left", padx=padx, pady=2)
+            result[code] = entry
+        return result
+
+    def _build_export_field_language_checkboxes(self):
+        frame = self.export_field_language_checks_frame
+        if frame is None:
+            return
+        items = [(code, label) for label, code in self._template_language_items() if code]
+        if self._export_lang_items == (frame, items):
+            # Nothing to reconcile; field detail loading owns the variable states.
+            return
+        self._export_lang_items = (frame, items)
+        self._export_lang_widgets = self._sync_language_checkboxes(
+            frame,
+            self._export_lang_widgets,
+            items,
+            default=False,
+            padx=4,
+            on_change=self._mark_export_detail_dirty,
+        )
+        self.export_field_language_vars = {code: var for code, (_cb, var) in self._export_lang_widgets.items()}
+        for var in self.export_field_language_vars.values():
+            # Field detail loading re-applies the real state; start cleared as before.
+            var.set(False)
+        self.export_field_language_checks = [cb for cb, _var in self._export_lang_widgets.values()]
 
     def _build_generate_language_checkboxes(self):
         container = getattr(self, "generate_language_checks_container", None)
         if container is None:
             return
-        for child in list(container.winfo_children()):
-            try:
-                child.destroy()
-            except Exception:
-                pass
-        self.export_language_vars = []
-        language_items = self._template_language_items()
-        codes = [code for label, code in language_items if code]
-        if not codes:
-            hint_label = getattr(self, "generate_language_hint", None)
-            if hint_label is not None:
-                hint_label.configure(text="")
-            return
-        for code in codes:
-            label = self._language_label_for_code(code)
-            var = tk.BooleanVar(value=True)
-            checkbox = ctk.CTkCheckBox(container, text=label, variable=var)
-            checkbox.pack(side="left", padx=6, pady=2)
-            self.export_language_vars.append((code, var))
+        items = [(code, label) for label, code in self._template_language_items() if code]
+        if getattr(self, "_gen_lang_items", None) == (container, items):
+            return
+        self._gen_lang_items = (container, items)
+        self._gen_lang_widgets = self._sync_language_checkboxes(
+            container, getattr(self, "_gen_lang_widgets", {}), items, default=True, padx=6
+        )
+        self.export_language_vars = [(code, var) for code, (_cb, var) in self._gen_lang_widgets.items()]
         hint_label = getattr(self, "generate_language_hint", None)
         if hint_label is not None:
-            hint_label.configure(text="Залиште всі позначені, щоб експортувати всі мови.")
+            hint_label.configure(text="Залиште всі позначені, щоб експортувати всі мови." if items else "")
 
 
+    @staticmethod
+    def _build_filmtype_name_index(names) -> Dict[str, int]:
+        """Map lowercased film type names to the position of their first occurrence."""
+        index: Dict[str, int] = {}
+        for position, name in enumerate(names):
+            index.setdefault(name.lower(), position)
+        return index
+
     def _refresh_filmtype_tree(self, select_index=None):
         tree = getattr(self, "filmtype_tree", None)
         if tree is None:
             return
-        tree.delete(*tree.get_children())
         film_types = self.templates.get("film_types", [])
-        for idx, item in enumerate(film_types):
-            name = (item.get("name") or "").strip()
-            enabled = "Так" if item.get("enabled", True) else "Ні"
-            tree.insert("", "end", iid=f"ft_{idx}", values=(name, enabled))
+        rows = [
+            ((item.get("name") or "").strip(), "Так" if item.get("enabled", True) else "Ні")
+            for item in film_types
+        ]
+        self._filmtype_name_index = self._build_filmtype_name_index(name for name, _enabled in rows)
+        self._sync_indexed_tree(tree, "ft", rows)
         if select_index is not None and 0 <= select_index < len(film_types):
             iid = f"ft_{select_index}"
             if tree.exists(iid):
@@ -3603,13 +4357,8 @@ class App(ctk.CTk):
             self.filmtype_name_var.set("")
             self.filmtype_enabled_var.set(True)
             return
-        iid = sel[0]
-        parts = iid.split("_")
-        if len(parts) != 2:
-            return
-        try:
-            idx = int(parts[1])
-        except ValueError:
+        idx = self._indexed_tree_iids.get("ft", {}).get(sel[0])
+        if idx is None:
             return
         film_types = self.templates.get("film_types", [])
         if idx < 0 or idx >= len(film_types):
@@ -3626,13 +4375,12 @@ class App(ctk.CTk):
         new_name = new_name.strip()
         if not new_name:
             return show_error("Введіть назву типу плівки.")
-        existing = {((item.get("name") or "").strip().lower()) for item in self.templates.get("film_types", [])}
-        if new_name.lower() in existing:
+        if new_name.lower() in self._filmtype_name_index:
             return show_error("Тип плівки з такою назвою вже існує.")
-        self.templates.setdefault("film_types", []).append({"name": new_name, "enabled": True})
-        save_templates(self.templates)
-        if self._ensure_title_tags_film(new_name):
-            save_title_tags_templates(self.title_tags_templates)
+        film_types = self.templates.setdefault("film_types", [])
+        film_types.append({"name": new_name, "enabled": True})
+        self._filmtype_name_index[new_name.lower()] = len(film_types) - 1
+        self._queue_changed_config_saves(templates=True, title_tags=self._ensure_title_tags_film(new_name))
         self._refresh_filmtype_tree(select_index=len(self.templates.get("film_types", [])) - 1)
         self._refresh_filmtype_checkboxes()
         self._refresh_template_selectors()
@@ -3646,17 +4394,8 @@ class App(ctk.CTk):
             return show_error("Виберіть тип плівки.")
         if not messagebox.askyesno("Підтвердження", "Видалити вибраний тип плівки?"):
             return
-        indices = []
-        for iid in selection:
-            parts = iid.split("_")
-            if len(parts) != 2:
-                continue
-            try:
-                idx = int(parts[1])
-            except ValueError:
-                continue
-            indices.append(idx)
-        indices = sorted(set(indices), reverse=True)
+        iid_to_idx = self._indexed_tree_iids.get("ft", {})
+        indices = sorted({iid_to_idx[iid] for iid in selection if iid in iid_to_idx}, reverse=True)
         removed_names = []
         for idx in indices:
             film_types = self.templates.get("film_types", [])
@@ -3666,11 +4405,12 @@ class App(ctk.CTk):
                 if name:
                     removed_names.append(name)
         if removed_names:
-            save_templates(self.templates)
-            for name in removed_names:
-                self._remove_film_type_templates(name)
-                if self._current_film_type_key == name:
-                    self._current_film_type_key = "default"
+            with self._batched_config_saves():
+                self._queue_config_save("templates")
+                for name in removed_names:
+                    self._remove_film_type_templates(name)
+                    if self._current_film_type_key == name:
+                        self._current_film_type_key = "default"
         self._current_filmtype_index = None
         self.filmtype_name_var.set("")
         self.filmtype_enabled_var.set(True)
@@ -3686,22 +4426,21 @@ class App(ctk.CTk):
         new_name = self.filmtype_name_var.get().strip()
         if not new_name:
             return show_error("Введіть назву типу плівки.")
-        for pos, item in enumerate(film_types):
-            if pos != idx and (item.get("name") or "").strip().lower() == new_name.lower():
-                return show_error("Тип плівки з такою назвою вже існує.")
         old_name = film_types[idx].get("name", "")
+        other = self._filmtype_name_index.get(new_name.lower())
+        if other is not None and other != idx:
+            return show_error("Тип плівки з такою назвою вже існує.")
         film_types[idx]["name"] = new_name
         film_types[idx]["enabled"] = bool(self.filmtype_enabled_var.get())
-        save_templates(self.templates)
-        if new_name != old_name:
-            self._rename_film_type(old_name, new_name)
-            if self._current_film_type_key == old_name:
-                self._current_film_type_key = new_name
-        self._ensure_title_tags_film(new_name)
-        save_title_tags_templates(self.title_tags_templates)
+        with self._batched_config_saves():
+            self._queue_config_save("templates", "title_tags")
+            if new_name != old_name:
+                self._rename_film_type(old_name, new_name)
+                if self._current_film_type_key == old_name:
+                    self._current_film_type_key = new_name
+            self._ensure_title_tags_film(new_name)
         self._refresh_filmtype_tree(select_index=idx)
-        self._refresh_filmtype_checkboxes()
-        self._refresh_template_selectors()
+        self._schedule_refresh("filmtype_checkboxes", "template_selectors")
         show_info("Тип плівки оновлено.")
 
     # -------- Експортні поля
@@ -3717,6 +4456,7 @@ class App(ctk.CTk):
         list_frame.grid_rowconfigure(0, weight=1)
         list_frame.grid_columnconfigure(0, weight=1)
 
+        self._indexed_tree_rows.pop("exp", None)
         self.export_fields_tree = ttk.Treeview(
             list_frame,
             columns=("field", "enabled"),
@@ -3748,6 +4488,8 @@ class App(ctk.CTk):
 
         self.export_field_name_var = tk.StringVar(value="")
         self.export_field_enabled_var = tk.BooleanVar(value=False)
+        self.export_field_name_var.trace_add("write", self._mark_export_detail_dirty)
+        self.export_field_enabled_var.trace_add("write", self._mark_export_detail_dirty)
 
         ctk.CTkLabel(detail, text="Назва поля").pack(anchor="w", padx=10, pady=(8, 0))
         self.export_field_name_entry = ctk.CTkEntry(detail, textvariable=self.export_field_name_var)
@@ -3803,6 +4545,7 @@ class App(ctk.CTk):
             text_color="#888888",
         )
         self.export_template_status.pack(fill="x", padx=10, pady=(0, 8))
+        self._export_template_last_text = None
         self._update_template_status("")
 
         action_row = ctk.CTkFrame(detail)
@@ -3854,6 +4597,10 @@ class App(ctk.CTk):
             status_var.set(message)
 
     def _files_export_all(self):
+        # Check before the file dialog so a second backup is refused before the user picks a file.
+        if getattr(self, "_files_export_running", False):
+            show_info("Резервна копія ще зберігається. Дочекайтеся завершення.")
+            return
         self._export_apply_detail(False)
         self._save_title_tags(show_message=False)
 
@@ -3867,24 +4614,41 @@ class App(ctk.CTk):
         if not file_path:
             return
 
-        try:
-            export_all_data_to_excel(
-                file_path,
-                self.templates,
-                self.title_tags_templates,
-                self.export_fields,
-            )
-        except DataTransferError as exc:
-            self._files_set_status(f"Помилка експорту: {exc.message}")
-            return show_error(f"Помилка експорту (код {exc.code}): {exc.message}")
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.exception("Unexpected error during data export")
-            self._files_set_status("Сталася непередбачена помилка під час експорту.")
-            return show_error(f"Не вдалося зберегти дані: {exc}")
+        # Snapshot the configs so edits made while the workbook is written do not race with it.
+        templates = _clone_json(self.templates)
+        title_tags = _clone_json(self.title_tags_templates)
+        export_fields = _clone_json(self.export_fields)
+        self._files_export_running = True
+        self._files_set_status("Збереження резервної копії...")
 
+        def worker():
+            try:
+                export_all_data_to_excel(file_path, templates, title_tags, export_fields)
+            except DataTransferError as exc:
+                self._call_in_ui_thread(self._on_files_export_failed, exc)
+                return
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.exception("Unexpected error during data export")
+                self._call_in_ui_thread(self._on_files_export_failed, exc)
+                return
+            self._call_in_ui_thread(self._on_files_export_done, file_path)
+
+        self._start_background_task(worker, name="files-export")
+
+    def _on_files_export_done(self, file_path: str):
+        self._files_export_running = False
         self._files_set_status(f"Дані збережено у файл: {file_path}")
         show_info("Резервну копію успішно створено.")
 
+    def _on_files_export_failed(self, exc: Exception):
+        self._files_export_running = False
+        if isinstance(exc, DataTransferError):
+            self._files_set_status(f"Помилка експорту: {exc.message}")
+            show_error(f"Помилка експорту (код {exc.code}): {exc.message}")
+            return
+        self._files_set_status("Сталася непередбачена помилка під час експорту.")
+        show_error(f"Не вдалося зберегти дані: {exc}")
+
     def _files_import_all(self):
         self._export_apply_detail(False)
 
@@ -3901,6 +4665,8 @@ class App(ctk.CTk):
         ):
             return
 
+        self._flush_config_saves()
+
         try:
             result = import_all_data_from_excel(file_path)
         except DataTransferError as exc:
@@ -3914,71 +4680,80 @@ class App(ctk.CTk):
         self.templates = result.get("templates", self.templates)
         self.title_tags_templates = result.get("title_tags_templates", self.title_tags_templates)
         self.export_fields = result.get("export_fields", self.export_fields)
-
-        self._refresh_categories()
-        self._refresh_language_tree(select_index=0 if self.templates.get("template_languages") else None)
-        self._refresh_filmtype_tree(select_index=0 if self.templates.get("film_types") else None)
-        self._refresh_filmtype_checkboxes()
-        self._refresh_template_selectors()
-        self._load_title_tags_template()
-        self._load_desc_template()
-        self._refresh_export_fields_tree(select_index=0 if self.export_fields else None)
-        if self.export_fields:
-            self._load_export_field_detail(0)
-        else:
-            self._load_export_field_detail(None)
+        self._invalidate_template_caches()
+        self._languages_normalized = True
+        self._sanitize_desc_templates()
+
+        self._invalidate_catalog_cache()
+        self._schedule_refresh(
+            "categories",
+            "language_tree",
+            "filmtype_tree",
+            "filmtype_checkboxes",
+            "template_selectors",
+            "title_tags",
+            "description",
+            "export_fields",
+        )
 
         self._files_set_status(f"Дані імпортовано з файлу: {file_path}")
         show_info("Дані успішно імпортовано.")
 
     def _refresh_export_fields_tree(self, select_index=None):
-        tree = getattr(self, "export_fields_tree", None)
+        tree = self.export_fields_tree
         if tree is None:
             return
         self._export_tree_updating = True
-        tree.delete(*tree.get_children())
-        for idx, field in enumerate(self.export_fields):
-            name = str(field.get("field", "")).strip()
-            languages = field.get("languages", [])
-            display_name = name
-            codes = []
-            if isinstance(languages, str):
-                lang_code = languages.strip()
-                if lang_code:
-                    codes.append(lang_code)
-            elif isinstance(languages, (list, tuple, set)):
-                seen_langs = set()
-                for lang in languages:
-                    if not isinstance(lang, str):
-                        continue
-                    code = lang.strip()
-                    if not code or code in seen_langs:
-                        continue
-                    codes.append(code)
-                    seen_langs.add(code)
-            if codes:
-                labels = [self._language_label_for_code(code) for code in codes]
-                display_name = f"{name} ({', '.join(labels)})"
-            status = "Так" if field.get("enabled") else "Ні"
-            tree.insert("", "end", iid=f"exp_{idx}", values=(display_name, status))
+        row_for = self._export_field_row
+        rows = [row_for(field) for field in self.export_fields]
+        self._sync_indexed_tree(tree, "exp", rows)
         if select_index is not None and 0 <= select_index < len(self.export_fields):
             iid = f"exp_{select_index}"
             tree.selection_set(iid)
             tree.focus(iid)
         self._export_tree_updating = False
 
+    def _export_field_row(self, field) -> Tuple[str, str]:
+        """Return the ``(display_name, status)`` tree row for an export field, memoized per field shape."""
+        get = field.get
+        name = str(get("field", "")).strip()
+        languages = get("languages", [])
+        if isinstance(languages, (list, tuple, set)):
+            languages_key = tuple(languages)
+        else:
+            languages_key = languages
+        enabled = bool(get("enabled"))
+        key = (name, languages_key, enabled)
+        cache = self._export_row_cache
+        if cache is None:
+            cache = self._export_row_cache = {}
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            key = None
+        display_name = name
+        codes = _parse_language_codes(languages)
+        if codes:
+            label_map = self._language_labels()
+            display_name = f"{name} ({', '.join([label_map.get(code, code) for code in codes])})"
+        row = (display_name, "Так" if enabled else "Ні")
+        if key is not None:
+            cache[key] = row
+        return row
+
     def _set_export_detail_state(self, enabled: bool):
         state = tk.NORMAL if enabled else tk.DISABLED
-        if hasattr(self, "export_field_name_entry"):
+        if self.export_field_name_entry is not None:
             self.export_field_name_entry.configure(state=state)
-        if hasattr(self, "export_field_enabled_check"):
+        if self.export_field_enabled_check is not None:
             self.export_field_enabled_check.configure(state=state)
-        if hasattr(self, "export_field_language_checks"):
-            for checkbox in self.export_field_language_checks:
-                checkbox.configure(state=state)
-        if hasattr(self, "export_apply_button"):
+        for checkbox in self.export_field_language_checks:
+            checkbox.configure(state=state)
+        if self.export_apply_button is not None:
             self.export_apply_button.configure(state=state)
-        if hasattr(self, "export_field_template"):
+        if self.export_field_template is not None:
             self.export_field_template.configure(state="normal" if enabled else "disabled")
         self._update_template_status()
 
@@ -3986,76 +4761,51 @@ class App(ctk.CTk):
         if index is None or index < 0 or index >= len(self.export_fields):
             self._export_selected_index = None
             self._set_export_detail_state(False)
-            if hasattr(self, "export_field_name_var"):
+            if self.export_field_name_var is not None:
                 self.export_field_name_var.set("")
-            if hasattr(self, "export_field_enabled_var"):
+            if self.export_field_enabled_var is not None:
                 self.export_field_enabled_var.set(False)
-            if hasattr(self, "export_field_language_vars"):
+            try:
                 for var in self.export_field_language_vars.values():
-                    try:
-                        var.set(False)
-                    except Exception:
-                        pass
+                    var.set(False)
+            except Exception:
+                pass
             self._export_unknown_language_codes = []
-            if hasattr(self, "export_language_hint_label"):
-                default_hint = getattr(self, "_export_language_hint_default", None)
-                if default_hint is not None:
-                    self.export_language_hint_label.configure(text=default_hint)
-            if hasattr(self, "export_field_template"):
+            if self.export_language_hint_label is not None:
+                self.export_language_hint_label.configure(text=self._export_language_hint_default)
+            if self.export_field_template is not None:
                 self.export_field_template.configure(state="normal")
                 self.export_field_template.delete("1.0", "end")
                 self.export_field_template.configure(state="disabled")
             self._update_template_status("")
+            self._export_detail_dirty = False
             return
 
         self._export_selected_index = index
         field = self.export_fields[index]
-        name = str(field.get("field", ""))
-        template = field.get("template", "")
+        get = field.get
+        name = str(get("field", ""))
+        template = get("template", "")
         if template is None:
             template = ""
-        enabled = bool(field.get("enabled"))
+        enabled = bool(get("enabled"))
 
         self._set_export_detail_state(True)
         self.export_field_name_var.set(name)
         self.export_field_enabled_var.set(enabled)
-        language_vars = getattr(self, "export_field_language_vars", {})
-        unknown_codes = []
-        if isinstance(language_vars, dict):
-            for var in language_vars.values():
-                try:
-                    var.set(False)
-                except Exception:
-                    pass
-        languages_value = field.get("languages", [])
-        parsed_languages = []
-        if isinstance(languages_value, str):
-            code = languages_value.strip()
-            if code:
-                parsed_languages.append(code)
-        elif isinstance(languages_value, (list, tuple, set)):
-            seen_codes = set()
-            for lang in languages_value:
-                if not isinstance(lang, str):
-                    continue
-                code = lang.strip()
-                if not code or code in seen_codes:
-                    continue
-                parsed_languages.append(code)
-                seen_codes.add(code)
-        if isinstance(language_vars, dict):
-            for code in parsed_languages:
-                var = language_vars.get(code)
-                if var is not None:
-                    try:
-                        var.set(True)
-                    except Exception:
-                        pass
-                else:
-                    unknown_codes.append(code)
+        language_vars = self.export_field_language_vars
+        codes = _parse_language_codes(get("languages", []))
+        unknown_codes = [code for code in codes if code not in language_vars]
+        wanted = set(codes)
+        # Setting a var only fails once Tcl is gone, so guard the whole pass.
+        try:
+            for code, var in language_vars.items():
+                var.set(code in wanted)
+        except Exception:
+            pass
         self._export_unknown_language_codes = unknown_codes
-        if hasattr(self, "export_language_hint_label"):
-            default_hint = getattr(self, "_export_language_hint_default", "")
+        if self.export_language_hint_label is not None:
+            default_hint = self._export_language_hint_default
             if unknown_codes:
                 extras = ", ".join(sorted(unknown_codes))
                 hint_text = f"{default_hint}\nНевідомі коди збережено: {extras}"
@@ -4067,11 +4817,12 @@ class App(ctk.CTk):
         self.export_field_template.insert("1.0", str(template))
         self.export_field_template.edit_modified(False)
         self._update_template_status(template)
+        self._export_detail_dirty = False
 
     def _on_export_field_select(self, _event):
-        if getattr(self, "_export_tree_updating", False):
+        if self._export_tree_updating or self.export_fields_tree is None:
             return
-        selection = self.export_fields_tree.selection() if hasattr(self, "export_fields_tree") else []
+        selection = self.export_fields_tree.selection()
         if not selection:
             self._load_export_field_detail(None)
             return
@@ -4100,10 +4851,27 @@ class App(ctk.CTk):
             widget.edit_modified(False)
         except Exception:
             pass
-        text = widget.get("1.0", "end").rstrip()
-        self._update_template_status(text)
+        self._export_detail_dirty = True
+        after_fn = getattr(self, "after", None)
+        if after_fn is None or not callable(after_fn):
+            self._update_template_status(widget.get("1.0", "end").rstrip())
+            return
+        # Validation compiles the template, so run it once typing pauses.
+        self._cancel_template_status_job()
+        self._template_validate_job = after_fn(250, self._update_template_status)
+
+    def _cancel_template_status_job(self) -> None:
+        job = getattr(self, "_template_validate_job", None)
+        if job is None:
+            return
+        self._template_validate_job = None
+        try:
+            self.after_cancel(job)
+        except Exception:
+            pass
 
     def _update_template_status(self, template_text: str | None = None):
+        self._cancel_template_status_job()
         label = getattr(self, "export_template_status", None)
         if label is None:
             return
@@ -4113,41 +4881,24 @@ class App(ctk.CTk):
                 template_text = ""
             else:
                 template_text = widget.get("1.0", "end").rstrip()
+        if template_text == getattr(self, "_export_template_last_text", None):
+            return
+        self._export_template_last_text = template_text
         message, color = self._analyze_template_text(template_text)
         label.configure(text=message, text_color=color)
 
     def _analyze_template_text(self, template_text: str):
-        trimmed = template_text.strip()
-        if not trimmed:
-            return (
-                "Введіть формулу (=IF(...)) або шаблон Jinja2. Аргументи формули розділяйте ';'.",
-                "#888888",
-            )
-        if _looks_like_formula(trimmed):
-            try:
-                info = FormulaEngine.describe(trimmed)
-            except FormulaError as exc:
-                return (f"❌ Помилка формули: {exc}", "#c94a4a")
-            variables = sorted(info.get("variables", []))
-            if variables:
-                vars_text = ", ".join(variables)
-                hint = f"Змінні: {vars_text}"
-            else:
-                hint = "Змінні не використовуються."
-            return (f"✅ Формула валідна. {hint}", "#4c9a2a")
-        try:
-            Template(trimmed)
-        except TemplateError as exc:
-            return (f"❌ Помилка шаблону Jinja2: {exc}", "#c94a4a")
-        return (
-            "ℹ️ Використовується шаблон Jinja2. Доступні змінні: {{ brand }}, {{ model }}, {{ category }}, {{ film_type }}, {{ title }}, {{ description }}, {{ tags }}, {{ row_number }}, {{ now }}.",
-            "#888888",
-        )
+        return _analyze_template_source(template_text.strip())
+
+    def _mark_export_detail_dirty(self, *_args) -> None:
+        self._export_detail_dirty = True
 
     def _export_apply_detail(self, save_to_file: bool):
-        idx = getattr(self, "_export_selected_index", None)
+        idx = self._export_selected_index
         if idx is None or idx < 0 or idx >= len(self.export_fields):
             return False
+        if not save_to_file and not self._export_detail_dirty:
+            return True
         field = self.export_fields[idx]
         name = self.export_field_name_var.get().strip()
         if not name:
@@ -4155,17 +4906,14 @@ class App(ctk.CTk):
             self.export_field_name_var.set(name)
         template = self.export_field_template.get("1.0", "end").rstrip()
         enabled = bool(self.export_field_enabled_var.get())
-        language_vars = getattr(self, "export_field_language_vars", {})
         selected_languages = []
-        if isinstance(language_vars, dict):
-            for code, var in language_vars.items():
-                try:
-                    if var.get():
-                        selected_languages.append(code)
-                except Exception:
-                    continue
-        extra_codes = getattr(self, "_export_unknown_language_codes", []) or []
-        for code in extra_codes:
+        for code, var in self.export_field_language_vars.items():
+            try:
+                if var.get():
+                    selected_languages.append(code)
+            except Exception:
+                continue
+        for code in self._export_unknown_language_codes:
             if not isinstance(code, str):
                 continue
             stripped = code.strip()
@@ -4178,14 +4926,14 @@ class App(ctk.CTk):
         if trimmed_template:
             if _looks_like_formula(trimmed_template):
                 try:
-                    FormulaEngine.describe(trimmed_template)
+                    _describe_formula_cached(trimmed_template)
                 except FormulaError as exc:
                     show_error(f"Помилка у формулі: {exc}")
                     self._update_template_status(template)
                     return False
             else:
                 try:
-                    Template(trimmed_template)
+                    _compile_jinja_cached(trimmed_template)
                 except TemplateError as exc:
                     show_error(f"Помилка у шаблоні Jinja2: {exc}")
                     self._update_template_status(template)
@@ -4201,22 +4949,7 @@ class App(ctk.CTk):
         if bool(field.get("enabled")) != enabled:
             field["enabled"] = enabled
             changed = True
-        existing_languages = []
-        raw_existing_languages = field.get("languages", [])
-        if isinstance(raw_existing_languages, str):
-            code = raw_existing_languages.strip()
-            if code:
-                existing_languages.append(code)
-        elif isinstance(raw_existing_languages, (list, tuple, set)):
-            seen_codes = set()
-            for lang in raw_existing_languages:
-                if not isinstance(lang, str):
-                    continue
-                code = lang.strip()
-                if not code or code in seen_codes:
-                    continue
-                existing_languages.append(code)
-                seen_codes.add(code)
+        existing_languages = _parse_language_codes(field.get("languages", []))
         if existing_languages != field_languages:
             field["languages"] = field_languages
             changed = True
@@ -4228,16 +4961,16 @@ class App(ctk.CTk):
         if changed:
             self._refresh_export_fields_tree(select_index=idx)
 
+        self._export_detail_dirty = False
+
         if save_to_file:
-            save_export_fields(self.export_fields)
-            show_info("Налаштування експорту збережено.")
+            self._queue_config_save("export_fields", on_saved=partial(show_info, "Налаштування експорту збережено."))
 
         return True
 
     def _export_save_all(self):
         self._export_apply_detail(False)
-        save_export_fields(self.export_fields)
-        show_info("Налаштування експорту збережено.")
+        self._queue_config_save("export_fields", on_saved=partial(show_info, "Налаштування експорту збережено."))
 
     def _export_add_field(self):
         self._export_apply_detail(False)
@@ -4247,12 +4980,21 @@ class App(ctk.CTk):
         self._refresh_export_fields_tree(select_index=idx)
         self._load_export_field_detail(idx)
 
+    def _confirm_for_session(self, key: str, message: str) -> bool:
+        if key in self._session_confirmed:
+            return True
+        dialog = SessionConfirmDialog(self, "Підтвердження", message)
+        self.wait_window(dialog)
+        if dialog.result and dialog.skip_for_session:
+            self._session_confirmed.add(key)
+        return dialog.result
+
     def _export_delete_field(self):
-        idx = getattr(self, "_export_selected_index", None)
+        idx = self._export_selected_index
         if idx is None or idx < 0 or idx >= len(self.export_fields):
             show_error("Оберіть поле для видалення.")
             return
-        if not messagebox.askyesno("Підтвердження", "Видалити вибране поле?"):
+        if not self._confirm_for_session("export_delete_field", "Видалити вибране поле?"):
             return
         self.export_fields.pop(idx)
         if self.export_fields:
@@ -4264,7 +5006,7 @@ class App(ctk.CTk):
             self._load_export_field_detail(None)
 
     def _export_move_field(self, direction: int):
-        idx = getattr(self, "_export_selected_index", None)
+        idx = self._export_selected_index
         if idx is None:
             return
         new_idx = idx + direction
@@ -4276,16 +5018,11 @@ class App(ctk.CTk):
         self._load_export_field_detail(new_idx)
 
     def _export_reset_defaults(self):
-        if not messagebox.askyesno("Підтвердження", "Відновити стандартний список полів?"):
+        if not self._confirm_for_session("export_reset_defaults", "Відновити стандартний список полів?"):
             return
         self.export_fields = _copy_default_export_fields()
-        save_export_fields(self.export_fields)
-        if self.export_fields:
-            self._refresh_export_fields_tree(select_index=0)
-            self._load_export_field_detail(0)
-        else:
-            self._refresh_export_fields_tree(select_index=None)
-            self._load_export_field_detail(None)
+        self._queue_config_save("export_fields")
+        self._schedule_refresh("export_fields")
         show_info("Стандартні поля відновлено.")
 
     def _collect_selected_export_languages(self):
@@ -4415,6 +5152,8 @@ class App(ctk.CTk):
         self._gen_tree.bind("<Button-1>", self._on_gen_tree_click, add="+")
         self._gen_tree.bind("<space>", self._toggle_selected_gen_node)
         self._gen_tree.bind("<Return>", self._toggle_selected_gen_node)
+        self._gen_tree.bind("<<TreeviewOpen>>", self._on_gen_tree_open)
+        self._gen_tree.bind("<<TreeviewClose>>", self._on_gen_tree_close)
 
         controls = ctk.CTkFrame(left)
         controls.pack(fill="x", padx=10, pady=(0, 8))
@@ -4502,7 +5241,7 @@ class App(ctk.CTk):
         types_scroll.pack(fill="both", expand=True, padx=8, pady=8)
         types_scroll.bind("<Configure>", self._on_film_types_resize)
         self._film_types_scroll = types_scroll
-        self.ft_vars = []
+        self.ft_vars: List[Tuple[str, tk.BooleanVar]] = []
 
         action_row = ctk.CTkFrame(right)
         action_row.pack(fill="x", padx=10, pady=(6, 0))
@@ -4577,12 +5316,13 @@ class App(ctk.CTk):
         normalized_time = time_text.replace(" ", "")
         if ":" not in normalized_time and "." in normalized_time:
             normalized_time = normalized_time.replace(".", ":")
-        candidate = f"{date_text} {normalized_time}"
-        for fmt in ("%d.%m.%Y %H:%M", "%d.%m.%Y %H.%M"):
+        match = _GEN_FILTER_DATETIME_RE.fullmatch(f"{date_text} {normalized_time}")
+        if match:
+            day, month, year, hour, minute = map(int, match.groups())
             try:
-                return datetime.strptime(candidate, fmt)
+                return datetime(year, month, day, hour, minute)
             except ValueError:
-                continue
+                pass
         raise ValueError(
             f"Невірний формат для поля '{label}'. Використовуйте 'дд.мм.рррр' та 'гг.хх'."
         )
@@ -4626,16 +5366,7 @@ class App(ctk.CTk):
         text = raw.strip()
         if not text:
             return None
-        try:
-            return datetime.fromisoformat(text)
-        except ValueError:
-            pass
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
-            try:
-                return datetime.strptime(text, fmt)
-            except ValueError:
-                continue
-        return None
+        return _parse_db_timestamp_cached(text)
 
     def _gen_filter_matches(
         self,
@@ -4655,16 +5386,24 @@ class App(ctk.CTk):
         return True
 
     def _queue_progress_update(self, current: int, total: int, stage: str) -> None:
-        self._ensure_background_primitives()
-        if not hasattr(self, "_progress_lock"):
+        after_fn = getattr(self, "after", None)
+        if after_fn is None or not callable(after_fn):
+            self._progress_update(current, total, stage=stage)
             return
-        with self._progress_lock:
-            now = time.time()
-            last = getattr(self, "_last_progress_update", 0.0)
-            if current not in (0, total) and now - last < 0.05:
-                return
-            self._last_progress_update = now
-        self._call_in_ui_thread(self._progress_update, current, total, stage=stage)
+        # Rebinding is atomic, so the worker needs no lock; intermediate values are simply dropped.
+        self._pending_progress = (current, total, stage)
+
+    def _apply_pending_progress(self) -> None:
+        pending = self._pending_progress
+        if pending is None or pending is self._applied_progress:
+            return
+        self._applied_progress = pending
+        current, total, stage = pending
+        self._progress_update(current, total, stage=stage)
+
+    def _clear_pending_progress(self) -> None:
+        self._pending_progress = None
+        self._applied_progress = None
 
     def _queue_progress_message(self, message: str) -> None:
         self._call_in_ui_thread(self._progress_message, message)
@@ -4682,8 +5421,7 @@ class App(ctk.CTk):
         self._ensure_background_primitives()
         self._generation_task_running = False
         self._active_generation_thread = None
-        with self._progress_lock:
-            self._last_progress_update = 0.0
+        self._clear_pending_progress()
         self._set_generate_controls_state(True)
 
     def _schedule_progress_idle(self, delay_ms: int = 1800) -> None:
@@ -4723,7 +5461,6 @@ class App(ctk.CTk):
             else:
                 text = f"{stage}: {current}"
             label.configure(text=text)
-        self.update_idletasks()
 
     def _progress_message(self, message: str):
         label = getattr(self, "progress_label", None)
@@ -4743,70 +5480,80 @@ class App(ctk.CTk):
             label.configure(text=message)
         self.update_idletasks()
 
+    def _schedule_gen_reload(self) -> None:
+        if self._gen_reload_job:
+            try:
+                self.after_cancel(self._gen_reload_job)
+            except Exception:
+                pass
+        self._gen_reload_job = self.after(120, self._flush_gen_reload)
+
+    def _flush_gen_reload(self) -> None:
+        self._gen_reload_job = None
+        self._reload_gen_tree()
+
+    def _gen_tab_visible(self) -> bool:
+        tabs = getattr(self, "tabs", None)
+        return tabs is None or tabs.get() == "Генерація"
+
     def _reload_gen_tree(self):
         tree = getattr(self, "_gen_tree", None)
         if tree is None:
             return
+        if not self._gen_tab_visible():
+            # The tree walks the whole catalog; fill it when the tab is opened.
+            self._gen_tree_stale = True
+            return
+        self._gen_tree_stale = False
 
         prev_checked = self._collect_checked_model_ids()
-        prev_open = set()
-
-        def _gather_open(iid):
-            if tree.item(iid, "open"):
-                prev_open.add(iid)
-            for child in tree.get_children(iid):
-                _gather_open(child)
-
-        for root_iid in tree.get_children(""):
-            _gather_open(root_iid)
-
-        tree.delete(*tree.get_children(""))
+        prev_open = set(self._gen_tree_open)
+        self._gen_tree_open.clear()
+
+        # Every root in the model is rendered, so the Tk query for them is not needed.
+        tree.delete(*self._gen_tree_children.get("", ()))
+        self._gen_tree_rendered.clear()
+        self._gen_tree_stubbed.clear()
+        self._checked_model_ids.clear()
         self._gen_tree_states.clear()
-        self._gen_tree_meta.clear()
+        self._gen_tree_model_ids.clear()
         self._gen_tree_labels.clear()
-
-        def _clean_label(value):
-            if isinstance(value, str):
-                return value.strip()
-            if value is None:
-                return ""
-            return str(value)
-
-        def _split_meta(row):
-            if not row:
-                return None, None, None
-            rid = row[0]
-            name = row[1] if len(row) > 1 else None
-            created = row[2] if len(row) > 2 else None
-            if isinstance(name, str):
-                name = name.strip()
-            if isinstance(created, str):
-                created = created.strip()
-            return rid, name, created
+        self._gen_tree_children.clear()
+        self._gen_tree_parents.clear()
+        self._gen_tree_child_counts.clear()
+
+        def _add_node(iid, parent, label):
+            self._gen_tree_labels[iid] = label
+            self._gen_tree_states[iid] = 0
+            self._gen_tree_children[iid] = []
+            self._gen_tree_children[parent].append(iid)
+            self._gen_tree_child_counts[iid] = {"total": 0, "checked": 0, "partial": 0}
+            if parent:
+                self._gen_tree_parents[iid] = parent
+                self._gen_tree_child_counts[parent]["total"] += 1
 
         filter_range = self._get_gen_filter_range()
-        range_active = False
-        if isinstance(filter_range, tuple) and len(filter_range) == 2:
-            range_active = bool(filter_range[0] or filter_range[1])
+        # Without a date bound every node matches; skip the per-node timestamp checks.
+        range_active = filter_range[0] is not None or filter_range[1] is not None
 
-        for cat_row in get_categories(include_created=True):
-            cat_id, cat_name, cat_created = _split_meta(cat_row)
+        self._gen_tree_children[""] = []
+        # One joined query, reused by filter changes; rows arrive grouped by category, then brand.
+        for cat_row, cat_rows in groupby(self._cached_catalog_rows("tree"), key=itemgetter(0, 1, 2)):
+            cat_id, cat_label, cat_created = _catalog_node(*cat_row)
             if cat_id is None:
                 continue
-            label = _clean_label(cat_name)
-            cat_matches = self._gen_filter_matches(cat_created, filter_range)
+            cat_matches = not range_active or self._gen_filter_matches(cat_created, filter_range)
             brand_nodes = []
 
-            for brand_row in get_brands(cat_id, include_created=True):
-                brand_id, brand_name, brand_created = _split_meta(brand_row)
+            for brand_row, brand_rows in groupby(cat_rows, key=itemgetter(3, 4, 5)):
+                brand_id, brand_label, brand_created = _catalog_node(*brand_row)
                 if brand_id is None:
                     continue
                 models_raw = []
-                for model_row in get_models(brand_id, include_created=True):
-                    model_id, model_name, model_created = _split_meta(model_row)
-                    if model_id is None:
-                        continue
-                    models_raw.append((model_id, model_name, model_created))
+                for row in brand_rows:
+                    model = _catalog_node(*row[6:])
+                    if model[0] is not None:
+                        models_raw.append(model)
                 if not range_active:
                     models_to_show = models_raw
                 else:
@@ -4815,124 +5562,151 @@ class App(ctk.CTk):
                         for mid, mname, mcreated in models_raw
                         if self._gen_filter_matches(mcreated, filter_range)
                     ]
-                brand_matches = self._gen_filter_matches(brand_created, filter_range)
+                brand_matches = not range_active or self._gen_filter_matches(brand_created, filter_range)
                 if not models_to_show and not brand_matches:
                     continue
-                brand_nodes.append((brand_id, brand_name, brand_created, models_to_show))
+                brand_nodes.append((brand_id, brand_label, models_to_show))
 
             if not brand_nodes and not cat_matches:
                 continue
 
             cat_iid = f"cat_{cat_id}"
-            self._gen_tree_labels[cat_iid] = label
-            self._gen_tree_states[cat_iid] = 0
-            self._gen_tree_meta[cat_iid] = {
-                "type": "category",
-                "id": cat_id,
-                "created_at": cat_created,
-            }
-            tree.insert("", "end", iid=cat_iid, text=f"{self._state_symbol(0)} {label}")
-
-            if not brand_nodes:
-                continue
+            _add_node(cat_iid, "", cat_label)
 
-            for brand_id, brand_name, brand_created, models_to_show in brand_nodes:
-                b_label = _clean_label(brand_name)
+            for brand_id, brand_label, models_to_show in brand_nodes:
                 brand_iid = f"brand_{brand_id}"
-                self._gen_tree_labels[brand_iid] = b_label
-                self._gen_tree_states[brand_iid] = 0
-                self._gen_tree_meta[brand_iid] = {
-                    "type": "brand",
-                    "id": brand_id,
-                    "category_id": cat_id,
-                    "created_at": brand_created,
-                }
-                tree.insert(cat_iid, "end", iid=brand_iid, text=f"{self._state_symbol(0)} {b_label}")
-
-                for model_id, model_name, model_created in models_to_show:
-                    m_label = _clean_label(model_name)
+                _add_node(brand_iid, cat_iid, brand_label)
+                for model_id, model_label, _model_created in models_to_show:
                     model_iid = f"model_{model_id}"
-                    self._gen_tree_labels[model_iid] = m_label
-                    self._gen_tree_states[model_iid] = 0
-                    self._gen_tree_meta[model_iid] = {
-                        "type": "model",
-                        "id": model_id,
-                        "brand_id": brand_id,
-                        "category_id": cat_id,
-                        "created_at": model_created,
-                    }
-                    tree.insert(brand_iid, "end", iid=model_iid, text=f"{self._state_symbol(0)} {m_label}")
-
-        if not prev_open:
-            roots = tree.get_children("")
-            if roots:
-                tree.item(roots[0], open=True)
-        else:
-            for iid in prev_open:
-                if tree.exists(iid):
-                    tree.item(iid, open=True)
-
-        for mid in sorted(prev_checked):
-            iid = f"model_{mid}"
-            if tree.exists(iid):
-                self._set_gen_tree_state(iid, 2, propagate=False)
-                self._update_parent_states(iid)
+                    _add_node(model_iid, brand_iid, model_label)
+                    self._gen_tree_model_ids[model_iid] = model_id
+
+        restored = [iid for iid in (f"model_{mid}" for mid in sorted(prev_checked)) if iid in self._gen_tree_states]
+        for iid in restored:
+            self._set_gen_tree_state(iid, 2, propagate=False)
+        self._refresh_gen_parent_states(restored)
+
+        with self._detached_tree_scroll(tree):
+            # Only categories go into Tk up front; brands and models are inserted when opened.
+            self._insert_gen_tree_nodes("", self._gen_tree_children[""])
+            if not prev_open:
+                roots = self._gen_tree_children[""]
+                if roots:
+                    self._open_gen_tree_node(roots[0])
+            else:
+                for iid in prev_open:
+                    if iid in self._gen_tree_labels:
+                        self._open_gen_tree_node(iid)
 
-    def _state_symbol(self, state: int) -> str:
-        if state == 2:
-            return "☑"
-        if state == 1:
-            return "◪"
-        return "☐"
+    @staticmethod
+    @contextmanager
+    def _detached_tree_scroll(tree):
+        """Unhook a Treeview's scrollbars for the block so bulk edits do not update them per row."""
+        yscroll = tree.cget("yscrollcommand")
+        xscroll = tree.cget("xscrollcommand")
+        tree.configure(yscrollcommand="", xscrollcommand="")
+        try:
+            yield
+        finally:
+            tree.configure(yscrollcommand=yscroll, xscrollcommand=xscroll)
+
+    def _insert_gen_tree_nodes(self, parent: str, iids: Sequence[str]) -> None:
+        tree = self._gen_tree
+        for iid in iids:
+            state = self._gen_tree_states.get(iid, 0)
+            tree.insert(parent, "end", iid=iid, text=f"{_STATE_SYMBOLS[state]} {self._gen_tree_labels.get(iid, '')}")
+            self._gen_tree_rendered.add(iid)
+            if self._gen_tree_children.get(iid):
+                # Placeholder child so Tk draws the expander.
+                tree.insert(iid, "end", iid=f"{iid}:stub")
+                self._gen_tree_stubbed.add(iid)
+
+    def _materialize_gen_tree_node(self, iid: str) -> None:
+        """Make sure ``iid`` and its direct children exist as Treeview items."""
+        if iid not in self._gen_tree_rendered:
+            parent = self._gen_tree_parents.get(iid)
+            if parent is None:
+                return
+            self._materialize_gen_tree_node(parent)
+        if iid in self._gen_tree_stubbed:
+            self._gen_tree_stubbed.discard(iid)
+            self._gen_tree.delete(f"{iid}:stub")
+            self._insert_gen_tree_nodes(iid, self._gen_tree_children.get(iid, ()))
+
+    def _open_gen_tree_node(self, iid: str) -> None:
+        self._materialize_gen_tree_node(iid)
+        if iid in self._gen_tree_rendered:
+            self._gen_tree.item(iid, open=True)
+            self._gen_tree_open.add(iid)
+
+    def _on_gen_tree_open(self, _event=None):
+        iid = self._gen_tree.focus()
+        if iid in self._gen_tree_children:
+            self._materialize_gen_tree_node(iid)
+            self._gen_tree_open.add(iid)
+
+    def _on_gen_tree_close(self, _event=None):
+        self._gen_tree_open.discard(self._gen_tree.focus())
 
     def _set_gen_tree_state(self, iid: str, state: int, propagate: bool = False):
-        tree = getattr(self, "_gen_tree", None)
-        if tree is None or not tree.exists(iid):
-            return
-        self._gen_tree_states[iid] = state
-        label = self._gen_tree_labels.get(iid, tree.item(iid, "text"))
-        display = f"{self._state_symbol(state)} {label}"
-        tree.item(iid, text=display)
+        previous = self._gen_tree_states.get(iid)
+        if previous is None:
+            return
+        if previous != state:
+            self._gen_tree_states[iid] = state
+            model_id = self._gen_tree_model_ids.get(iid)
+            if model_id is not None:
+                if state == 2:
+                    self._checked_model_ids.add(model_id)
+                else:
+                    self._checked_model_ids.discard(model_id)
+            parent = self._gen_tree_parents.get(iid)
+            if parent:
+                counts = self._gen_tree_child_counts[parent]
+                for value, delta in ((previous, -1), (state, 1)):
+                    if value == 2:
+                        counts["checked"] += delta
+                    elif value == 1:
+                        counts["partial"] += delta
+            if iid in self._gen_tree_rendered:
+                self._gen_tree.item(iid, text=f"{_STATE_SYMBOLS[state]} {self._gen_tree_labels[iid]}")
         if propagate:
-            for child in tree.get_children(iid):
-                self._set_gen_tree_state(child, state, propagate=True)
+            pending = list(self._gen_tree_children.get(iid, ()))
+            while pending:
+                child = pending.pop()
+                self._set_gen_tree_state(child, state)
+                pending.extend(self._gen_tree_children.get(child, ()))
 
     def _update_parent_states(self, iid: str):
-        tree = getattr(self, "_gen_tree", None)
-        if tree is None:
-            return
-        parent = tree.parent(iid)
-        if not parent:
-            return
-        child_states = [self._gen_tree_states.get(child, 0) for child in tree.get_children(parent)]
-        if all(state == 2 for state in child_states):
-            new_state = 2
-        elif all(state == 0 for state in child_states):
-            new_state = 0
-        else:
-            new_state = 1
-        self._set_gen_tree_state(parent, new_state, propagate=False)
-        self._update_parent_states(parent)
+        parent = self._gen_tree_parents.get(iid)
+        while parent:
+            new_state = self._derive_gen_parent_state(parent)
+            if new_state == self._gen_tree_states.get(parent, 0):
+                break
+            self._set_gen_tree_state(parent, new_state, propagate=False)
+            parent = self._gen_tree_parents.get(parent)
+
+    def _derive_gen_parent_state(self, parent: str) -> int:
+        counts = self._gen_tree_child_counts[parent]
+        if counts["checked"] == counts["total"]:
+            return 2
+        if counts["checked"] == 0 and counts["partial"] == 0:
+            return 0
+        return 1
+
+    def _refresh_gen_parent_states(self, iids: Sequence[str]) -> None:
+        """Recompute the ancestors of ``iids`` once per level instead of once per changed node."""
+        parents = {self._gen_tree_parents[iid] for iid in iids if iid in self._gen_tree_parents}
+        while parents:
+            for parent in parents:
+                self._set_gen_tree_state(parent, self._derive_gen_parent_state(parent), propagate=False)
+            parents = {self._gen_tree_parents[iid] for iid in parents if iid in self._gen_tree_parents}
 
     def _collect_checked_model_ids(self):
-        ids = set()
-        for iid, state in self._gen_tree_states.items():
-            if state != 2:
-                continue
-            meta = self._gen_tree_meta.get(iid)
-            if meta and meta.get("type") == "model":
-                mid = meta.get("id")
-                if mid:
-                    try:
-                        ids.add(int(mid))
-                    except (TypeError, ValueError):
-                        continue
-        return ids
+        return set(self._checked_model_ids)
 
     def _on_gen_tree_click(self, event):
-        tree = getattr(self, "_gen_tree", None)
-        if tree is None:
-            return
+        tree = self._gen_tree
         iid = tree.identify_row(event.y)
         if not iid:
             return
@@ -4942,9 +5716,7 @@ class App(ctk.CTk):
         self._toggle_gen_tree_node(iid)
 
     def _toggle_selected_gen_node(self, event=None):
-        tree = getattr(self, "_gen_tree", None)
-        if tree is None:
-            return "break"
+        tree = self._gen_tree
         iid = tree.focus()
         if not iid:
             selection = tree.selection()
@@ -4963,40 +5735,25 @@ class App(ctk.CTk):
         self._set_gen_tree_state(iid, new_state, propagate=True)
         self._update_parent_states(iid)
 
-    def _set_gen_tree_open_recursive(self, iid: str, value: bool):
-        tree = getattr(self, "_gen_tree", None)
-        if tree is None or not tree.exists(iid):
-            return
-        tree.item(iid, open=value)
-        for child in tree.get_children(iid):
-            self._set_gen_tree_open_recursive(child, value)
-
     def _expand_all_gen_tree(self):
-        tree = getattr(self, "_gen_tree", None)
-        if tree is None:
-            return
-        for iid in tree.get_children(""):
-            self._set_gen_tree_open_recursive(iid, True)
+        # Parents are registered before their children, so one ordered pass opens top-down.
+        with self._detached_tree_scroll(self._gen_tree):
+            for iid, children in self._gen_tree_children.items():
+                if iid and children:
+                    self._open_gen_tree_node(iid)
 
     def _collapse_all_gen_tree(self):
-        tree = getattr(self, "_gen_tree", None)
-        if tree is None:
-            return
-        for iid in tree.get_children(""):
-            self._set_gen_tree_open_recursive(iid, False)
+        tree = self._gen_tree
+        for iid in self._gen_tree_open:
+            tree.item(iid, open=False)
+        self._gen_tree_open.clear()
 
     def _select_all_gen_tree(self):
-        tree = getattr(self, "_gen_tree", None)
-        if tree is None:
-            return
-        for iid in tree.get_children(""):
+        for iid in self._gen_tree_children.get("", ()):
             self._set_gen_tree_state(iid, 2, propagate=True)
 
     def _clear_all_gen_tree(self):
-        tree = getattr(self, "_gen_tree", None)
-        if tree is None:
-            return
-        for iid in tree.get_children(""):
+        for iid in self._gen_tree_children.get("", ()):
             self._set_gen_tree_state(iid, 0, propagate=True)
 
     def _set_generate_controls_state(self, enabled: bool) -> None:
@@ -5039,14 +5796,7 @@ class App(ctk.CTk):
             except Exception:
                 continue
 
-        for filmtype in getattr(self, "ft_vars", []):
-            widget = None
-            if isinstance(filmtype, dict):
-                widget = filmtype.get("widget")
-            elif isinstance(filmtype, (list, tuple)) and len(filmtype) >= 3:
-                widget = filmtype[2]
-            if widget is None:
-                continue
+        for widget in getattr(self, "_film_type_cbs", {}).values():
             try:
                 widget.configure(state=state)
             except Exception:
@@ -5099,12 +5849,10 @@ class App(ctk.CTk):
                 widget.destroy()
                 self._film_type_vars.pop(name, None)
 
-        self.ft_vars = [
-            {"name": name, "var": self._film_type_vars[name], "widget": self._film_type_cbs[name]}
-            for name in self._film_type_order
-        ]
+        self.ft_vars = [(name, self._film_type_vars[name]) for name in self._film_type_order]
 
     def _relayout_film_types(self) -> None:
+        self._film_layout_job = None
         parent = self._film_types_scroll
         if parent is None:
             return
@@ -5115,8 +5863,7 @@ class App(ctk.CTk):
         if cols == self._film_types_cols:
             return
         self._film_types_cols = cols
-        for cb in self._film_type_cbs.values():
-            cb.grid_forget()
+        # grid() on a managed widget moves it in place; every slot is reassigned below, so no forget pass.
         for c in range(cols):
             parent.grid_columnconfigure(c, weight=1)
         for i, name in enumerate(self._film_type_order):
@@ -5135,7 +5882,16 @@ class App(ctk.CTk):
                 pass
         self._film_layout_job = self.after(80, self._relayout_film_types)
 
-    def _on_film_types_resize(self, _event=None) -> None:
+    def _on_film_types_resize(self, event=None) -> None:
+        # Height-only changes cannot alter the column count.
+        width = getattr(event, "width", None)
+        if width is not None:
+            if width == self._film_types_width:
+                return
+            self._film_types_width = width
+        # A pending relayout reads the width when it runs, so drag events need not re-arm it.
+        if self._film_layout_job:
+            return
         self._schedule_film_types_relayout()
 
     def _refresh_filmtype_checkboxes(self):
@@ -5143,8 +5899,13 @@ class App(ctk.CTk):
         if frame is None:
             return
         film_types = self.templates.get("film_types", []) if isinstance(self.templates, dict) else []
+        previous_order = list(getattr(self, "_film_type_order", []))
         self._build_film_type_checkboxes(frame, film_types)
-        self._schedule_film_types_relayout()
+        # Existing checkboxes are reused, so the grid only needs redoing when the set or order changed.
+        if self._film_type_order != previous_order:
+            # New checkboxes need gridding even when the column count stays the same.
+            self._film_types_cols = None
+            self._schedule_film_types_relayout()
         self._refresh_template_selectors()
 
     def _choose_folder(self):
@@ -5155,79 +5916,57 @@ class App(ctk.CTk):
             save_settings(self.settings)
 
     def _collect_generation_context(self) -> Optional[Dict[str, object]]:
-        entries = getattr(self, "ft_vars", [])
-        selected_types = []
-        for entry in entries:
-            name = None
-            var = None
-            if isinstance(entry, dict):
-                name = entry.get("name")
-                var = entry.get("var")
-            elif isinstance(entry, (list, tuple)) and len(entry) >= 2:
-                name, var = entry[0], entry[1]
-            if isinstance(name, str) and hasattr(var, "get") and callable(getattr(var, "get")):
-                try:
-                    if var.get():
-                        selected_types.append(name)
-                except Exception:
-                    continue
+        # One read per checkbox; None marks a variable that could not be read.
+        states: List[Tuple[str, Optional[bool]]] = []
+        for name, var in getattr(self, "ft_vars", []):
+            try:
+                states.append((name, bool(var.get())))
+            except Exception:
+                states.append((name, None))
+        selected_types = [name for name, checked in states if checked]
         if not selected_types:
             show_error("Оберіть хоча б один тип плівки.")
             return None
 
         film_types_store = self.templates.get("film_types") if isinstance(self.templates, dict) else None
+        enabled_changed = False
         if isinstance(film_types_store, list):
-            for entry in entries:
-                name = None
-                var = None
-                if isinstance(entry, dict):
-                    name = entry.get("name")
-                    var = entry.get("var")
-                elif isinstance(entry, (list, tuple)) and len(entry) >= 2:
-                    name, var = entry[0], entry[1]
-                if not isinstance(name, str) or not hasattr(var, "get"):
+            items_by_name: Dict[str, dict] = {}
+            for item in film_types_store:
+                if isinstance(item, dict):
+                    items_by_name.setdefault(item.get("name"), item)
+            for name, checked in states:
+                item = items_by_name.get(name)
+                if item is None:
                     continue
-                for item in film_types_store:
-                    if isinstance(item, dict) and item.get("name") == name:
-                        try:
-                            item["enabled"] = bool(var.get())
-                        except Exception:
-                            item["enabled"] = True
-                        break
-        save_templates(self.templates)
-
-        selected_models = sorted(self._collect_checked_model_ids())
+                enabled = True if checked is None else checked
+                if item.get("enabled") is not enabled:
+                    item["enabled"] = enabled
+                    enabled_changed = True
+        # Re-running with the same film types leaves templates.json untouched.
+        if enabled_changed:
+            self._queue_config_save("templates")
+
+        # collect_models orders rows by name, so the id order does not matter here.
+        selected_models = self._collect_checked_model_ids()
         selected_languages = self._collect_selected_export_languages()
         if self._template_language_codes() and self.export_language_vars and not selected_languages:
             show_error("Оберіть хоча б одну мову експорту.")
             return None
 
         export_format = self.export_fmt_var.get() if hasattr(self, "export_fmt_var") else "JSON (.json)"
-        default_export_dir = str(get_default_export_dir())
-        output_folder_raw = self.out_folder_var.get().strip() if hasattr(self, "out_folder_var") else default_export_dir
-        if not output_folder_raw:
-            output_folder = default_export_dir
-        else:
-            candidate = Path(output_folder_raw).expanduser()
-            if candidate.is_dir():
-                output_folder = str(candidate)
-            else:
-                output_folder = default_export_dir
-        if hasattr(self, "out_folder_var"):
-            try:
-                self.out_folder_var.set(output_folder)
-            except Exception:
-                pass
+        # Resolved by the export worker: the directory probe can block on slow or network drives.
+        output_folder_raw = self.out_folder_var.get().strip() if hasattr(self, "out_folder_var") else ""
 
         context: Dict[str, object] = {
             "film_types": list(selected_types),
-            "templates": deepcopy(self.templates),
-            "title_tags": deepcopy(self.title_tags_templates),
-            "export_fields": deepcopy(self.export_fields),
+            "templates": _clone_json(self.templates),
+            "title_tags": _clone_json(self.title_tags_templates),
+            "export_fields": _clone_json(self.export_fields),
             "selected_models": list(selected_models),
             "selected_languages": list(selected_languages),
             "export_format": export_format,
-            "output_folder": output_folder,
+            "output_folder": output_folder_raw,
         }
         return context
 
@@ -5242,35 +5981,31 @@ class App(ctk.CTk):
         self._show_preview_window(columns, preview_records, total_count)
         self._schedule_progress_idle()
 
-    def _show_preview_window(
-        self,
-        columns: Sequence[str],
-        preview_records: Sequence[Sequence[str]],
-        total_count: int,
-    ) -> None:
-        existing = getattr(self, "_preview_window", None)
-        if existing is not None:
+    def _ensure_preview_window(self) -> Dict[str, object]:
+        """Return the preview window widgets, building them only when missing or destroyed."""
+        widgets = self._preview_widgets
+        if widgets is not None:
             try:
-                if existing.winfo_exists():
-                    existing.destroy()
+                if widgets["window"].winfo_exists():
+                    return widgets
             except Exception:
                 pass
 
         preview_window = ctk.CTkToplevel(self)
         preview_window.title("Попередній перегляд генерації")
         preview_window.geometry("960x480")
-        self._preview_window = preview_window
+        # Closing only hides the window; the next preview refills the same widgets.
+        preview_window.protocol("WM_DELETE_WINDOW", preview_window.withdraw)
 
-        info_text = f"Показано перші {len(preview_records)} з {total_count} рядків."
-        ctk.CTkLabel(preview_window, text=info_text, anchor="w").pack(fill="x", padx=14, pady=(12, 4))
+        info_label = ctk.CTkLabel(preview_window, text="", anchor="w")
+        info_label.pack(fill="x", padx=14, pady=(12, 4))
 
         table_frame = ctk.CTkFrame(preview_window)
         table_frame.pack(fill="both", expand=True, padx=14, pady=(0, 14))
         table_frame.grid_columnconfigure(0, weight=1)
         table_frame.grid_rowconfigure(0, weight=1)
 
-        column_ids = [f"preview_col_{idx}" for idx in range(len(columns))]
-        tree = ttk.Treeview(table_frame, columns=column_ids, show="headings")
+        tree = ttk.Treeview(table_frame, show="headings")
         tree.grid(row=0, column=0, sticky="nsew")
 
         y_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=tree.yview)
@@ -5279,23 +6014,59 @@ class App(ctk.CTk):
         x_scroll.grid(row=1, column=0, sticky="ew")
         tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
 
-        for col_id, header in zip(column_ids, columns):
-            tree.heading(col_id, text=header)
-            tree.column(col_id, anchor="w", stretch=True, width=160)
-
         tree.tag_configure("odd", background="#20242b")
         tree.tag_configure("even", background="#151921")
 
-        for idx, record in enumerate(preview_records):
-            values = _row_to_values(record, columns)
+        note_label = ctk.CTkLabel(preview_window, text="", anchor="w")
+        close_button = ctk.CTkButton(preview_window, text="Закрити", command=preview_window.withdraw)
+        close_button.pack(pady=(0, 12))
+
+        widgets = {
+            "window": preview_window,
+            "info": info_label,
+            "tree": tree,
+            "note": note_label,
+            "close": close_button,
+        }
+        self._preview_widgets = widgets
+        return widgets
+
+    def _show_preview_window(
+        self,
+        columns: Sequence[str],
+        preview_records: Sequence[Sequence[str]],
+        total_count: int,
+    ) -> None:
+        widgets = self._ensure_preview_window()
+        preview_window = widgets["window"]
+        tree = widgets["tree"]
+
+        widgets["info"].configure(text=f"Показано перші {len(preview_records)} з {total_count} рядків.")
+
+        tree.delete(*tree.get_children())
+        columns = list(columns)
+        # Repeated previews usually share a header row; keep the configured columns then.
+        if widgets.get("columns") != columns:
+            column_ids = [f"preview_col_{idx}" for idx in range(len(columns))]
+            tree.configure(columns=column_ids)
+            for col_id, header in zip(column_ids, columns):
+                tree.heading(col_id, text=header)
+                tree.column(col_id, anchor="w", stretch=True, width=160)
+            widgets["columns"] = columns
+
+        for idx, values in enumerate(_iter_row_values(preview_records, columns)):
             tag = "odd" if idx % 2 else "even"
             tree.insert("", "end", values=values, tags=(tag,))
 
+        note_label = widgets["note"]
         if total_count > len(preview_records):
-            note = f"(Доступно більше рядків: всього {total_count}.)"
-            ctk.CTkLabel(preview_window, text=note, anchor="w").pack(fill="x", padx=14, pady=(0, 10))
+            note_label.configure(text=f"(Доступно більше рядків: всього {total_count}.)")
+            note_label.pack(fill="x", padx=14, pady=(0, 10), before=widgets["close"])
+        else:
+            note_label.pack_forget()
 
-        ctk.CTkButton(preview_window, text="Закрити", command=preview_window.destroy).pack(pady=(0, 12))
+        preview_window.deiconify()
+        preview_window.lift()
 
     def _preview_generation(self):
         self._ensure_background_primitives()
@@ -5312,19 +6083,23 @@ class App(ctk.CTk):
         self._set_generate_controls_state(False)
         self._progress_reset("Готуємо попередній перегляд...")
         self._progress_message("Генеруємо попередній перегляд…")
-        with self._progress_lock:
-            self._last_progress_update = 0.0
+        self._clear_pending_progress()
 
         preview_limit = 20
 
         def worker() -> None:
+            # Кожна пара (модель, тип плівки) дає рівно один рядок, тож загальну
+            # кількість знаємо з першого виклику прогресу без генерації всіх рядків.
+            expected_total = [0]
             try:
                 def progress_callback(current: int, total: int) -> None:
+                    expected_total[0] = total
                     self._queue_progress_update(current, total, stage="Попередній перегляд")
 
                 extra_kwargs: Dict[str, object] = {
                     "languages": context.get("selected_languages"),
                     "progress_callback": progress_callback,
+                    "limit": preview_limit,
                 }
                 if context.get("selected_models"):
                     extra_kwargs["model_ids"] = context.get("selected_models")
@@ -5354,9 +6129,8 @@ class App(ctk.CTk):
                 )
                 return
 
-            total_count = len(records)
-            preview_records = records[:preview_limit]
-            self._call_in_ui_thread(lambda: self._on_preview_ready(columns, preview_records, total_count))
+            total_count = max(expected_total[0], len(records))
+            self._call_in_ui_thread(lambda: self._on_preview_ready(columns, records, total_count))
 
         self._active_generation_thread = self._start_background_task(worker, name="preview-generation")
 
@@ -5377,8 +6151,7 @@ class App(ctk.CTk):
         self._generation_task_running = True
         self._set_generate_controls_state(False)
         self._progress_message("Генерація даних...")
-        with self._progress_lock:
-            self._last_progress_update = 0.0
+        self._clear_pending_progress()
 
         def worker() -> None:
             try:
@@ -5418,12 +6191,16 @@ class App(ctk.CTk):
                 return
 
             self._queue_progress_message("Експорт файлів...")
+            output_folder_raw = context.get("output_folder", "")
+            output_folder = _resolve_output_folder(output_folder_raw)
+            if output_folder != output_folder_raw:
+                self._call_in_ui_thread(self._set_output_folder_var, output_folder)
             try:
                 products_file = export_products(
                     records,
                     columns,
                     context.get("export_format", "JSON (.json)"),
-                    context.get("output_folder", os.getcwd()),
+                    output_folder,
                 )
             except ExportError as exc:
                 self._queue_generation_error(
@@ -5444,6 +6221,11 @@ class App(ctk.CTk):
 
         self._active_generation_thread = self._start_background_task(worker, name="generate-products")
 
+    def _set_output_folder_var(self, folder: str) -> None:
+        var = getattr(self, "out_folder_var", None)
+        if var is not None:
+            var.set(folder)
+
     def _on_generation_success(self, row_count: int, products_file: str) -> None:
         self._progress_finish(f"Готово: {row_count} рядків")
         self._finalize_generation_task()
@@ -2,10 +2,10 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from functools import partial
 from typing import Any, Callable, Dict, Optional
 
 import tkinter as tk
-import tkinter.font as tkfont
 from tkinter import colorchooser, filedialog, messagebox, ttk
 import logging
 
@@ -13,9 +13,12 @@ import customtkinter as ctk
 
 from app_paths import get_data_dir
 from settings_service import default_settings, normalize_hex_color
+from ui.theme_manager import font_families
 
 logger = logging.getLogger(__name__)
 
+_LISTBOX_COLOR_KEYS = ("widget_fg", "text", "selection_bg", "selection_text", "border")
+
 
 class SettingsDialog(ctk.CTkToplevel):
     def __init__(
@@ -41,20 +44,36 @@ class SettingsDialog(ctk.CTkToplevel):
         self._parent = parent
         self._on_apply = on_apply
         self._default_settings = default_settings()
+        self._default_palettes: Dict[str, Dict[str, str]] = {
+            profile: theme["colors"] for profile, theme in self._default_settings["themes"].items()
+        }
         self._draft_settings = deepcopy(current_settings)
         self._color_errors: set[str] = set()
         self._color_entries: Dict[str, ctk.CTkEntry] = {}
         self._color_swatches: Dict[str, ctk.CTkFrame] = {}
         self._color_error_labels: Dict[str, ctk.CTkLabel] = {}
         self._entry_border_colors: Dict[str, str] = {}
+        # Last shown validation result per color key: the normalized color, or None for an error.
+        self._color_entry_states: Dict[str, Optional[str]] = {}
+        self._action_buttons_state: Optional[str] = None
+        self._listbox_theme_signature: Optional[tuple] = None
+        # Pending debounced <KeyRelease> validations by color key.
+        self._color_validation_jobs: Dict[str, str] = {}
         self._colors_scroll: Optional[ctk.CTkScrollableFrame] = None
         self._fonts_scroll: Optional[ctk.CTkScrollableFrame] = None
+        self._active_scroll_canvas: Optional[tk.Canvas] = None
+        self._font_family_var: Optional[tk.StringVar] = None
+        self._font_base_var: Optional[tk.StringVar] = None
+        self._font_heading_var: Optional[tk.StringVar] = None
 
         self.protocol("WM_DELETE_WINDOW", self._on_cancel)
         self.bind("<Escape>", self._on_cancel_event)
         self.bind("<Control-s>", self._on_apply_shortcut)
         self.bind("<Control-S>", self._on_apply_shortcut)
         self.bind("<Return>", self._on_ok_shortcut)
+        # Wheel events reach the Toplevel's bindtag from every descendant; one handler serves both scrolls.
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind(sequence, self._on_mousewheel)
 
         self._build_ui()
         self._select_category("Загальні")
@@ -89,10 +108,15 @@ class SettingsDialog(ctk.CTkToplevel):
             self._category_list.activate(0)
 
         self._panels: Dict[str, ctk.CTkFrame] = {}
+        self._current_panel: Optional[str] = None
+        # The colors and fonts panels hold most of the dialog's widgets; build them on first visit.
+        self._panel_parent = right
+        self._panel_builders: Dict[str, Callable[[ctk.CTkFrame], None]] = {
+            "Кольори": self._build_colors_panel,
+            "Шрифти": self._build_fonts_panel,
+        }
         self._build_general_panel(right)
         self._build_appearance_panel(right)
-        self._build_colors_panel(right)
-        self._build_fonts_panel(right)
 
         footer = ctk.CTkFrame(self)
         footer.pack(fill="x", padx=12, pady=(0, 12))
@@ -115,7 +139,6 @@ class SettingsDialog(ctk.CTkToplevel):
 
     def _build_general_panel(self, parent: ctk.CTkFrame) -> None:
         panel = ctk.CTkFrame(parent)
-        panel.pack(fill="both", expand=True)
         self._panels["Загальні"] = panel
 
         info_frame = ctk.CTkFrame(panel)
@@ -145,7 +168,6 @@ class SettingsDialog(ctk.CTkToplevel):
 
     def _build_appearance_panel(self, parent: ctk.CTkFrame) -> None:
         panel = ctk.CTkFrame(parent)
-        panel.pack(fill="both", expand=True)
         self._panels["Оформлення"] = panel
 
         appearance_frame = ctk.CTkFrame(panel)
@@ -181,11 +203,8 @@ class SettingsDialog(ctk.CTkToplevel):
 
     def _build_colors_panel(self, parent: ctk.CTkFrame) -> None:
         panel = ctk.CTkFrame(parent)
-        panel.pack(fill="both", expand=True)
         self._panels["Кольори"] = panel
 
-        self._color_vars: Dict[str, tk.StringVar] = {}
-
         top_actions = ctk.CTkFrame(panel)
         top_actions.pack(fill="x", padx=12, pady=(12, 6))
         top_actions.grid_columnconfigure(0, weight=1)
@@ -193,13 +212,13 @@ class SettingsDialog(ctk.CTkToplevel):
         copy_dark_btn = ctk.CTkButton(
             top_actions,
             text="Скопіювати dark → light",
-            command=lambda: self._copy_profile_colors("dark", "light"),
+            command=partial(self._copy_profile_colors, "dark", "light"),
         )
         copy_dark_btn.grid(row=0, column=0, sticky="w", padx=8, pady=8)
         copy_light_btn = ctk.CTkButton(
             top_actions,
             text="Скопіювати light → dark",
-            command=lambda: self._copy_profile_colors("light", "dark"),
+            command=partial(self._copy_profile_colors, "light", "dark"),
         )
         copy_light_btn.grid(row=0, column=1, sticky="w", padx=8, pady=8)
         reset_profile_btn = ctk.CTkButton(
@@ -213,7 +232,6 @@ class SettingsDialog(ctk.CTkToplevel):
         scroll.pack(fill="both", expand=True, padx=12, pady=(0, 12))
         scroll.grid_columnconfigure(1, weight=1)
         self._colors_scroll = scroll
-        self._bind_scrollwheel(scroll)
 
         sections = [
             (
@@ -271,44 +289,43 @@ class SettingsDialog(ctk.CTkToplevel):
                     padx=(12, 6),
                     pady=(6, 2),
                 )
-                var = tk.StringVar()
-                entry = ctk.CTkEntry(scroll, textvariable=var)
+                # No textvariable: the entry is read and written directly, without Tcl variable traces.
+                entry = ctk.CTkEntry(scroll)
                 entry.grid(row=row_index, column=1, sticky="ew", padx=6, pady=(6, 2))
-                entry.bind("<KeyRelease>", lambda _event, color_key=key: self._validate_color_entry(color_key))
-                entry.bind("<FocusOut>", lambda _event, color_key=key: self._validate_color_entry(color_key))
+                entry.bind("<KeyRelease>", partial(self._schedule_color_validation, key))
+                entry.bind("<FocusOut>", partial(self._validate_color_entry, key))
                 self._entry_border_colors[key] = entry.cget("border_color")
 
                 swatch = ctk.CTkFrame(scroll, width=28, height=24, corner_radius=4)
                 swatch.grid(row=row_index, column=2, sticky="w", padx=6, pady=(6, 2))
                 swatch.grid_propagate(False)
-                swatch.bind("<Button-1>", lambda _event, color_key=key: self._pick_color(color_key))
+                swatch.bind("<Button-1>", partial(self._pick_color, key))
 
                 pick_btn = ctk.CTkButton(
                     scroll,
                     text="...",
                     width=40,
-                    command=lambda color_key=key: self._pick_color(color_key),
+                    command=partial(self._pick_color, key),
                 )
                 pick_btn.grid(row=row_index, column=3, sticky="w", padx=6, pady=(6, 2))
                 reset_btn = ctk.CTkButton(
                     scroll,
                     text="Reset",
                     width=60,
-                    command=lambda color_key=key: self._reset_color(color_key),
+                    command=partial(self._reset_color, key),
                 )
                 reset_btn.grid(row=row_index, column=4, sticky="w", padx=6, pady=(6, 2))
                 copy_btn = ctk.CTkButton(
                     scroll,
                     text="Copy",
                     width=60,
-                    command=lambda color_key=key: self._copy_color(color_key),
+                    command=partial(self._copy_color, key),
                 )
                 copy_btn.grid(row=row_index, column=5, sticky="w", padx=6, pady=(6, 2))
 
                 error_label = ctk.CTkLabel(scroll, text="", text_color="red")
                 error_label.grid(row=row_index + 1, column=1, columnspan=5, sticky="w", padx=6, pady=(0, 4))
 
-                self._color_vars[key] = var
                 self._color_entries[key] = entry
                 self._color_swatches[key] = swatch
                 self._color_error_labels[key] = error_label
@@ -316,16 +333,14 @@ class SettingsDialog(ctk.CTkToplevel):
 
     def _build_fonts_panel(self, parent: ctk.CTkFrame) -> None:
         panel = ctk.CTkFrame(parent)
-        panel.pack(fill="both", expand=True)
         self._panels["Шрифти"] = panel
 
         scroll = ctk.CTkScrollableFrame(panel)
         scroll.pack(fill="both", expand=True, padx=12, pady=12)
         self._fonts_scroll = scroll
-        self._bind_scrollwheel(scroll)
 
         ctk.CTkLabel(scroll, text="Family:").pack(anchor="w", padx=12, pady=(12, 4))
-        families = sorted(set(tkfont.families(self)))
+        families = list(font_families(self))
         self._font_family_var = tk.StringVar()
         family_combo = ttk.Combobox(scroll, values=families, textvariable=self._font_family_var)
         family_combo.pack(fill="x", padx=12, pady=(0, 8))
@@ -341,49 +356,44 @@ class SettingsDialog(ctk.CTkToplevel):
         heading_entry.pack(fill="x", padx=12, pady=(0, 8))
 
     def _select_category(self, name: str) -> None:
-        for panel_name, panel in self._panels.items():
-            if panel_name == name:
-                panel.pack(fill="both", expand=True)
-            else:
-                panel.pack_forget()
+        if name == self._current_panel:
+            return
+        builder = self._panel_builders.get(name)
+        if builder is not None and name not in self._panels:
+            builder(self._panel_parent)
+        panel = self._panels.get(name)
+        if panel is None:
+            return
+        # Panels are packed only here, so at most one is visible.
+        if self._current_panel is not None:
+            self._panels[self._current_panel].pack_forget()
+        panel.pack(fill="both", expand=True)
+        self._current_panel = name
         if name in {"Кольори", "Шрифти"}:
             self._refresh_profile_fields()
-        if name == "Кольори" and self._colors_scroll:
-            try:
-                self._colors_scroll._parent_canvas.yview_moveto(0)
-            except Exception:
-                pass
-        if name == "Шрифти" and self._fonts_scroll:
+        scroll = {"Кольори": self._colors_scroll, "Шрифти": self._fonts_scroll}.get(name)
+        self._active_scroll_canvas = getattr(scroll, "_parent_canvas", None)
+        if self._active_scroll_canvas is not None:
             try:
-                self._fonts_scroll._parent_canvas.yview_moveto(0)
+                self._active_scroll_canvas.yview_moveto(0)
             except Exception:
                 pass
 
-    def _bind_scrollwheel(self, scroll: ctk.CTkScrollableFrame) -> None:
-        try:
-            canvas = scroll._parent_canvas
-        except Exception:
-            return
-
-        def _on_mousewheel(event: tk.Event) -> str:
-            if getattr(event, "delta", 0):
-                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            return "break"
-
-        def _on_button4(_event: tk.Event) -> str:
+    def _on_mousewheel(self, event: tk.Event) -> Optional[str]:
+        canvas = self._active_scroll_canvas
+        if canvas is None:
+            return None
+        # Only scroll for events over the visible panel's canvas or its children.
+        widget_path, canvas_path = str(event.widget), str(canvas)
+        if widget_path != canvas_path and not widget_path.startswith(canvas_path + "."):
+            return None
+        if event.num == 4:
             canvas.yview_scroll(-1, "units")
-            return "break"
-
-        def _on_button5(_event: tk.Event) -> str:
+        elif event.num == 5:
             canvas.yview_scroll(1, "units")
-            return "break"
-
-        try:
-            canvas.bind("<MouseWheel>", _on_mousewheel)
-            canvas.bind("<Button-4>", _on_button4)
-            canvas.bind("<Button-5>", _on_button5)
-        except Exception:
-            pass
+        elif getattr(event, "delta", 0):
+            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        return "break"
 
     def _on_category_select(self, _event: tk.Event) -> None:
         selection = self._category_list.curselection()
@@ -402,14 +412,22 @@ class SettingsDialog(ctk.CTkToplevel):
         theme = themes.setdefault(profile, {})
         colors = theme.setdefault("colors", {})
         fonts = theme.setdefault("fonts", {})
-        default_colors = self._default_settings["themes"][profile]["colors"]
-
-        for key, var in self._color_vars.items():
-            var.set(colors.get(key, default_colors.get(key, "")))
-
-        self._font_family_var.set(str(fonts.get("family", "")))
-        self._font_base_var.set(str(fonts.get("base_size", "")))
-        self._font_heading_var.set(str(fonts.get("heading_size", "")))
+        default_colors = self._default_palettes[profile]
+
+        for key in self._color_entries:
+            value = colors[key] if key in colors else default_colors.get(key, "")
+            self._set_color_entry(key, str(value))
+
+        # Writing a Tcl variable fires its traces even when the value is the same.
+        if self._font_family_var is not None:
+            for var, font_key in (
+                (self._font_family_var, "family"),
+                (self._font_base_var, "base_size"),
+                (self._font_heading_var, "heading_size"),
+            ):
+                value = str(fonts.get(font_key, ""))
+                if var.get() != value:
+                    var.set(value)
         self._validate_all_colors()
         self._apply_listbox_theme()
 
@@ -420,12 +438,13 @@ class SettingsDialog(ctk.CTkToplevel):
         colors = theme.setdefault("colors", {})
         fonts = theme.setdefault("fonts", {})
 
-        for key, var in self._color_vars.items():
-            colors[key] = var.get().strip()
+        for key, entry in self._color_entries.items():
+            colors[key] = entry.get().strip()
 
-        fonts["family"] = self._font_family_var.get().strip()
-        fonts["base_size"] = self._font_base_var.get().strip()
-        fonts["heading_size"] = self._font_heading_var.get().strip()
+        if self._font_family_var is not None:
+            fonts["family"] = self._font_family_var.get().strip()
+            fonts["base_size"] = self._font_base_var.get().strip()
+            fonts["heading_size"] = self._font_heading_var.get().strip()
 
     def _collect_common_fields(self) -> None:
         self._draft_settings["appearance_mode"] = self._appearance_var.get()
@@ -433,6 +452,7 @@ class SettingsDialog(ctk.CTkToplevel):
         self._draft_settings["export_folder"] = self._export_folder_var.get().strip()
 
     def _apply_internal(self) -> None:
+        self._flush_color_validations()
         if self._color_errors:
             return False
         try:
@@ -453,11 +473,25 @@ class SettingsDialog(ctk.CTkToplevel):
     def _on_cancel(self) -> None:
         self.destroy()
 
+    def destroy(self) -> None:
+        self._cancel_color_validations()
+        super().destroy()
+
     def _on_apply_click(self) -> None:
         self._apply_internal()
 
+    def _copy_default_settings(self) -> Dict[str, Any]:
+        # Defaults are two levels of flat dicts under "themes"; copying level by level
+        # skips deepcopy's memo bookkeeping.
+        defaults = self._default_settings
+        themes = {
+            profile: {section: dict(values) for section, values in theme.items()}
+            for profile, theme in defaults["themes"].items()
+        }
+        return {**defaults, "themes": themes}
+
     def _reset_all(self) -> None:
-        self._draft_settings = deepcopy(self._default_settings)
+        self._draft_settings = self._copy_default_settings()
         self._appearance_var.set(self._draft_settings.get("appearance_mode", "Dark"))
         self._profile_var.set(self._draft_settings.get("theme_profile", "dark"))
         self._export_folder_var.set(self._draft_settings.get("export_folder", ""))
@@ -473,46 +507,51 @@ class SettingsDialog(ctk.CTkToplevel):
         self._on_cancel()
 
     def _on_apply_shortcut(self, _event: tk.Event) -> str:
+        self._flush_color_validations()
         if not self._color_errors:
             self._on_apply_click()
         return "break"
 
     def _on_ok_shortcut(self, _event: tk.Event) -> str:
+        self._flush_color_validations()
         if not self._color_errors:
             self._on_ok()
         return "break"
 
     def _reset_color(self, key: str) -> None:
         profile = self._profile_var.get() or "dark"
-        default_color = self._default_settings["themes"][profile]["colors"].get(key, "")
-        self._color_vars[key].set(default_color)
+        default_color = self._default_palettes[profile].get(key, "")
+        self._set_color_entry(key, default_color)
         self._validate_color_entry(key)
 
     def _copy_color(self, key: str) -> None:
-        value = self._color_vars[key].get().strip()
+        value = self._color_entries[key].get().strip()
         normalized = normalize_hex_color(value)
         if not normalized:
             return
         self.clipboard_clear()
         self.clipboard_append(normalized)
 
-    def _pick_color(self, key: str) -> None:
-        current = normalize_hex_color(self._color_vars[key].get().strip())
+    def _pick_color(self, key: str, _event: Optional[tk.Event] = None) -> None:
+        current = normalize_hex_color(self._color_entries[key].get().strip())
         result = colorchooser.askcolor(parent=self, initialcolor=current or None)
         if not result or not result[1]:
             return
         normalized = normalize_hex_color(result[1])
         if not normalized:
             return
-        self._color_vars[key].set(normalized)
+        self._set_color_entry(key, normalized)
         self._validate_color_entry(key)
 
     def _copy_profile_colors(self, source: str, target: str) -> None:
         themes = self._draft_settings.setdefault("themes", {})
         source_colors = themes.get(source, {}).get("colors")
         if not isinstance(source_colors, dict):
-            source_colors = self._default_settings["themes"][source]["colors"]
-        themes.setdefault(target, {})["colors"] = deepcopy(source_colors)
+            source_colors = self._default_palettes[source]
+        target_theme = themes.setdefault(target, {})
+        if target_theme.get("colors") != source_colors:
+            target_theme["colors"] = dict(source_colors)
+        # Still refresh when the palettes already match: the entries may hold uncollected edits.
         if (self._profile_var.get() or "dark") == target:
             self._refresh_profile_fields()
 
@@ -520,43 +559,95 @@ class SettingsDialog(ctk.CTkToplevel):
         profile = self._profile_var.get() or "dark"
         themes = self._draft_settings.setdefault("themes", {})
         theme = themes.setdefault(profile, {})
-        theme["colors"] = deepcopy(self._default_settings["themes"][profile]["colors"])
+        theme["colors"] = dict(self._default_palettes[profile])
         self._refresh_profile_fields()
 
-    def _validate_color_entry(self, key: str) -> None:
-        value = self._color_vars[key].get().strip()
-        normalized = normalize_hex_color(value)
+    def _set_color_entry(self, key: str, value: str) -> None:
         entry = self._color_entries[key]
-        error_label = self._color_error_labels[key]
+        if entry.get() == value:
+            return
+        entry.delete(0, "end")
+        entry.insert(0, value)
+
+    def _schedule_color_validation(self, key: str, _event: Optional[tk.Event] = None) -> None:
+        """Validate ``key`` once typing pauses instead of on every keystroke."""
+        job = self._color_validation_jobs.pop(key, None)
+        if job is not None:
+            self.after_cancel(job)
+        self._color_validation_jobs[key] = self.after(80, partial(self._run_color_validation, key))
+
+    def _run_color_validation(self, key: str) -> None:
+        self._color_validation_jobs.pop(key, None)
+        self._validate_color_entry(key)
+
+    def _flush_color_validations(self) -> None:
+        for key in list(self._color_validation_jobs):
+            self._validate_color_entry(key)
+
+    def _cancel_color_validations(self) -> None:
+        jobs = getattr(self, "_color_validation_jobs", None)
+        if not jobs:
+            return
+        for job in jobs.values():
+            try:
+                self.after_cancel(job)
+            except Exception:
+                pass
+        jobs.clear()
+
+    def _validate_color_entry(
+        self, key: str, _event: Optional[tk.Event] = None, *, update_buttons: bool = True
+    ) -> None:
+        job = self._color_validation_jobs.pop(key, None)
+        if job is not None:
+            self.after_cancel(job)
+        value = self._color_entries[key].get().strip()
+        normalized = normalize_hex_color(value)
         if normalized:
             if value != normalized:
-                self._color_vars[key].set(normalized)
+                self._set_color_entry(key, normalized)
             self._color_errors.discard(key)
-            entry.configure(border_color=self._entry_border_colors[key])
-            error_label.configure(text="")
-            self._color_swatches[key].configure(fg_color=normalized)
         else:
             self._color_errors.add(key)
-            entry.configure(border_color="red")
-            error_label.configure(text="Очікується #RRGGBB")
-        self._update_action_buttons_state()
+        # Every configure redraws the CTk widget, so only touch entries whose result changed.
+        if key not in self._color_entry_states or self._color_entry_states[key] != normalized:
+            entry = self._color_entries[key]
+            error_label = self._color_error_labels[key]
+            if normalized:
+                entry.configure(border_color=self._entry_border_colors[key])
+                error_label.configure(text="")
+                self._color_swatches[key].configure(fg_color=normalized)
+            else:
+                entry.configure(border_color="red")
+                error_label.configure(text="Очікується #RRGGBB")
+            self._color_entry_states[key] = normalized
+        if update_buttons:
+            self._update_action_buttons_state()
 
     def _validate_all_colors(self) -> None:
         self._color_errors.clear()
-        for key in self._color_vars:
-            self._validate_color_entry(key)
+        for key in self._color_entries:
+            self._validate_color_entry(key, update_buttons=False)
+        self._update_action_buttons_state()
 
     def _update_action_buttons_state(self) -> None:
         state = "normal" if not self._color_errors else "disabled"
+        if state == self._action_buttons_state:
+            return
         self._ok_btn.configure(state=state)
         self._apply_btn.configure(state=state)
+        self._action_buttons_state = state
 
     def _apply_listbox_theme(self) -> None:
         profile = self._profile_var.get() or "dark"
         colors = self._draft_settings.get("themes", {}).get(profile, {}).get("colors", {})
-        default_colors = self._default_settings["themes"][profile]["colors"]
+        default_colors = self._default_palettes[profile]
         if not isinstance(colors, dict):
             colors = {}
+        # Category switches refresh the profile fields; skip re-normalizing an unchanged palette.
+        signature = (profile, tuple(colors.get(key) for key in _LISTBOX_COLOR_KEYS))
+        if signature == self._listbox_theme_signature:
+            return
         def _color(key: str, fallback_key: str | None = None) -> str:
             return (
                 normalize_hex_color(colors.get(key))
@@ -575,3 +666,5 @@ class SettingsDialog(ctk.CTkToplevel):
             )
         except Exception:
             logger.exception("Не вдалося застосувати тему до списку категорій в SettingsDialog")
+            return
+        self._listbox_theme_signature = signature
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Tuple
 import logging
+import weakref
 
 import tkinter as tk
 import tkinter.font as tkfont
@@ -11,6 +12,18 @@ import customtkinter as ctk
 
 logger = logging.getLogger(__name__)
 
+_FONT_FAMILIES_CACHE: Dict[int, Tuple[str, ...]] = {}
+
+
+def font_families(widget: tk.Misc) -> Tuple[str, ...]:
+    """Return the sorted system font families, enumerated once per Tcl interpreter."""
+    key = id(widget.tk)
+    families = _FONT_FAMILIES_CACHE.get(key)
+    if families is None:
+        families = tuple(sorted(set(tkfont.families(widget))))
+        _FONT_FAMILIES_CACHE[key] = families
+    return families
+
 
 class ThemeManager:
     def __init__(self, root: ctk.CTk) -> None:
@@ -20,18 +33,27 @@ class ThemeManager:
         self.fonts: Dict[str, Any] = {}
         self.base_font: ctk.CTkFont | None = None
         self.heading_font: ctk.CTkFont | None = None
+        self._font_family_set: frozenset[str] | None = None
+        self._role_kwargs: Dict[str, Dict[str, Any]] = {}
+        # (family, base_size, heading_size) -> (base_font, heading_font), so switching back
+        # to an earlier theme reuses its Tk fonts.
+        self._font_cache: Dict[Tuple[str, int, int], Tuple[ctk.CTkFont, ctk.CTkFont]] = {}
+        # Last kwargs configured per widget; CTk redraws on every configure, even a no-op one.
+        self._last_applied: "weakref.WeakKeyDictionary[tk.Widget, Dict[str, Any]]" = weakref.WeakKeyDictionary()
 
     def register(self, widget: tk.Widget, role: str) -> None:
         self.widgets.append((widget, role))
 
     def _resolve_font_family(self, family: str) -> str:
         try:
-            families = set(tkfont.families(self.root))
+            families = font_families(self.root)
         except Exception:
-            families = set()
-        if family in families:
+            families = ()
+        if self._font_family_set is None and families:
+            self._font_family_set = frozenset(families)
+        if family in (self._font_family_set or ()):
             return family
-        return next(iter(families), family)
+        return families[0] if families else family
 
     def apply(self, settings: Dict[str, Any], *, apply_widgets: bool = True) -> None:
         appearance = settings.get("appearance_mode", "Dark")
@@ -45,8 +67,17 @@ class ThemeManager:
         family = self._resolve_font_family(str(self.fonts.get("family", "Segoe UI")))
         base_size = int(self.fonts.get("base_size", 12))
         heading_size = int(self.fonts.get("heading_size", 14))
-        self.base_font = ctk.CTkFont(family=family, size=base_size)
-        self.heading_font = ctk.CTkFont(family=family, size=heading_size, weight="bold")
+        font_spec = (family, base_size, heading_size)
+        # Reused font objects keep unchanged role kwargs equal, so their configure is skipped.
+        fonts = self._font_cache.get(font_spec)
+        if fonts is None:
+            fonts = (
+                ctk.CTkFont(family=family, size=base_size),
+                ctk.CTkFont(family=family, size=heading_size, weight="bold"),
+            )
+            self._font_cache[font_spec] = fonts
+        self.base_font, self.heading_font = fonts
+        self._role_kwargs = self._build_role_kwargs()
 
         if not apply_widgets:
             return
@@ -54,56 +85,62 @@ class ThemeManager:
         for widget, role in self.widgets:
             self._apply_widget(widget, role)
 
-    def _apply_widget(self, widget: tk.Widget, role: str) -> None:
+    def _build_role_kwargs(self) -> Dict[str, Dict[str, Any]]:
+        """Resolve the configure kwargs for every role once per ``apply``."""
         colors = self.colors
-        base_font = self.base_font
-        heading_font = self.heading_font
-
-        def safe_configure(**kwargs: Any) -> None:
-            try:
-                widget.configure(**kwargs)
-            except Exception:
-                logger.exception("Не вдалося застосувати тему до %s (%s)", widget, role)
-
-        if role == "background":
-            safe_configure(fg_color=colors.get("background"))
-        elif role == "surface":
-            safe_configure(fg_color=colors.get("surface"))
-        elif role == "widget":
-            safe_configure(
-                fg_color=colors.get("widget_fg"),
-                text_color=colors.get("text"),
-                border_color=colors.get("border"),
-            )
-        elif role == "label":
-            safe_configure(text_color=colors.get("text"))
-        elif role == "menu_button":
-            safe_configure(
-                fg_color="transparent",
-                hover_color=colors.get("widget_fg"),
-                text_color=colors.get("text"),
-                border_color=colors.get("border"),
-            )
-        elif role == "accent_button":
-            safe_configure(
-                fg_color=colors.get("accent"),
-                hover_color=colors.get("accent"),
-                text_color="#ffffff",
-            )
-        elif role == "danger_button":
-            safe_configure(
-                fg_color=colors.get("danger"),
-                hover_color=colors.get("danger"),
-                text_color="#ffffff",
-            )
-        elif role == "tabview":
-            safe_configure(
-                fg_color=colors.get("background"),
-                segmented_button_fg_color=colors.get("surface"),
-                segmented_button_selected_color=colors.get("accent"),
-            )
+        role_kwargs: Dict[str, Dict[str, Any]] = {
+            "background": {"fg_color": colors.get("background")},
+            "surface": {"fg_color": colors.get("surface")},
+            "widget": {
+                "fg_color": colors.get("widget_fg"),
+                "text_color": colors.get("text"),
+                "border_color": colors.get("border"),
+            },
+            "label": {"text_color": colors.get("text")},
+            "menu_button": {
+                "fg_color": "transparent",
+                "hover_color": colors.get("widget_fg"),
+                "text_color": colors.get("text"),
+                "border_color": colors.get("border"),
+            },
+            "accent_button": {
+                "fg_color": colors.get("accent"),
+                "hover_color": colors.get("accent"),
+                "text_color": "#ffffff",
+            },
+            "danger_button": {
+                "fg_color": colors.get("danger"),
+                "hover_color": colors.get("danger"),
+                "text_color": "#ffffff",
+            },
+            "tabview": {
+                "fg_color": colors.get("background"),
+                "segmented_button_fg_color": colors.get("surface"),
+                "segmented_button_selected_color": colors.get("accent"),
+            },
+        }
+        if self.base_font:
+            for role in ("widget", "label", "menu_button", "accent_button", "danger_button"):
+                role_kwargs[role]["font"] = self.base_font
+        if self.heading_font:
+            role_kwargs["heading_label"] = {"font": self.heading_font}
+        return role_kwargs
 
-        if base_font and role in {"widget", "label", "menu_button", "accent_button", "danger_button"}:
-            safe_configure(font=base_font)
-        if heading_font and role == "heading_label":
-            safe_configure(font=heading_font)
+    def _apply_widget(self, widget: tk.Widget, role: str) -> None:
+        kwargs = self._role_kwargs.get(role)
+        if not kwargs:
+            return
+        try:
+            if self._last_applied.get(widget) == kwargs:
+                return
+        except TypeError:
+            pass
+        try:
+            widget.configure(**kwargs)
+        except Exception:
+            logger.exception("Не вдалося застосувати тему до %s (%s)", widget, role)
+            return
+        try:
+            self._last_applied[widget] = kwargs
+        except TypeError:
+            pass